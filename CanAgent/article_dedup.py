@@ -0,0 +1,195 @@
+"""
+Article Deduplication
+
+This module merges research article entries that describe the same paper,
+such as an arXiv preprint and its Semantic Scholar record, or two versions
+of one preprint. Entries are keyed by arXiv id (without version), DOI and
+normalised title, and any shared key joins them, so a batch is deduplicated
+in one pass over its entries.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+ARXIV_URL_ID = re.compile(
+    r"arxiv\.org/(?:abs|pdf)/((?:\d{4}\.\d{4,5})|(?:[a-z\-]+(?:\.[a-z]{2})?/\d{7}))(?:v\d+)?", re.IGNORECASE
+)
+ARXIV_ID = re.compile(
+    r"^(?:arxiv:)?((?:\d{4}\.\d{4,5})|(?:[a-z\-]+(?:\.[a-z]{2})?/\d{7}))(?:v\d+)?$", re.IGNORECASE
+)
+DOI = re.compile(r"10\.\d{4,9}/\S+", re.IGNORECASE)
+ARXIV_DOI = re.compile(r"^10\.48550/arxiv\.(.+)$")
+
+
+class ArticleDeduplicator:
+    """
+    Indexes, matches and merges duplicate research article entries.
+    """
+
+    def normalize_title(self, title: str) -> str:
+        """
+        Normalise a title for comparison.
+
+        Accents, case, punctuation and repeated whitespace are removed.
+
+        Args:
+            title: Article title
+
+        Returns:
+            Normalised title ("" if nothing is left)
+        """
+        text = unicodedata.normalize("NFKD", title or "")
+        text = "".join(char for char in text if not unicodedata.combining(char)).lower()
+        return " ".join(NON_ALPHANUMERIC.sub(" ", text).split())
+
+    def arxiv_id(self, article: Dict) -> Optional[str]:
+        """
+        Get an article's arXiv identifier without its version suffix.
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            Lowercase identifier such as "2401.01234", or None
+        """
+        match = ARXIV_ID.match((article.get("arxiv_id") or "").strip())
+        if match:
+            return match.group(1).lower()
+
+        match = ARXIV_URL_ID.search(article.get("url") or "")
+        if match:
+            return match.group(1).lower()
+
+        # arXiv registers DOIs of the form 10.48550/arXiv.<id>
+        match = ARXIV_DOI.match(self.doi(article) or "")
+        if match:
+            match = ARXIV_ID.match(match.group(1))
+            if match:
+                return match.group(1).lower()
+
+        return None
+
+    def doi(self, article: Dict) -> Optional[str]:
+        """
+        Get an article's DOI, from its doi field or a doi.org URL.
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            Lowercase DOI without resolver prefix, or None
+        """
+        url = article.get("url") or ""
+        for value in (article.get("doi") or "", url if "doi.org/" in url else ""):
+            match = DOI.search(value)
+            if match:
+                return match.group(0).rstrip(".,;").lower()
+        return None
+
+    def keys(self, article: Dict) -> Set[Tuple[str, str]]:
+        """
+        Get the identifying keys of an article.
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            Set of (kind, value) keys; sharing any one means the same paper
+        """
+        keys = set()
+
+        arxiv_id = self.arxiv_id(article)
+        if arxiv_id:
+            keys.add(("arxiv", arxiv_id))
+
+        doi = self.doi(article)
+        if doi:
+            keys.add(("doi", doi))
+
+        title = self.normalize_title(article.get("title"))
+        if title:
+            keys.add(("title", title))
+
+        return keys
+
+    def deduplicate(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Merge article entries that describe the same paper.
+
+        Entries without a title are dropped.
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            One merged article per paper, in order of first appearance
+        """
+        articles = [article for article in articles if article.get("title")]
+
+        parent = list(range(len(articles)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # key -> first entry seen with it; later entries sharing a key join its set
+        index = {}
+        for i, article in enumerate(articles):
+            for key in self.keys(article):
+                if key in index:
+                    parent[find(i)] = find(index[key])
+                else:
+                    index[key] = i
+
+        clusters = defaultdict(list)
+        for i in range(len(articles)):
+            clusters[find(i)].append(i)
+
+        first_seen = sorted(clusters.values(), key=lambda members: members[0])
+        return [self.merge([articles[i] for i in members]) for members in first_seen]
+
+    def merge(self, duplicates: List[Dict]) -> Dict:
+        """
+        Merge entries for one paper, keeping the most complete fields.
+
+        Args:
+            duplicates: Article dictionaries describing the same paper
+
+        Returns:
+            Merged article dictionary
+        """
+        if len(duplicates) == 1:
+            return duplicates[0]
+
+        def completeness(article):
+            # An abstract outweighs any number of other fields
+            has_summary = article.get("summary") not in (None, "")
+            return has_summary, sum(1 for value in article.values() if value not in (None, "", []))
+
+        # Most complete entry first; ties keep input order
+        ranked = sorted(duplicates, key=completeness, reverse=True)
+        merged = dict(ranked[0])
+
+        for article in ranked[1:]:
+            for key, value in article.items():
+                if merged.get(key) in (None, "", []) and value not in (None, "", []):
+                    merged[key] = value
+
+        # Longer author lists are more complete than truncated ones
+        authors = max((article.get("authors") or [] for article in ranked), key=len)
+        if authors:
+            merged["authors"] = authors
+
+        topics = []
+        for article in duplicates:
+            for topic in article.get("topics") or []:
+                if topic not in topics:
+                    topics.append(topic)
+        merged["topics"] = topics
+
+        return merged
@@ -0,0 +1,183 @@
+"""
+Benchmark: whole-document vs. streaming parsing of arXiv API responses
+
+This script parses a saved arXiv Atom response by building the whole
+document tree and collecting its entries (with BeautifulSoup's xml builder,
+the old behaviour, when lxml is installed, and with ElementTree), and with
+ResearchArticleParser's streaming parser, which reads the body incrementally
+and drops each entry after yielding it. Each mode runs in a fresh process and
+its peak memory is traced with tracemalloc from after the response is
+loaded, so the fixture's own copies are not counted; the fixture's entries
+can be repeated to simulate larger pages.
+
+Usage:
+    python benchmark_arxiv_parsing.py [--repeat 20] [--scale 1]
+"""
+
+import argparse
+import io
+import multiprocessing
+import os
+import statistics
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Tuple
+from xml.etree import ElementTree
+
+from research_article_parser import ARXIV_NS, ATOM_NS, ResearchArticleParser
+
+# The fixture is the response to a query for all:game AND all:AI. arXiv
+# matched "AI" outside the titles and abstracts, so no article is relevant to
+# "game AI": a topic word missing from every candidate is not ignored
+SAMPLE_TOPICS = ["game AI", "level design", "reinforcement learning"]
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "arxiv_query.xml")
+
+
+def scaled_feed(scale: int) -> bytes:
+    """Get the fixture with its entries repeated scale times."""
+    with open(FIXTURE, "rb") as f:
+        data = f.read()
+
+    if scale <= 1:
+        return data
+
+    start = data.index(b"<entry>")
+    end = data.rindex(b"</entry>") + len(b"</entry>")
+    return data[:start] + data[start:end] * scale + data[end:]
+
+
+def parse_tree(data: bytes) -> List[Dict]:
+    """Parse a response by building the whole document tree first."""
+    parser = ResearchArticleParser(None)
+    root = ElementTree.fromstring(data)
+
+    entries = []
+    for entry in root.findall(ATOM_NS + "entry"):
+        entries.append({
+            "title": (entry.findtext(ATOM_NS + "title") or "").strip(),
+            "url": (entry.findtext(ATOM_NS + "id") or "").strip(),
+            "publication_date": parser._parse_date((entry.findtext(ATOM_NS + "published") or "").strip()),
+            "summary": (entry.findtext(ATOM_NS + "summary") or "").strip(),
+            "doi": (entry.findtext(ARXIV_NS + "doi") or "").strip() or None,
+            "authors": [name.text.strip() for name in entry.iterfind(f"{ATOM_NS}author/{ATOM_NS}name")
+                        if name.text]
+        })
+    return entries
+
+
+def parse_soup(data: bytes) -> List[Dict]:
+    """Parse a response the old way, with BeautifulSoup's lxml-backed xml builder."""
+    from bs4 import BeautifulSoup
+
+    parser = ResearchArticleParser(None)
+    soup = BeautifulSoup(data, "xml")
+
+    entries = []
+    for entry in soup.find_all("entry"):
+        published = entry.find("published")
+        entries.append({
+            "title": entry.find("title").text.strip() if entry.find("title") else "",
+            "url": entry.find("id").text.strip() if entry.find("id") else "",
+            "publication_date": parser._parse_date(published.text.strip() if published else ""),
+            "summary": entry.find("summary").text.strip() if entry.find("summary") else "",
+            "doi": entry.find("doi").text.strip() if entry.find("doi") else None,
+            "authors": [author.find("name").text.strip() for author in entry.find_all("author")
+                        if author.find("name")]
+        })
+    return entries
+
+
+def parse_streaming(data: bytes) -> List[Dict]:
+    """Parse a response with the streaming parser, keeping only the entries."""
+    return list(ResearchArticleParser(None)._iter_arxiv_feed(io.BytesIO(data), {}))
+
+
+def available_modes() -> List[Tuple[str, Callable[[bytes], List[Dict]]]]:
+    """Get the parse modes that can run here."""
+    modes = [("tree", parse_tree), ("streaming", parse_streaming)]
+    try:
+        import lxml  # noqa: F401
+        modes.insert(0, ("soup", parse_soup))
+    except ImportError:
+        pass
+    return modes
+
+
+def run_mode(mode: str, scale: int, repeat: int) -> Dict:
+    """
+    Parse the feed in one mode; runs in a fresh worker process.
+
+    Args:
+        mode: Name of the parse mode
+        scale: Number of times the fixture's entries are repeated
+        repeat: Number of timed runs
+
+    Returns:
+        Records, timings and the peak memory allocated by one parse
+    """
+    parse = dict(available_modes())[mode]
+    data = scaled_feed(scale)
+
+    # Traced from after loading, so only the parse's own allocations count
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    records = parse(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Articles kept per sample topic after timeframe filtering and relevance scoring
+    parser = ResearchArticleParser(None)
+    candidates = [parser._make_arxiv_article(entry, SAMPLE_TOPICS, "this_year") for entry in records]
+    ranking = parser.relevance.rank([candidate for candidate in candidates if candidate], SAMPLE_TOPICS)
+    articles = {topic: len(indexes) for topic, indexes in ranking.items()}
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(data)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "records": records,
+        "articles": articles,
+        "bytes": len(data),
+        "timings": timings,
+        "peak_kb": (peak - before) // 1024
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per mode")
+    parser.add_argument("--scale", type=int, default=1, help="times the fixture's entries are repeated")
+    args = parser.parse_args()
+
+    print(f"\narXiv response ({len(scaled_feed(args.scale)) / 1024:.0f} KB)")
+    print(f"  {'mode':<12}{'entries':>9}{'mean ms':>10}{'entries/s':>11}"
+          f"{'MB/s':>8}{'peak KB':>10}")
+
+    baseline = None
+    for mode, _ in available_modes():
+        # A fresh process per mode keeps one mode's caches and imports out of the other's peak
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            result = executor.submit(run_mode, mode, args.scale, args.repeat).result()
+
+        if baseline is None:
+            baseline = result
+        elif result["records"] != baseline["records"]:
+            raise SystemExit(f"{mode} extracted different records")
+
+        mean = statistics.mean(result["timings"])
+        entries = len(result["records"])
+        print(f"  {mode:<12}{entries:>9}{mean * 1000:>10.2f}"
+              f"{entries / mean:>11.0f}{result['bytes'] / mean / 1e6:>8.1f}{result['peak_kb']:>10}")
+
+    print(f"  every mode extracted the same {len(baseline['records'])} records")
+    for topic, count in baseline["articles"].items():
+        print(f"  {count} relevant to {topic!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark: full-document vs. targeted parsing of conference search pages
+
+This script parses saved WikiCFP and Conference Alerts result pages with the
+ConferenceTracker parsers, once building the whole document tree (the old
+behaviour) and once building only the result subtree, for every available
+BeautifulSoup backend. It reports parse time and peak memory per page.
+
+Usage:
+    python benchmark_html_parsing.py [--repeat 20]
+"""
+
+import argparse
+import os
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from conference_tracker import ConferenceTracker
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+PAGES = [
+    ("WikiCFP", "wikicfp_search.html", "_parse_wikicfp"),
+    ("Conference Alerts", "conferencealerts_search.html", "_parse_conferencealerts")
+]
+
+
+def available_parsers() -> List[str]:
+    """Get the BeautifulSoup tree builders installed here."""
+    parsers = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        parsers.append("lxml")
+    except ImportError:
+        pass
+    return parsers
+
+
+def measure(parse: Callable[[], List[Dict]], repeat: int) -> Dict:
+    """
+    Time a parse function and record its peak traced memory.
+
+    Args:
+        parse: Function that parses one page
+        repeat: Number of timed runs
+
+    Returns:
+        Timing and memory statistics
+    """
+    # Memory is traced on a separate run so tracing overhead doesn't skew timings
+    tracemalloc.start()
+    records = parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "records": records,
+        "mean_ms": statistics.mean(timings) * 1000,
+        "min_ms": min(timings) * 1000,
+        "peak_kb": peak / 1024
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per configuration")
+    args = parser.parse_args()
+
+    for label, filename, method in PAGES:
+        with open(os.path.join(FIXTURES_DIR, filename), encoding="utf-8") as f:
+            html = f.read()
+
+        print(f"\n{label} ({len(html) / 1024:.0f} KB)")
+        print(f"  {'mode':<24}{'records':>9}{'mean ms':>10}{'min ms':>10}{'peak KB':>10}")
+
+        baseline = None
+        for html_parser in available_parsers():
+            for targeted in (False, True):
+                tracker = ConferenceTracker(None, html_parser=html_parser, targeted_parsing=targeted)
+                parse = getattr(tracker, method)
+                result = measure(lambda: parse(html, "AI", "all"), args.repeat)
+
+                if baseline is None:
+                    baseline = result
+                elif result["records"] != baseline["records"]:
+                    raise SystemExit(f"{label}: {html_parser} targeted={targeted} extracted different records")
+
+                mode = f"{html_parser} {'targeted' if targeted else 'full'}"
+                print(f"  {mode:<24}{len(result['records']):>9}{result['mean_ms']:>10.2f}"
+                      f"{result['min_ms']:>10.2f}{result['peak_kb']:>10.0f}")
+
+        print(f"  baseline is html.parser full; every mode extracted the same {len(baseline['records'])} records")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: pooled keep-alive session vs. per-call connections
+
+This script compares NotionAPI latency when every call opens a new connection
+(the old module-level requests.get/post behaviour) against the pooled
+keep-alive session, using the local fake Notion server.
+
+Usage:
+    python benchmark_notion_session.py [--items 1000] [--reads 100] [--handshake-ms 20]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Dict, List
+
+from fake_notion_server import FakeNotionServer
+from notion_integration import NotionAPI, NotionHelper
+from rate_limiter import TokenBucketRateLimiter
+
+# The fake server has no rate limit, so don't let pacing dominate the timings
+UNTHROTTLED = TokenBucketRateLimiter(rate=1e6, burst=1000)
+
+
+class PerCallNotionAPI(NotionAPI):
+    """NotionAPI that drops its connections before every call, like requests.get()."""
+
+    def _make_request(self, method, endpoint, data=None, idempotent=None):
+        self.session.close()
+        return super()._make_request(method, endpoint, data, idempotent=idempotent)
+
+
+class TimedNotionAPI:
+    """Wraps a NotionAPI and records the latency of each request."""
+
+    def __init__(self, api: NotionAPI):
+        self.api = api
+        self.latencies = []
+        original = api._make_request
+
+        def timed(method, endpoint, data=None, idempotent=None):
+            start = time.perf_counter()
+            try:
+                return original(method, endpoint, data, idempotent=idempotent)
+            finally:
+                self.latencies.append(time.perf_counter() - start)
+
+        api._make_request = timed
+
+
+def run_workload(api: NotionAPI, reads: int) -> Dict:
+    """
+    Run a representative agent workload: paginate a database, then read pages.
+
+    Args:
+        api: NotionAPI instance to exercise
+        reads: Number of individual read_page calls
+
+    Returns:
+        Timing statistics
+    """
+    timer = TimedNotionAPI(api)
+    helper = NotionHelper(api)
+
+    start = time.perf_counter()
+    items = helper.get_all_database_items("bench-db")
+    for item in items[:reads]:
+        api.read_page(item["id"])
+    total = time.perf_counter() - start
+
+    latencies = sorted(timer.latencies)
+    return {
+        "calls": len(latencies),
+        "items": len(items),
+        "total_s": total,
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000
+    }
+
+
+def print_result(label: str, result: Dict, connections: int):
+    print(f"{label:<12} calls={result['calls']:<5} total={result['total_s']:.3f}s "
+          f"mean={result['mean_ms']:.2f}ms p50={result['p50_ms']:.2f}ms "
+          f"p95={result['p95_ms']:.2f}ms connections={connections}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000, help="Items in the fake database")
+    parser.add_argument("--reads", type=int, default=100, help="read_page calls after pagination")
+    parser.add_argument("--handshake-ms", type=float, default=20.0,
+                        help="Simulated TCP+TLS handshake cost per new connection")
+    args = parser.parse_args()
+
+    with FakeNotionServer(total_items=args.items, handshake_delay=args.handshake_ms / 1000) as server:
+        results: List = []
+
+        server.reset_stats()
+        with PerCallNotionAPI("bench-token", base_url=server.base_url,
+                              rate_limiter=UNTHROTTLED) as api:
+            results.append(("per-call", run_workload(api, args.reads), server.connections))
+
+        server.reset_stats()
+        with NotionAPI("bench-token", base_url=server.base_url, rate_limiter=UNTHROTTLED) as api:
+            results.append(("pooled", run_workload(api, args.reads), server.connections))
+
+    for label, result, connections in results:
+        print_result(label, result, connections)
+
+    speedup = results[0][1]["total_s"] / results[1][1]["total_s"]
+    print(f"Pooled session speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+Conference Deduplication
+
+This module merges scraped conference entries that describe the same event,
+even when sources name it differently ("ICML 2026" vs. "International
+Conference on Machine Learning"). Entries are blocked by start year and
+month, and candidates within a block are found through acronym and
+prefix-filtered token indexes, so large batches are never compared pairwise.
+"""
+
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+ORDINAL = re.compile(r"\d+(st|nd|rd|th)")
+WORD = re.compile(r"[A-Za-z][A-Za-z0-9\-]*")
+LETTERS = re.compile(r"[A-Za-z]+")
+PARENTHESISED = re.compile(r"\(\s*([A-Za-z][A-Za-z0-9\-]*)\s*\)")
+TRAILING_DIGITS = re.compile(r"\d+$")
+START_MONTH = re.compile(r"(\d{4})-(\d{2})")
+YEAR = re.compile(r"\b(19|20)\d{2}\b")
+
+
+class ConferenceDeduplicator:
+    """
+    Blocks, matches and merges duplicate conference entries.
+    """
+
+    # Words that don't identify an event and are dropped before matching
+    GENERIC_WORDS = {
+        "the", "of", "on", "and", "for", "in", "at", "to", "a", "an",
+        "international", "annual", "conference", "conf", "proceedings",
+        "ieee", "acm", "th", "st", "nd", "rd"
+    }
+
+    # Words skipped when deriving an acronym from a full name
+    ACRONYM_SKIP_WORDS = {"the", "of", "on", "and", "for", "in", "at", "to", "a", "an"}
+
+    # Capitalised tokens that are organisations, places or subjects, not event acronyms
+    NON_EVENT_ACRONYMS = {"IEEE", "ACM", "IFIP", "SIAM", "USA", "CFP", "NLP", "HCI", "IOT", "AGI"}
+
+    # Co-located events share the host's acronym but are separate entries
+    EVENT_KINDS = {"workshop", "symposium", "tutorial", "doctoral", "school", "summit"}
+
+    def __init__(self, similarity_threshold: float = 0.75):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            similarity_threshold: Minimum Jaccard similarity of normalised name
+                tokens for two entries in the same block to be merged
+        """
+        self.similarity_threshold = similarity_threshold
+
+    def normalize_tokens(self, name: str) -> List[str]:
+        """
+        Normalise a conference name into identifying tokens.
+
+        Accents, punctuation, years, ordinals and generic words are removed.
+
+        Args:
+            name: Conference name
+
+        Returns:
+            List of lowercase tokens
+        """
+        text = unicodedata.normalize("NFKD", name or "")
+        text = "".join(char for char in text if not unicodedata.combining(char)).lower()
+        text = NON_ALPHANUMERIC.sub(" ", text)
+
+        tokens = []
+        for token in text.split():
+            if token in self.GENERIC_WORDS or token.isdigit():
+                continue
+            if ORDINAL.fullmatch(token):
+                continue
+            tokens.append(token)
+        return tokens
+
+    def explicit_acronyms(self, name: str) -> Set[str]:
+        """
+        Get acronyms written in a conference name, such as ICML or NeurIPS.
+
+        In a name written mostly in capitals, all-caps words are ordinary
+        words, so only mixed-case and parenthesised acronyms such as NeurIPS
+        or "(ICRA)" are taken from it.
+
+        Args:
+            name: Conference name
+
+        Returns:
+            Set of uppercase acronyms
+        """
+        words = WORD.findall(name or "")
+        shouted = len(words) > 3 and sum(1 for word in words if word.isupper()) > len(words) / 2
+        parenthesised = set(PARENTHESISED.findall(name or ""))
+
+        acronyms = set()
+        for word in words:
+            if shouted and word.isupper() and word not in parenthesised:
+                continue
+            # "AAAI-26" and "ICML2026" name the same series as "AAAI" and "ICML"
+            word = TRAILING_DIGITS.sub("", word.replace("-", ""))
+            if word.lower() in self.GENERIC_WORDS or word.lower() in self.ACRONYM_SKIP_WORDS:
+                continue
+            uppercase = sum(1 for char in word if char.isupper())
+            if 3 <= len(word) <= 10 and uppercase >= 2 and uppercase >= len(word) / 3:
+                acronym = word.upper()
+                if acronym not in self.NON_EVENT_ACRONYMS:
+                    acronyms.add(acronym)
+        return acronyms
+
+    def derived_acronym(self, name: str) -> Optional[str]:
+        """
+        Build an acronym from the initials of a full conference name.
+
+        "International Conference on Machine Learning" gives "ICML".
+
+        Args:
+            name: Conference name
+
+        Returns:
+            Uppercase acronym, or None if the name is too short to derive one
+        """
+        words = [word for word in LETTERS.findall(name or "")
+                 if word.lower() not in self.ACRONYM_SKIP_WORDS and word.lower() not in ("st", "nd", "rd", "th")]
+        if len(words) < 3:
+            return None
+        return "".join(word[0] for word in words).upper()
+
+    def _block(self, conference: Dict) -> Tuple[Optional[int], Optional[int]]:
+        """Get the (year, month) block of a conference; parts are None when unknown."""
+        start_date = conference.get("start_date") or ""
+        match = START_MONTH.match(start_date)
+        if match:
+            return int(match.group(1)), int(match.group(2))
+
+        match = YEAR.search(conference.get("name") or "")
+        if match:
+            return int(match.group(0)), None
+
+        return None, None
+
+    def _neighbour_blocks(self, block: Tuple[Optional[int], Optional[int]]) -> List[Tuple]:
+        """Blocks whose entries may describe the same event as an entry in block."""
+        year, month = block
+        if year is None:
+            return [block]
+
+        if month is None:
+            # Only the year is known, so any month of that year may match
+            return [(year, None)] + [(year, m) for m in range(1, 13)]
+
+        # Sources disagree by a few days, which can cross a month boundary
+        blocks = [(year, None)]
+        for offset in (-1, 0, 1):
+            index = year * 12 + (month - 1) + offset
+            blocks.append((index // 12, index % 12 + 1))
+        return blocks
+
+    def _prefix_length(self, size: int) -> int:
+        """Number of rarest tokens that two sets above the threshold must share one of."""
+        if size == 0:
+            return 0
+        return size - math.ceil(self.similarity_threshold * size) + 1
+
+    def _is_match(self, first: Dict, second: Dict) -> bool:
+        """Decide whether two prepared entries describe the same event."""
+        if first["tokens"] & self.EVENT_KINDS != second["tokens"] & self.EVENT_KINDS:
+            return False
+
+        if first["explicit"] & (second["explicit"] | second["derived"]):
+            return True
+        if second["explicit"] & first["derived"]:
+            return True
+
+        tokens1, tokens2 = first["tokens"], second["tokens"]
+        if not tokens1 or not tokens2:
+            return False
+        return len(tokens1 & tokens2) / len(tokens1 | tokens2) >= self.similarity_threshold
+
+    def deduplicate(self, conferences: List[Dict]) -> List[Dict]:
+        """
+        Merge conference entries that describe the same event.
+
+        Args:
+            conferences: List of conference dictionaries
+
+        Returns:
+            One merged conference per event, in order of first appearance
+        """
+        prepared = []
+        for conf in conferences:
+            name = conf.get("name") or ""
+            derived = self.derived_acronym(name)
+            prepared.append({
+                "tokens": set(self.normalize_tokens(name)),
+                "explicit": self.explicit_acronyms(name),
+                "derived": {derived} if derived else set(),
+                "block": self._block(conf)
+            })
+
+        # Rarest tokens first, so prefix filtering probes short posting lists
+        frequency = Counter(token for entry in prepared for token in entry["tokens"])
+
+        parent = list(range(len(prepared)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # block -> acronym/token -> entries; derived acronyms only ever match explicit ones
+        explicit_index = defaultdict(lambda: defaultdict(list))
+        derived_index = defaultdict(lambda: defaultdict(list))
+        token_index = defaultdict(lambda: defaultdict(list))
+
+        # Entries with identical names and blocks (the same listing found for
+        # several topics) are merged directly without probing the indexes
+        signatures = {}
+
+        for i, entry in enumerate(prepared):
+            signature = (entry["block"], frozenset(entry["tokens"]),
+                         frozenset(entry["explicit"]), frozenset(entry["derived"]))
+            if signature in signatures:
+                parent[find(i)] = find(signatures[signature])
+                continue
+            signatures[signature] = i
+
+            ordered = sorted(entry["tokens"], key=lambda token: (frequency[token], token))
+            prefix = ordered[:self._prefix_length(len(ordered))]
+
+            candidates = set()
+            for block in self._neighbour_blocks(entry["block"]):
+                if block in explicit_index:
+                    for acronym in entry["explicit"] | entry["derived"]:
+                        candidates.update(explicit_index[block].get(acronym, ()))
+                if block in derived_index:
+                    for acronym in entry["explicit"]:
+                        candidates.update(derived_index[block].get(acronym, ()))
+                if block in token_index:
+                    for token in prefix:
+                        candidates.update(token_index[block].get(token, ()))
+
+            for j in candidates:
+                if find(i) != find(j) and self._is_match(entry, prepared[j]):
+                    parent[find(i)] = find(j)
+
+            for acronym in entry["explicit"]:
+                explicit_index[entry["block"]][acronym].append(i)
+            for acronym in entry["derived"]:
+                derived_index[entry["block"]][acronym].append(i)
+            for token in prefix:
+                token_index[entry["block"]][token].append(i)
+
+        clusters = defaultdict(list)
+        for i in range(len(prepared)):
+            clusters[find(i)].append(i)
+
+        first_seen = sorted(clusters.values(), key=lambda members: members[0])
+        return [self.merge([conferences[i] for i in members]) for members in first_seen]
+
+    def merge(self, duplicates: List[Dict]) -> Dict:
+        """
+        Merge entries for one event, keeping the most complete fields.
+
+        Args:
+            duplicates: Conference dictionaries describing the same event
+
+        Returns:
+            Merged conference dictionary
+        """
+        if len(duplicates) == 1:
+            return duplicates[0]
+
+        def completeness(conf):
+            return sum(1 for value in conf.values() if value not in (None, "", []))
+
+        # Most complete entry first; ties keep input order
+        ranked = sorted(duplicates, key=completeness, reverse=True)
+        merged = dict(ranked[0])
+
+        for conf in ranked[1:]:
+            for key, value in conf.items():
+                if merged.get(key) in (None, "", []) and value not in (None, "", []):
+                    merged[key] = value
+
+        topics = []
+        for conf in duplicates:
+            for topic in conf.get("topics") or []:
+                if topic not in topics:
+                    topics.append(topic)
+        merged["topics"] = topics
+
+        return merged
@@ -0,0 +1,185 @@
+"""
+Conference Index
+
+This module keeps every scraped conference in a local SQLite database with
+an FTS5 full-text index over names, topics and locations. Each (source,
+query) scrape is recorded with its fetch time, so searches can be answered
+locally until a source's results are older than the staleness bound.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class ConferenceIndex:
+    """
+    Local full-text index of scraped conferences with per-source freshness.
+    """
+
+    def __init__(self, store_path: str = "conference_index.db", max_staleness: float = 6 * 3600):
+        """
+        Initialize the conference index.
+
+        Args:
+            store_path: Path of the SQLite file holding the index
+            max_staleness: Seconds a (source, query) scrape is reused before
+                the source is searched again
+        """
+        self.store_path = store_path
+        self.max_staleness = max_staleness
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(store_path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS fetches (
+                source TEXT NOT NULL,
+                query TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (source, query)
+            );
+            CREATE TABLE IF NOT EXISTS conferences (
+                id INTEGER PRIMARY KEY,
+                source TEXT NOT NULL,
+                query TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS conferences_source_query ON conferences (source, query);
+            CREATE VIRTUAL TABLE IF NOT EXISTS conference_fts USING fts5(name, topics, location);
+        """)
+        self._conn.commit()
+
+    def close(self):
+        """Close the local store."""
+        with self._lock:
+            self._conn.close()
+
+    def get_fetched_at(self, source: str, query: str) -> Optional[float]:
+        """
+        Get when a source was last searched for a query.
+
+        Args:
+            source: Source name
+            query: Search query ("" for topic-independent sources)
+
+        Returns:
+            Unix timestamp, or None if never searched
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at FROM fetches WHERE source = ? AND query = ?", (source, query)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self, source: str, query: str) -> bool:
+        """
+        Check whether the stored results for a search are within the staleness bound.
+
+        Args:
+            source: Source name
+            query: Search query ("" for topic-independent sources)
+
+        Returns:
+            True if the search need not go to the network
+        """
+        fetched_at = self.get_fetched_at(source, query)
+        return fetched_at is not None and time.time() - fetched_at <= self.max_staleness
+
+    def store(self, source: str, query: str, conferences: List[Dict]):
+        """
+        Replace the stored results of a search.
+
+        Args:
+            source: Source name
+            query: Search query ("" for topic-independent sources)
+            conferences: Conferences the search returned
+        """
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM conference_fts WHERE rowid IN "
+                "(SELECT id FROM conferences WHERE source = ? AND query = ?)", (source, query)
+            )
+            self._conn.execute("DELETE FROM conferences WHERE source = ? AND query = ?", (source, query))
+
+            for conf in conferences:
+                cursor = self._conn.execute(
+                    "INSERT INTO conferences (source, query, fetched_at, data) VALUES (?, ?, ?, ?)",
+                    (source, query, now, json.dumps(conf))
+                )
+                self._conn.execute(
+                    "INSERT INTO conference_fts (rowid, name, topics, location) VALUES (?, ?, ?, ?)",
+                    (cursor.lastrowid, conf.get("name") or "", " | ".join(conf.get("topics") or []),
+                     conf.get("location") or "")
+                )
+
+            self._conn.execute(
+                "INSERT INTO fetches (source, query, fetched_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(source, query) DO UPDATE SET fetched_at = excluded.fetched_at",
+                (source, query, now)
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _phrase(text: str) -> str:
+        """Quote text as an FTS5 phrase."""
+        return '"' + text.replace('"', '""') + '"'
+
+    def search(self, source: str, query: str = "") -> List[Dict]:
+        """
+        Get the stored results of one search.
+
+        Only the conferences stored for this (source, query) pair are
+        returned; results another query found are never mixed in.
+
+        Args:
+            source: Source name
+            query: Search query ("" for topic-independent sources)
+
+        Returns:
+            List of conference information dictionaries, each tagged with
+            the query as a topic
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM conferences WHERE source = ? AND query = ? ORDER BY id", (source, query)
+            ).fetchall()
+
+        conferences = [json.loads(row[0]) for row in rows]
+
+        if query:
+            for conf in conferences:
+                if query not in conf.get("topics", []):
+                    conf["topics"] = conf.get("topics", []) + [query]
+
+        return conferences
+
+    def search_text(self, text: str, limit: int = 50) -> List[Dict]:
+        """
+        Full-text search over conference names, topics and locations.
+
+        Args:
+            text: Words to search for
+            limit: Maximum number of results
+
+        Returns:
+            Best matching conferences, each with its source and fetched_at
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT c.data, c.source, c.fetched_at FROM conference_fts "
+                "JOIN conferences c ON c.id = conference_fts.rowid "
+                "WHERE conference_fts MATCH ? ORDER BY rank LIMIT ?",
+                (" ".join(self._phrase(word) for word in text.split()), limit)
+            ).fetchall()
+
+        results = []
+        for data, source, fetched_at in rows:
+            conf = json.loads(data)
+            conf["source"] = source
+            conf["fetched_at"] = fetched_at
+            results.append(conf)
+        return results
@@ -6,25 +6,97 @@ It updates the Notion database with conference information.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import hashlib
 import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 import json
 from typing import List, Dict, Any, Optional
 
+from conference_dedup import ConferenceDeduplicator
+from fetch_cache import FetchOnceCache
+
+# lxml builds trees several times faster than html.parser; use it when installed
+try:
+    import lxml  # noqa: F401
+    DEFAULT_HTML_PARSER = "lxml"
+except ImportError:
+    DEFAULT_HTML_PARSER = "html.parser"
+
 class ConferenceTracker:
     """
     Tracks conferences on specified topics and updates Notion database.
     """
     
-    def __init__(self, notion_helper):
+    # Properties compared to decide whether a stored conference changed; Last Updated is not content
+    CONTENT_PROPERTIES = {
+        "Name": "title",
+        "Website": "url",
+        "Dates": "date",
+        "Location": "rich_text",
+        "Submission Deadline": "date",
+        "Topics": "multi_select"
+    }
+    AIDEADLINES_URL = "https://aideadlin.es/data/ai_deadlines.json"
+    # Only these subtrees of the search result pages are ever read
+    WIKICFP_STRAINER = SoupStrainer("table", class_="conftable")
+    WIKICFP_MARKER = 'class="conftable"'
+    CONFERENCEALERTS_STRAINER = SoupStrainer("div", class_="eventBlock")
+    CONFERENCEALERTS_MARKER = 'class="eventBlock"'
+    AI_TERMS = ["ai", "artificial intelligence", "machine learning", "deep learning", "neural"]
+    
+    def __init__(self, notion_helper, database_sync=None, max_workers: int = 8,
+                 per_host_limit: int = 2, search_deadline: float = 60.0,
+                 request_timeout: float = 15.0, fetch_cache: Optional[FetchOnceCache] = None,
+                 http_cache=None, html_parser: Optional[str] = None,
+                 targeted_parsing: bool = True, parse_pool=None, write_concurrency: int = 3,
+                 conference_index=None):
         """
         Initialize the conference tracker.
         
         Args:
             notion_helper: NotionHelper instance for Notion interactions
+            database_sync: Optional DatabaseSync used to fetch only changed items
+            max_workers: Maximum number of source fetches in flight at once
+            per_host_limit: Maximum concurrent fetches against any one host
+            search_deadline: Seconds search_conferences waits for all sources;
+                sources still running after that are left out of the results
+            request_timeout: Timeout in seconds for each HTTP request
+            fetch_cache: Cache for topic-independent feeds, cleared by the owner
+                at the start of each run (a private one is used if None)
+            http_cache: Optional HTTPCache used to revalidate source pages
+                instead of downloading them again
+            html_parser: BeautifulSoup tree builder for scraped pages
+                (lxml if installed, otherwise html.parser)
+            targeted_parsing: Only build the part of each page that holds
+                results instead of the full document tree
+            parse_pool: Optional ParsePool that parses pages in worker processes
+            write_concurrency: Maximum concurrent Notion writes when updating the
+                database; all writes still share the Notion rate limiter
+            conference_index: Optional ConferenceIndex that answers searches
+                locally while each source's results are fresh
         """
         self.notion_helper = notion_helper
+        self.database_sync = database_sync
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.search_deadline = search_deadline
+        self.request_timeout = request_timeout
+        self.fetch_cache = fetch_cache if fetch_cache is not None else FetchOnceCache()
+        self.http_cache = http_cache
+        self.html_parser = html_parser or DEFAULT_HTML_PARSER
+        self.targeted_parsing = targeted_parsing
+        self.parse_pool = parse_pool
+        self.write_concurrency = max(1, write_concurrency)
+        self.deduplicator = ConferenceDeduplicator()
+        self.conference_index = conference_index
+        self._host_slots = defaultdict(lambda: threading.BoundedSemaphore(self.per_host_limit))
+        self._host_slots_lock = threading.Lock()
+        self._database_locks = defaultdict(threading.Lock)
+        self._database_locks_lock = threading.Lock()
         self.sources = [
             "https://www.wikicfp.com/cfp/",
             "https://conferencealerts.com/",
@@ -44,27 +116,141 @@ class ConferenceTracker:
         Returns:
             List of conference information dictionaries
         """
-        all_conferences = []
+        searches = []  # (source, query, host, search function, arguments before timeframe)
         
         for topic in topics:
-            # Search WikiCFP
-            wikicfp_conferences = self._search_wikicfp(topic, timeframe)
-            all_conferences.extend(wikicfp_conferences)
-            
-            # Search Conference Alerts
-            confalerts_conferences = self._search_conferencealerts(topic, timeframe)
-            all_conferences.extend(confalerts_conferences)
-            
-            # Search AI Deadlines if topic is related to AI
-            if any(ai_term in topic.lower() for ai_term in ["ai", "artificial intelligence", "machine learning", "deep learning", "neural"]):
-                aideadlines_conferences = self._search_aideadlines(timeframe)
-                all_conferences.extend(aideadlines_conferences)
+            # Search WikiCFP and Conference Alerts
+            searches.append(("WikiCFP", topic, "www.wikicfp.com", self._search_wikicfp, (topic,)))
+            searches.append(("Conference Alerts", topic, "conferencealerts.com",
+                             self._search_conferencealerts, (topic,)))
+        
+        # AI Deadlines returns the same feed for every topic, so search it once if any topic is AI related
+        if any(ai_term in topic.lower() for topic in topics for ai_term in self.AI_TERMS):
+            searches.append(("AI Deadlines", "", "aideadlin.es", self._search_aideadlines, ()))
+        
+        if self.conference_index:
+            all_conferences = self._search_with_index(searches, timeframe)
+        else:
+            all_conferences = []
+            for conferences in self._run_searches([(host, func, args + (timeframe,))
+                                                   for _, _, host, func, args in searches]):
+                if conferences:
+                    all_conferences.extend(conferences)
         
         # Remove duplicates based on conference name and date
         unique_conferences = self._remove_duplicates(all_conferences)
         
         return unique_conferences
     
+    def _search_with_index(self, searches: List[tuple], timeframe: str) -> List[Dict]:
+        """
+        Answer searches from the conference index, scraping only stale sources.
+        
+        Stale sources are scraped for every timeframe and the index is
+        filtered afterwards, so stored results serve any later timeframe.
+        If a scrape fails or returns nothing, the older stored results are used.
+        
+        Args:
+            searches: List of (source, query, host, search function, arguments) tuples
+            timeframe: Time range to search
+            
+        Returns:
+            List of conference information dictionaries
+        """
+        stale = [search for search in searches
+                 if not self.conference_index.is_fresh(search[0], search[1])]
+        
+        results = self._run_searches([(host, func, args + ("all",)) for _, _, host, func, args in stale])
+        for (source, query, _, _, _), conferences in zip(stale, results):
+            # Empty results are usually errors, which the search functions only print
+            if conferences:
+                self.conference_index.store(source, query, conferences)
+        
+        all_conferences = []
+        for source, query, _, _, _ in searches:
+            for conf in self.conference_index.search(source, query):
+                if timeframe == "all" or self._is_in_timeframe(conf.get("start_date"), timeframe):
+                    all_conferences.append(conf)
+        
+        return all_conferences
+    
+    def _run_searches(self, searches: List[tuple]) -> List[Optional[List[Dict]]]:
+        """
+        Run source searches concurrently under the per-host limit and deadline.
+        
+        Args:
+            searches: List of (host, search function, arguments) tuples
+            
+        Returns:
+            Result list of each search in submission order, or None for
+            searches that didn't finish in time
+        """
+        if not searches:
+            return []
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(searches))))
+        try:
+            futures = [executor.submit(self._search_host, host, func, *args)
+                       for host, func, args in searches]
+            done, not_done = wait(futures, timeout=self.search_deadline)
+        finally:
+            # Don't block on stragglers; their requests time out on their own
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        if not_done:
+            print(f"Conference search deadline reached, skipping {len(not_done)} source searches")
+        
+        return [future.result() if future in done else None for future in futures]
+    
+    def _search_host(self, host: str, func, *args) -> List[Dict]:
+        """
+        Run one source search while holding a slot for its host.
+        
+        Args:
+            host: Host the search talks to
+            func: Search function
+            args: Arguments for the search function
+            
+        Returns:
+            List of conference information dictionaries
+        """
+        with self._host_slots_lock:
+            slots = self._host_slots[host]
+        
+        with slots:
+            return func(*args)
+    
+    def _http_get(self, url: str) -> requests.Response:
+        """
+        GET a source page, through the HTTP cache if there is one.
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            Response
+        """
+        if self.http_cache:
+            return self.http_cache.get(url, timeout=self.request_timeout)
+        return requests.get(url, timeout=self.request_timeout)
+    
+    def _fetch_feed_json(self, url: str) -> Any:
+        """
+        Download a topic-independent JSON feed, at most once per run.
+        
+        Args:
+            url: Feed URL
+            
+        Returns:
+            Decoded JSON payload
+        """
+        def fetch():
+            response = self._http_get(url)
+            response.raise_for_status()
+            return response.json()
+        
+        return self.fetch_cache.get(url, fetch)
+    
     def _search_wikicfp(self, topic: str, timeframe: str) -> List[Dict]:
         """
         Search WikiCFP for conferences.
@@ -83,62 +269,103 @@ class ConferenceTracker:
             search_url = f"https://www.wikicfp.com/cfp/servlet/tool.search?q={topic.replace(' ', '+')}&year=f"
             
             # Send request
-            response = requests.get(search_url)
+            response = self._http_get(search_url)
             if response.status_code != 200:
                 print(f"Error searching WikiCFP: {response.status_code}")
                 return conferences
             
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            return self._parse_page("_parse_wikicfp", response.text, topic, timeframe)
+        
+        except Exception as e:
+            print(f"Error searching WikiCFP: {str(e)}")
+            return conferences
+    
+    def _parse_page(self, parser: str, html: str, topic: str, timeframe: str) -> List[Dict]:
+        """
+        Run a page parser, in a worker process if there is a parse pool.
+        
+        Args:
+            parser: Name of the parser method
+            html: Page HTML
+            topic: Topic that was searched for
+            timeframe: Time range to keep
             
-            # Find conference table
-            tables = soup.find_all('table', class_='conftable')
-            if not tables:
-                return conferences
+        Returns:
+            List of conference information dictionaries
+        """
+        if self.parse_pool:
+            return self.parse_pool.run(_parse_page_in_worker, parser, html, topic, timeframe,
+                                       self.html_parser, self.targeted_parsing)
+        return getattr(self, parser)(html, topic, timeframe)
+    
+    def _make_soup(self, html: str, strainer: SoupStrainer, marker: str) -> BeautifulSoup:
+        """
+        Parse a result page, limited to the strainer's subtree in targeted mode.
+        
+        Args:
+            html: Page HTML
+            strainer: Elements that hold the results
+            marker: Text that appears in the tag of the first result element
             
-            # Process conference rows
-            rows = tables[0].find_all('tr')[1:]  # Skip header row
-            
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) >= 5:
-                    # Extract conference details
-                    conf_name = cells[0].text.strip()
-                    conf_link = cells[0].find('a')
-                    conf_url = f"https://www.wikicfp.com{conf_link['href']}" if conf_link else ""
-                    
-                    # Extract dates
-                    when = cells[1].text.strip()
-                    where = cells[2].text.strip()
-                    deadline = cells[3].text.strip()
-                    
-                    # Parse dates
-                    conf_dates = self._parse_date_range(when)
-                    deadline_date = self._parse_date(deadline)
-                    
-                    # Filter by timeframe if needed
-                    if timeframe != "all" and not self._is_in_timeframe(conf_dates.get("start"), timeframe):
-                        continue
-                    
-                    # Create conference entry
-                    conference = {
-                        "name": conf_name,
-                        "url": conf_url,
-                        "start_date": conf_dates.get("start"),
-                        "end_date": conf_dates.get("end"),
-                        "location": where,
-                        "submission_deadline": deadline_date,
-                        "source": "WikiCFP",
-                        "topics": [topic]
-                    }
-                    
-                    conferences.append(conference)
+        Returns:
+            Parsed document
+        """
+        if not self.targeted_parsing:
+            return BeautifulSoup(html, self.html_parser)
+        
+        # Don't tokenize the page head and navigation at all; if the marker
+        # isn't found the whole page is parsed and the strainer does the work
+        start = html.find(marker)
+        if start > 0:
+            html = html[html.rfind("<", 0, start):]
+        
+        return BeautifulSoup(html, self.html_parser, parse_only=strainer)
+    
+    def _parse_wikicfp(self, html: str, topic: str, timeframe: str) -> List[Dict]:
+        """
+        Extract conferences from a WikiCFP search result page.
+        
+        Args:
+            html: Page HTML
+            topic: Topic that was searched for
+            timeframe: Time range to keep
             
-            return conferences
+        Returns:
+            List of conference information dictionaries
+        """
+        conferences = []
         
-        except Exception as e:
-            print(f"Error searching WikiCFP: {str(e)}")
+        # Find conference table
+        soup = self._make_soup(html, self.WIKICFP_STRAINER, self.WIKICFP_MARKER)
+        table = soup.find('table', class_='conftable')
+        if table is None:
             return conferences
+        
+        # Process conference rows, skipping the header row
+        for row in table.find_all('tr')[1:]:
+            cells = row.find_all('td')
+            if len(cells) < 5:
+                continue
+            
+            # Parse dates first so rows outside the timeframe are dropped cheaply
+            conf_dates = self._parse_date_range(cells[1].get_text().strip())
+            if timeframe != "all" and not self._is_in_timeframe(conf_dates.get("start"), timeframe):
+                continue
+            
+            conf_link = cells[0].find('a')
+            
+            conferences.append({
+                "name": cells[0].get_text().strip(),
+                "url": f"https://www.wikicfp.com{conf_link['href']}" if conf_link else "",
+                "start_date": conf_dates.get("start"),
+                "end_date": conf_dates.get("end"),
+                "location": cells[2].get_text().strip(),
+                "submission_deadline": self._parse_date(cells[3].get_text().strip()),
+                "source": "WikiCFP",
+                "topics": [topic]
+            })
+        
+        return conferences
     
     def _search_conferencealerts(self, topic: str, timeframe: str) -> List[Dict]:
         """
@@ -158,61 +385,61 @@ class ConferenceTracker:
             search_url = f"https://conferencealerts.com/search?search_string={topic.replace(' ', '+')}"
             
             # Send request
-            response = requests.get(search_url)
+            response = self._http_get(search_url)
             if response.status_code != 200:
                 print(f"Error searching Conference Alerts: {response.status_code}")
                 return conferences
             
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find conference listings
-            listings = soup.find_all('div', class_='eventBlock')
-            
-            for listing in listings:
-                # Extract conference details
-                title_elem = listing.find('h3')
-                if not title_elem:
-                    continue
-                
-                conf_name = title_elem.text.strip()
-                conf_link = title_elem.find('a')
-                conf_url = conf_link['href'] if conf_link else ""
-                
-                # Extract dates and location
-                date_elem = listing.find('div', class_='eventDate')
-                location_elem = listing.find('div', class_='eventLocation')
-                
-                when = date_elem.text.strip() if date_elem else ""
-                where = location_elem.text.strip() if location_elem else ""
-                
-                # Parse dates
-                conf_dates = self._parse_date_range(when)
-                
-                # Filter by timeframe if needed
-                if timeframe != "all" and not self._is_in_timeframe(conf_dates.get("start"), timeframe):
-                    continue
-                
-                # Create conference entry
-                conference = {
-                    "name": conf_name,
-                    "url": conf_url,
-                    "start_date": conf_dates.get("start"),
-                    "end_date": conf_dates.get("end"),
-                    "location": where,
-                    "submission_deadline": None,  # Not provided in search results
-                    "source": "Conference Alerts",
-                    "topics": [topic]
-                }
-                
-                conferences.append(conference)
-            
-            return conferences
+            return self._parse_page("_parse_conferencealerts", response.text, topic, timeframe)
         
         except Exception as e:
             print(f"Error searching Conference Alerts: {str(e)}")
             return conferences
     
+    def _parse_conferencealerts(self, html: str, topic: str, timeframe: str) -> List[Dict]:
+        """
+        Extract conferences from a Conference Alerts search result page.
+        
+        Args:
+            html: Page HTML
+            topic: Topic that was searched for
+            timeframe: Time range to keep
+            
+        Returns:
+            List of conference information dictionaries
+        """
+        conferences = []
+        
+        # Find conference listings
+        soup = self._make_soup(html, self.CONFERENCEALERTS_STRAINER, self.CONFERENCEALERTS_MARKER)
+        
+        for listing in soup.find_all('div', class_='eventBlock'):
+            title_elem = listing.find('h3')
+            if not title_elem:
+                continue
+            
+            # Parse dates first so listings outside the timeframe are dropped cheaply
+            date_elem = listing.find('div', class_='eventDate')
+            conf_dates = self._parse_date_range(date_elem.get_text().strip() if date_elem else "")
+            if timeframe != "all" and not self._is_in_timeframe(conf_dates.get("start"), timeframe):
+                continue
+            
+            conf_link = title_elem.find('a')
+            location_elem = listing.find('div', class_='eventLocation')
+            
+            conferences.append({
+                "name": title_elem.get_text().strip(),
+                "url": conf_link['href'] if conf_link else "",
+                "start_date": conf_dates.get("start"),
+                "end_date": conf_dates.get("end"),
+                "location": location_elem.get_text().strip() if location_elem else "",
+                "submission_deadline": None,  # Not provided in search results
+                "source": "Conference Alerts",
+                "topics": [topic]
+            })
+        
+        return conferences
+    
     def _search_aideadlines(self, timeframe: str) -> List[Dict]:
         """
         Get AI conference deadlines from aideadlin.es.
@@ -226,13 +453,8 @@ class ConferenceTracker:
         conferences = []
         
         try:
-            # AI Deadlines provides a JSON API
-            response = requests.get("https://aideadlin.es/data/ai_deadlines.json")
-            if response.status_code != 200:
-                print(f"Error fetching AI Deadlines: {response.status_code}")
-                return conferences
-            
-            data = response.json()
+            # AI Deadlines provides a JSON API; the feed is shared by every search in a run
+            data = self._fetch_feed_json(self.AIDEADLINES_URL)
             
             for conf in data.get("conferences", []):
                 # Extract conference details
@@ -371,7 +593,10 @@ class ConferenceTracker:
     
     def _remove_duplicates(self, conferences: List[Dict]) -> List[Dict]:
         """
-        Remove duplicate conferences based on name and date.
+        Merge conferences that describe the same event.
+        
+        Names are matched fuzzily (acronyms, normalised tokens) among entries
+        starting in the same or an adjacent month; see ConferenceDeduplicator.
         
         Args:
             conferences: List of conference dictionaries
@@ -379,62 +604,252 @@ class ConferenceTracker:
         Returns:
             Deduplicated list of conferences
         """
-        unique_conferences = {}
+        return self.deduplicator.deduplicate(conferences)
+    
+    def _database_lock(self, database_id: str) -> threading.Lock:
+        """Get the lock serialising reads and writes of one Notion database."""
+        with self._database_locks_lock:
+            return self._database_locks[database_id]
+    
+    def update_conference_database(self, database_id: str, conferences: List[Dict]) -> Dict[str, Any]:
+        """
+        Update Notion database with conference information.
+        
+        Conferences are matched to existing pages by name. Pages whose content
+        hash is unchanged are not written; the rest are created or updated in
+        concurrent batches. Updates of the same database run one at a time,
+        so overlapping tasks don't both create a page for a new conference.
         
-        for conf in conferences:
-            # Create a key based on name and start date
-            key = f"{conf['name']}_{conf.get('start_date', '')}"
+        Args:
+            database_id: Notion database ID
+            conferences: List of conference dictionaries
             
-            # If this is a new conference or has more complete information, keep it
-            if key not in unique_conferences or self._is_more_complete(conf, unique_conferences[key]):
-                unique_conferences[key] = conf
+        Returns:
+            Dictionary with created, updated and unchanged counts, and page_ids
+            listing the page of every conference in input order
+        """
+        with self._database_lock(database_id):
+            # Get existing conferences from database, fetching only changes when syncing incrementally
+            if self.database_sync:
+                self.database_sync.sync(database_id)
+                existing_conferences = self.database_sync.get_items(database_id)
             else:
-                # Merge topics if this is a duplicate with different topics
-                existing_topics = set(unique_conferences[key].get("topics", []))
-                new_topics = set(conf.get("topics", []))
-                unique_conferences[key]["topics"] = list(existing_topics.union(new_topics))
-        
-        return list(unique_conferences.values())
+                existing_conferences = self.notion_helper.get_all_database_items(database_id)
+            existing_map = {}
+            
+            # Create a map of existing conferences by name
+            for conf in existing_conferences:
+                name = self._get_property_value(conf, "Name", "title")
+                if name:
+                    existing_map[name] = conf
+            
+            # Plan the writes; a later entry for the same name replaces an earlier one
+            planned = {}
+            for conf in conferences:
+                conf_name = conf.get("name")
+                if conf_name:
+                    planned[conf_name] = self._create_conference_properties(conf)
+            
+            creates = []
+            updates = []
+            page_ids = {}
+            
+            for conf_name, properties in planned.items():
+                existing = existing_map.get(conf_name)
+                if existing is None:
+                    creates.append((conf_name, properties))
+                    continue
+                
+                # Each task only knows its own topics, so keep those other tasks tagged the page with
+                topics = self._get_property_value(existing, "Topics", "multi_select") or []
+                for item in properties.get("Topics", {}).get("multi_select", []):
+                    if item["name"] not in topics:
+                        topics.append(item["name"])
+                if topics:
+                    properties["Topics"] = {"multi_select": [{"name": topic} for topic in topics]}
+                
+                if self._content_hash(existing.get("properties", {})) != self._content_hash(properties):
+                    updates.append((conf_name, properties))
+                else:
+                    page_ids[conf_name] = existing.get("id")
+            
+            unchanged = len(page_ids)
+            
+            def write(job):
+                conf_name, properties = job
+                try:
+                    if conf_name in existing_map:
+                        return conf_name, self.notion_helper.api.update_page(existing_map[conf_name].get("id"), properties)
+                    return conf_name, self.notion_helper.api.create_page(database_id, True, properties)
+                except Exception as e:
+                    print(f"Error updating conference {conf_name}: {str(e)}")
+                    return conf_name, {"error": str(e)}
+            
+            created = 0
+            updated = 0
+            written_pages = []
+            
+            if creates or updates:
+                with ThreadPoolExecutor(max_workers=min(self.write_concurrency, len(creates) + len(updates))) as executor:
+                    for conf_name, result in executor.map(write, updates + creates):
+                        if "error" in result or not result.get("id"):
+                            continue
+                        
+                        page_ids[conf_name] = result.get("id")
+                        written_pages.append(result)
+                        if conf_name in existing_map:
+                            updated += 1
+                        else:
+                            created += 1
+            
+            # Keep the local mirror current so the next run doesn't see our own writes as unknown
+            if self.database_sync:
+                self.database_sync.upsert_items(database_id, written_pages)
+            
+            return {
+                "created": created,
+                "updated": updated,
+                "unchanged": unchanged,
+                "page_ids": [page_ids[name] for name in planned if page_ids.get(name)]
+            }
     
-    def _is_more_complete(self, conf1: Dict, conf2: Dict) -> bool:
+    def _content_hash(self, properties: Dict) -> str:
         """
-        Check if conf1 has more complete information than conf2.
+        Hash the content properties of a conference page.
+        
+        Works on both the properties we send and the properties Notion returns,
+        so a stored page can be compared with a freshly scraped conference.
         
         Args:
-            conf1: First conference dictionary
-            conf2: Second conference dictionary
+            properties: Notion page properties
             
         Returns:
-            True if conf1 is more complete, False otherwise
+            Hex digest that only changes when the conference content changes
         """
-        # Count non-None values in each conference
-        count1 = sum(1 for v in conf1.values() if v is not None)
-        count2 = sum(1 for v in conf2.values() if v is not None)
+        values = {}
+        
+        for name, property_type in self.CONTENT_PROPERTIES.items():
+            data = properties.get(name) or {}
+            
+            if property_type in ("title", "rich_text"):
+                value = "".join(item.get("text", {}).get("content", "") for item in data.get(property_type) or [])
+            elif property_type == "date":
+                date = data.get("date") or {}
+                value = [date.get("start"), date.get("end")] if date.get("start") else None
+            elif property_type == "multi_select":
+                value = sorted(item.get("name", "") for item in data.get("multi_select") or [])
+            else:
+                value = data.get(property_type)
+            
+            values[name] = value or None
         
-        return count1 > count2
+        return hashlib.sha256(json.dumps(values, sort_keys=True).encode("utf-8")).hexdigest()
     
-    def update_conference_database(self, database_id: str, conferences: List[Dict]) -> List[str]:
+    def _create_conference_properties(self, conference: Dict) -> Dict:
         """
-        Update Notion database with conference information.
+        Create Notion properties for a conference.
         
         Args:
-            database_id: Notion database ID
-            conferences: List of conference dictionaries
+            conference: Conference dictionary
             
         Returns:
-            List of updated/created page IDs
+            Notion page properties
         """
-        updated_ids = []
+        properties = {
+            "Name": {
+                "title": [
+                    {
+                        "text": {
+                            "content": conference.get("name") or "Untitled Conference"
+                        }
+                    }
+                ]
+            }
+        }
+        
+        # Add optional properties if they exist
+        if conference.get("url"):
+            properties["Website"] = {
+                "url": conference["url"]
+            }
+        
+        if conference.get("start_date"):
+            end_date = conference.get("end_date") or conference["start_date"]
+            properties["Dates"] = {
+                "date": {
+                    "start": conference["start_date"],
+                    "end": end_date if end_date != conference["start_date"] else None
+                }
+            }
+        
+        if conference.get("location"):
+            properties["Location"] = {
+                "rich_text": [
+                    {
+                        "text": {
+                            "content": conference["location"]
+                        }
+                    }
+                ]
+            }
+        
+        if conference.get("submission_deadline"):
+            properties["Submission Deadline"] = {
+                "date": {
+                    "start": conference["submission_deadline"]
+                }
+            }
+        
+        if conference.get("topics"):
+            properties["Topics"] = {
+                "multi_select": [{"name": topic} for topic in conference["topics"]]
+            }
         
-        # Get existing conferences from database
-        existing_conferences = self.notion_helper.get_all_database_items(database_id)
-        existing_map = {}
+        properties["Last Updated"] = {
+            "date": {
+                "start": datetime.now().strftime("%Y-%m-%d")
+            }
+        }
         
-        # Create a map of existing conferences by name
-        for conf in existing_conferences:
-            name = self._get_property_value(conf, "Name", "title")
-            if name:
-                existing_map[name] = conf
+        return properties
+    
+    def _get_property_value(self, page: Dict, property_name: str, property_type: str) -> Any:
+        """
+        Extract property value from a Notion page.
         
-  
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+        Args:
+            page: Notion page dictionary
+            property_name: Name of the property
+            property_type: Type of the property (title, rich_text, etc.)
+            
+        Returns:
+            Property value or None if not found
+        """
+        try:
+            properties = page.get("properties", {})
+            property_data = properties.get(property_name, {})
+            
+            if property_type == "title" or property_type == "rich_text":
+                text_items = property_data.get(property_type, [])
+                if text_items:
+                    return text_items[0].get("text", {}).get("content")
+            elif property_type == "select":
+                return property_data.get("select", {}).get("name")
+            elif property_type == "multi_select":
+                return [item.get("name") for item in property_data.get("multi_select", [])]
+            elif property_type == "date":
+                return property_data.get("date", {}).get("start")
+            elif property_type == "url":
+                return property_data.get("url")
+            
+            return None
+        
+        except Exception:
+            return None
+
+
+def _parse_page_in_worker(parser: str, html: str, topic: str, timeframe: str,
+                          html_parser: str, targeted_parsing: bool) -> List[Dict]:
+    """Parse a result page in a ParsePool worker process."""
+    tracker = ConferenceTracker(None, html_parser=html_parser, targeted_parsing=targeted_parsing)
+    return getattr(tracker, parser)(html, topic, timeframe)
@@ -0,0 +1,216 @@
+"""
+Incremental Database Sync
+
+This module keeps a local SQLite mirror of Notion databases. After an initial
+full scan, each sync only queries pages whose last_edited_time is at or after
+the stored watermark and merges them into the mirror.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+
+class DatabaseSync:
+    """
+    Maintains local copies of Notion databases using last_edited_time watermarks.
+    """
+
+    def __init__(self, notion_helper, store_path: str = "notion_sync.db",
+                 overlap_seconds: int = 120, full_sync_interval: float = 24 * 3600):
+        """
+        Initialize the database sync.
+
+        Args:
+            notion_helper: NotionHelper instance for Notion interactions
+            store_path: Path of the SQLite file holding the local mirror
+            overlap_seconds: How far before the watermark to re-query. Notion
+                rounds last_edited_time to the minute, so this must cover that
+            full_sync_interval: Seconds between full rescans, which also drop
+                pages that were deleted or archived in Notion
+        """
+        self.notion_helper = notion_helper
+        self.store_path = store_path
+        self.overlap_seconds = overlap_seconds
+        self.full_sync_interval = full_sync_interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(store_path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sync_state (
+                database_id TEXT PRIMARY KEY,
+                watermark TEXT,
+                last_full_sync REAL
+            );
+            CREATE TABLE IF NOT EXISTS items (
+                database_id TEXT NOT NULL,
+                page_id TEXT NOT NULL,
+                last_edited_time TEXT,
+                data TEXT NOT NULL,
+                PRIMARY KEY (database_id, page_id)
+            );
+        """)
+        self._conn.commit()
+
+    def close(self):
+        """Close the local store."""
+        with self._lock:
+            self._conn.close()
+
+    def get_watermark(self, database_id: str) -> Optional[str]:
+        """
+        Get the newest last_edited_time seen for a database.
+
+        Args:
+            database_id: Notion database ID
+
+        Returns:
+            ISO timestamp, or None if the database has never been synced
+        """
+        return self._get_state(database_id)[0]
+
+    def _get_state(self, database_id: str) -> Tuple[Optional[str], Optional[float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark, last_full_sync FROM sync_state WHERE database_id = ?",
+                (database_id,)
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def _fetch(self, database_id: str, filter_params: Optional[Dict] = None,
+               sorts: Optional[List] = None) -> Tuple[List[Dict], bool]:
+        """
+        Page through a database query.
+
+        Returns:
+            Tuple of (items, complete) where complete is False if an error
+            cut pagination short
+        """
+        items = []
+        start_cursor = None
+
+        while True:
+            response = self.notion_helper.api.query_database(
+                database_id,
+                filter_params=filter_params,
+                sorts=sorts,
+                start_cursor=start_cursor
+            )
+
+            if "error" in response:
+                print(f"Error syncing database {database_id}: {response['error']}")
+                return items, False
+
+            items.extend(response.get("results", []))
+            start_cursor = response.get("next_cursor")
+            if not response.get("has_more", False) or not start_cursor:
+                return items, True
+
+    def _since(self, watermark: str) -> str:
+        """Watermark minus the overlap window, as an ISO timestamp."""
+        try:
+            watermark_time = datetime.fromisoformat(watermark.replace("Z", "+00:00"))
+        except ValueError:
+            return watermark
+        return (watermark_time - timedelta(seconds=self.overlap_seconds)).isoformat()
+
+    def sync(self, database_id: str) -> List[Dict]:
+        """
+        Bring the local mirror of a database up to date.
+
+        Args:
+            database_id: Notion database ID
+
+        Returns:
+            Items that were fetched from Notion during this sync (the delta)
+        """
+        watermark, last_full_sync = self._get_state(database_id)
+        full = watermark is None or last_full_sync is None or \
+            time.time() - last_full_sync > self.full_sync_interval
+
+        if full:
+            items, complete = self._fetch(database_id)
+        else:
+            filter_params = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": self._since(watermark)}
+            }
+            sorts = [{"timestamp": "last_edited_time", "direction": "ascending"}]
+            items, complete = self._fetch(database_id, filter_params, sorts)
+
+        # Only a complete full scan can tell us which pages no longer exist
+        self.upsert_items(database_id, items, replace=full and complete)
+
+        edited_times = [item.get("last_edited_time") for item in items if item.get("last_edited_time")]
+        if watermark:
+            edited_times.append(watermark)
+        new_watermark = max(edited_times) if edited_times else None
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sync_state (database_id, watermark, last_full_sync) VALUES (?, ?, ?) "
+                "ON CONFLICT(database_id) DO UPDATE SET watermark = excluded.watermark, "
+                "last_full_sync = excluded.last_full_sync",
+                (database_id, new_watermark, time.time() if full and complete else last_full_sync)
+            )
+            self._conn.commit()
+
+        return items
+
+    def upsert_items(self, database_id: str, items: List[Dict], replace: bool = False):
+        """
+        Merge pages into the local mirror.
+
+        Args:
+            database_id: Notion database ID
+            items: Notion page objects
+            replace: Drop every stored page that is not in items
+        """
+        live = [item for item in items if item.get("id") and not item.get("archived")]
+        archived = [(database_id, item["id"]) for item in items if item.get("id") and item.get("archived")]
+
+        with self._lock:
+            if replace:
+                self._conn.execute("DELETE FROM items WHERE database_id = ?", (database_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO items (database_id, page_id, last_edited_time, data) VALUES (?, ?, ?, ?)",
+                [(database_id, item["id"], item.get("last_edited_time"), json.dumps(item)) for item in live]
+            )
+            self._conn.executemany(
+                "DELETE FROM items WHERE database_id = ? AND page_id = ?", archived
+            )
+            self._conn.commit()
+
+    def get_items(self, database_id: str) -> List[Dict]:
+        """
+        Get every page in the local mirror of a database.
+
+        Args:
+            database_id: Notion database ID
+
+        Returns:
+            List of Notion page objects
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM items WHERE database_id = ? ORDER BY page_id", (database_id,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def reset(self, database_id: Optional[str] = None):
+        """
+        Forget synced state so the next sync does a full scan.
+
+        Args:
+            database_id: Database to reset (all databases if None)
+        """
+        with self._lock:
+            if database_id is None:
+                self._conn.execute("DELETE FROM items")
+                self._conn.execute("DELETE FROM sync_state")
+            else:
+                self._conn.execute("DELETE FROM items WHERE database_id = ?", (database_id,))
+                self._conn.execute("DELETE FROM sync_state WHERE database_id = ?", (database_id,))
+            self._conn.commit()
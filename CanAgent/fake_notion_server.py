@@ -0,0 +1,277 @@
+"""
+Fake Notion Server
+
+This module provides a small local HTTP server that mimics the subset of the
+Notion API used by the agent system. It is used by the benchmark scripts to
+measure client behaviour without touching the real API.
+"""
+
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+
+class _FakeNotionHandler(BaseHTTPRequestHandler):
+    """Request handler that serves fake Notion API responses."""
+
+    protocol_version = "HTTP/1.1"  # Allow keep-alive connections
+    disable_nagle_algorithm = True  # Headers and body are separate writes
+
+    def setup(self):
+        # Called once per TCP connection, so this emulates the TCP+TLS handshake cost
+        server = self.server.fake
+        with server.lock:
+            server.connections += 1
+        if server.handshake_delay:
+            time.sleep(server.handshake_delay)
+        super().setup()
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output quiet
+
+    def _read_json(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length).decode("utf-8"))
+
+    def _send_json(self, status: int, payload: Dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method: str):
+        server = self.server.fake
+        with server.lock:
+            server.requests += 1
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        fault = server.next_fault()
+        if fault:
+            status, retry_after = fault
+            if method in ("POST", "PATCH"):
+                self._read_json()  # Drain the body so the connection stays usable
+            self.send_response(status)
+            if retry_after is not None:
+                self.send_header("Retry-After", str(retry_after))
+            body = json.dumps({"object": "error", "status": status, "code": "injected_fault"}).encode("utf-8")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        parsed = urlparse(self.path)
+        parts = [part for part in parsed.path.split("/") if part]
+        if parts and parts[0] == "v1":
+            parts = parts[1:]
+
+        data = self._read_json() if method in ("POST", "PATCH") else {}
+        query = parse_qs(parsed.query)
+
+        status, payload = server.route(method, parts, data, query)
+        self._send_json(status, payload)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+class FakeNotionServer:
+    """
+    Local fake of the Notion API for benchmarks.
+    """
+
+    def __init__(self, total_items: int = 250, handshake_delay: float = 0.0,
+                 latency: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the fake server.
+
+        Args:
+            total_items: Number of generated items returned by every database query
+            handshake_delay: Seconds to stall each new connection
+            latency: Seconds to stall every request
+            host: Interface to bind to
+            port: Port to bind to (0 picks a free port)
+        """
+        self.total_items = total_items
+        self.handshake_delay = handshake_delay
+        self.latency = latency
+        self.host = host
+        self.port = port
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.pages = {}
+        self.blocks = {}
+        self.faults = []
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to NotionAPI."""
+        return f"http://{self.host}:{self.port}/v1"
+
+    def start(self) -> str:
+        """
+        Start serving in a background thread.
+
+        Returns:
+            Base URL of the fake API
+        """
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _FakeNotionHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Stop the server and wait for the serving thread to exit."""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def reset_stats(self):
+        """Reset connection and request counters."""
+        with self.lock:
+            self.connections = 0
+            self.requests = 0
+
+    def inject_faults(self, statuses: List[int], retry_after: Optional[float] = None):
+        """
+        Make the next requests fail with the given status codes.
+
+        Args:
+            statuses: Status codes to return, one per upcoming request
+            retry_after: Value for the Retry-After header on injected responses
+        """
+        with self.lock:
+            self.faults.extend((status, retry_after) for status in statuses)
+
+    def next_fault(self) -> Optional[tuple]:
+        """Pop the next injected fault, if any."""
+        with self.lock:
+            if self.faults:
+                return self.faults.pop(0)
+            return None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def make_page(self, page_id: str, name: Optional[str] = None) -> Dict:
+        """
+        Build a fake page object.
+
+        Args:
+            page_id: Page ID
+            name: Page title
+
+        Returns:
+            Page data
+        """
+        return {
+            "object": "page",
+            "id": page_id,
+            "last_edited_time": "2025-01-01T00:00:00.000Z",
+            "properties": {
+                "Name": {"title": [{"text": {"content": name or f"Item {page_id}"}}]},
+                "Status": {"select": {"name": "Not Started"}},
+                "Frequency": {"select": {"name": "Weekly"}}
+            }
+        }
+
+    def _paginate(self, items: List[Dict], start_cursor: Optional[str], page_size: int) -> Dict:
+        start = int(start_cursor) if start_cursor else 0
+        end = min(start + page_size, len(items))
+        has_more = end < len(items)
+        return {
+            "object": "list",
+            "results": items[start:end],
+            "has_more": has_more,
+            "next_cursor": str(end) if has_more else None
+        }
+
+    def route(self, method: str, parts: List[str], data: Dict, query: Dict) -> tuple:
+        """
+        Dispatch a request to a fake endpoint.
+
+        Args:
+            method: HTTP method
+            parts: URL path segments after /v1
+            data: Decoded JSON body
+            query: Decoded query string
+
+        Returns:
+            Tuple of (status code, JSON payload)
+        """
+        if parts == ["users", "me"]:
+            return 200, {"object": "user", "id": "fake-bot", "type": "bot"}
+
+        if len(parts) == 3 and parts[0] == "databases" and parts[2] == "query" and method == "POST":
+            items = [self.make_page(f"{parts[1]}-{i}") for i in range(self.total_items)]
+            # Pages created in the database are listed after the generated items
+            with self.lock:
+                items.extend(page for page in self.pages.values()
+                             if page.get("parent", {}).get("database_id") == parts[1])
+            return 200, self._paginate(items, data.get("start_cursor"), int(data.get("page_size", 100)))
+
+        if len(parts) == 2 and parts[0] == "databases" and method == "GET":
+            return 200, {"object": "database", "id": parts[1]}
+
+        if parts == ["pages"] and method == "POST":
+            page_id = str(uuid.uuid4())
+            page = {"object": "page", "id": page_id, "parent": data.get("parent", {}),
+                    "properties": data.get("properties", {})}
+            with self.lock:
+                self.pages[page_id] = page
+            return 200, page
+
+        if len(parts) == 2 and parts[0] == "pages":
+            page_id = parts[1]
+            with self.lock:
+                page = self.pages.setdefault(page_id, self.make_page(page_id))
+                if method == "PATCH":
+                    page["properties"].update(data.get("properties", {}))
+            return 200, page
+
+        if len(parts) == 3 and parts[0] == "blocks" and parts[2] == "children":
+            with self.lock:
+                children = self.blocks.setdefault(parts[1], [])
+                if method == "PATCH":
+                    children.extend(data.get("children", []))
+                    return 200, {"object": "list", "results": data.get("children", []), "has_more": False}
+                items = list(children)
+            start_cursor = (query.get("start_cursor") or [None])[0]
+            return 200, self._paginate(items, start_cursor, 100)
+
+        if len(parts) == 2 and parts[0] == "blocks" and method == "DELETE":
+            return 200, {"object": "block", "id": parts[1], "archived": True}
+
+        return 404, {"object": "error", "status": 404, "code": "object_not_found",
+                     "message": f"Unknown endpoint: {method} /{'/'.join(parts)}"}
@@ -0,0 +1,86 @@
+"""
+Fetch-Once Cache
+
+This module memoizes downloads whose payload does not depend on the query,
+such as full conference feeds. Each key is fetched at most once until the
+cache is cleared, and concurrent callers asking for a key that is already
+being fetched wait for that fetch instead of starting their own.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class FetchOnceCache:
+    """
+    Run-scoped memo with single-flight deduplication of concurrent fetches.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries = {}  # key -> Future
+        self._lock = threading.Lock()
+        self.fetches = 0
+        self.hits = 0
+
+    def get(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        Get the payload for a key, fetching it if no one has yet.
+
+        Failed fetches are not remembered, so the next caller tries again.
+
+        Args:
+            key: Cache key, usually the URL
+            fetch: Callable that downloads the payload
+
+        Returns:
+            The fetched payload
+
+        Raises:
+            Whatever fetch raised, for the caller that ran it and any
+            callers that were waiting on it
+        """
+        with self._lock:
+            future = self._entries.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._entries[key] = future
+                self.fetches += 1
+            else:
+                self.hits += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = fetch()
+        except Exception as e:
+            with self._lock:
+                if self._entries.get(key) is future:
+                    del self._entries[key]
+            future.set_exception(e)
+            raise
+
+        future.set_result(value)
+        return value
+
+    def clear(self):
+        """Forget all fetched payloads, e.g. at the start of a run."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary of fetches, hits and entries
+        """
+        with self._lock:
+            return {
+                "fetches": self.fetches,
+                "hits": self.hits,
+                "entries": len(self._entries)
+            }
@@ -0,0 +1,238 @@
+"""
+Conditional HTTP Cache
+
+This module keeps scraped source pages in a SQLite file together with their
+ETag and Last-Modified validators. Repeat requests are sent as conditional
+GETs, and a 304 Not Modified response is answered from the stored body, so
+unchanged sources cost a round-trip but no download.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HTTPCache:
+    """
+    Persistent HTTP cache that revalidates entries with conditional requests.
+    """
+
+    def __init__(self, store_path: str = "http_cache.db", max_age: float = 30 * 24 * 3600,
+                 max_bytes: int = 64 * 1024 * 1024, timeout: float = 15.0):
+        """
+        Initialize the HTTP cache.
+
+        Args:
+            store_path: Path of the SQLite file holding cached responses
+            max_age: Seconds after which an entry that was not revalidated is evicted
+            max_bytes: Maximum combined size of cached bodies; least recently
+                used entries are evicted first
+            timeout: Default timeout in seconds for each request
+        """
+        self.store_path = store_path
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+        self.session.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(store_path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                validated_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+        """)
+        self._conn.commit()
+        self.prune()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def close(self):
+        """Close the session and the local store."""
+        self.session.close()
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, url: str, headers: Optional[Dict] = None,
+            timeout: Optional[float] = None) -> requests.Response:
+        """
+        GET a URL, revalidating a cached copy if there is one.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+            timeout: Request timeout in seconds (the cache default if None)
+
+        Returns:
+            Response; on a 304 it is rebuilt from the cached body with status
+            200 and from_cache set to True
+        """
+        request_headers = dict(headers or {})
+        cached = self._load(url)
+        if cached:
+            if cached["etag"]:
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self.session.get(url, headers=request_headers,
+                                    timeout=self.timeout if timeout is None else timeout)
+
+        if response.status_code == 304 and cached:
+            self._touch(url)
+            with self._lock:
+                self.hits += 1
+                self.bytes_saved += cached["size"]
+            return self._build_response(url, cached)
+
+        with self._lock:
+            self.misses += 1
+
+        response.from_cache = False
+        if response.status_code == 200:
+            self._store(url, response)
+
+        return response
+
+    def _load(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, headers, body, size FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            "etag": row[0],
+            "last_modified": row[1],
+            "headers": json.loads(row[2]),
+            "body": row[3],
+            "size": row[4]
+        }
+
+    def _touch(self, url: str):
+        """Mark an entry as revalidated and recently used."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE responses SET validated_at = ?, accessed_at = ? WHERE url = ?",
+                               (now, now, url))
+            self._conn.commit()
+
+    def _store(self, url: str, response: requests.Response):
+        """Store a 200 response if it carries validators and is not marked no-store."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        cache_control = response.headers.get("Cache-Control", "").lower()
+
+        # Without validators the entry could never be reused with a 304
+        if not (etag or last_modified) or "no-store" in cache_control:
+            self.invalidate(url)
+            return
+
+        body = response.content
+        if len(body) > self.max_bytes:
+            self.invalidate(url)
+            return
+
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() in ("content-type", "etag", "last-modified")}
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, etag, last_modified, headers, body, size, validated_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, json.dumps(headers), body, len(body), now, now)
+            )
+            self._conn.commit()
+
+        self.prune()
+
+    def _build_response(self, url: str, cached: Dict) -> requests.Response:
+        """Rebuild a Response object from a cached entry."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers.update(cached["headers"])
+        response._content = cached["body"]
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+    def invalidate(self, url: str):
+        """
+        Drop the cached copy of a URL.
+
+        Args:
+            url: URL to forget
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self._conn.commit()
+
+    def prune(self):
+        """Evict expired entries, then least recently used ones until under max_bytes."""
+        with self._lock:
+            if self.max_age is not None:
+                self._conn.execute("DELETE FROM responses WHERE validated_at < ?",
+                                   (time.time() - self.max_age,))
+
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                rows = self._conn.execute(
+                    "SELECT url, size FROM responses ORDER BY accessed_at"
+                ).fetchall()
+                evict = []
+                for url, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    evict.append((url,))
+                    total -= size
+                self._conn.executemany("DELETE FROM responses WHERE url = ?", evict)
+
+            self._conn.commit()
+
+    def clear(self):
+        """Drop every cached response, keeping the counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary of hits (304s), misses, bytes saved, entries and bytes stored
+        """
+        with self._lock:
+            entries, stored = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytes_saved": self.bytes_saved,
+                "entries": entries,
+                "bytes": stored
+            }
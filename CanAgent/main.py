@@ -8,24 +8,42 @@ the main execution flow.
 import os
 import time
 import json
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 # Import Notion API integration
 from notion_integration import NotionAPI, NotionHelper
+from ttl_cache import TTLCache
+from fetch_cache import FetchOnceCache
+from http_cache import HTTPCache
+from conference_index import ConferenceIndex
+from parse_pool import ParsePool
+from database_sync import DatabaseSync
+from task_daemon import TaskDaemon
 
 # Import task modules
-from task_modules.task_parser import TaskParser, TaskScheduler
-from task_modules.conference_tracker import ConferenceTracker
-from task_modules.research_article_parser import ResearchArticleParser
+from task_parser import TaskParser, TaskScheduler
+from conference_tracker import ConferenceTracker
+from research_article_parser import ResearchArticleParser
 
 class NotionAgentSystem:
     """
     Main agent system that orchestrates all components.
     """
     
+    # Scraping-heavy task types are capped so they don't crowd out the rest
+    DEFAULT_TASK_TYPE_LIMITS = {"conference": 2, "research": 2}
+    
     def __init__(self, api_key: str, todo_database_id: str, 
-                conference_database_id: str, research_database_id: str):
+                conference_database_id: str, research_database_id: str,
+                read_cache_ttl: Optional[float] = None, sync_store_path: Optional[str] = None,
+                max_workers: int = 1, task_type_limits: Optional[Dict[str, int]] = None,
+                write_behind: bool = False, http_cache_path: Optional[str] = None,
+                parse_workers: int = 0, conference_index_path: Optional[str] = None,
+                conference_staleness: float = 6 * 3600):
         """
         Initialize the Notion Agent System.
         
@@ -34,26 +52,100 @@ class NotionAgentSystem:
             todo_database_id: ID of the todo list database
             conference_database_id: ID of the conference database
             research_database_id: ID of the research article database
+            read_cache_ttl: Seconds to cache page/database reads (None disables caching)
+            sync_store_path: SQLite file for incremental database sync (None disables it)
+            max_workers: Number of tasks to execute concurrently (1 runs them in sequence)
+            task_type_limits: Maximum concurrent tasks per task type (each at least 1)
+            write_behind: Merge task status updates per page and write them in batches
+            http_cache_path: SQLite file for conditional caching of scraped sources (None disables it)
+            parse_workers: Worker processes for parsing scraped pages (0 parses in process)
+            conference_index_path: SQLite file indexing scraped conferences (None disables it)
+            conference_staleness: Seconds indexed conference search results are reused
         """
         # Initialize Notion API
-        self.notion_api = NotionAPI(api_key)
+        cache = TTLCache(ttl=read_cache_ttl) if read_cache_ttl else None
+        self.notion_api = NotionAPI(api_key, cache=cache)
         self.notion_helper = NotionHelper(self.notion_api)
+        self.retry_budget = self.notion_api.retry_policy.budget
+        
+        # Optionally coalesce task status writes; flushed at the end of each run
+        self.write_behind = write_behind
+        if write_behind:
+            self.notion_api.enable_write_behind()
         
         # Store database IDs
         self.todo_database_id = todo_database_id
         self.conference_database_id = conference_database_id
         self.research_database_id = research_database_id
         
+        # Local mirror of the databases, refreshed from last_edited_time deltas
+        self.database_sync = DatabaseSync(self.notion_helper, sync_store_path) if sync_store_path else None
+        
         # Initialize task parser and scheduler
         self.task_parser = TaskParser(self.notion_helper)
-        self.task_scheduler = TaskScheduler(self.notion_helper, self.task_parser)
+        self.task_scheduler = TaskScheduler(self.notion_helper, self.task_parser, self.database_sync)
+        
+        # Topic-independent source feeds are downloaded once per run and shared by all tasks
+        self.fetch_cache = FetchOnceCache()
+        
+        # Scraped sources are revalidated with ETag/Last-Modified instead of re-downloaded
+        self.http_cache = HTTPCache(http_cache_path) if http_cache_path else None
+        
+        # Scraped pages can be parsed in worker processes so concurrent scrapes use every core
+        self.parse_pool = ParsePool(parse_workers) if parse_workers > 0 else None
+        
+        # Conference searches are answered locally while the scraped sources are fresh
+        self.conference_index = ConferenceIndex(conference_index_path, conference_staleness) \
+            if conference_index_path else None
         
         # Initialize task modules
-        self.conference_tracker = ConferenceTracker(self.notion_helper)
-        self.research_parser = ResearchArticleParser(self.notion_helper)
+        self.conference_tracker = ConferenceTracker(self.notion_helper, self.database_sync,
+                                                    fetch_cache=self.fetch_cache,
+                                                    http_cache=self.http_cache,
+                                                    parse_pool=self.parse_pool,
+                                                    conference_index=self.conference_index)
+        self.research_parser = ResearchArticleParser(self.notion_helper, http_cache=self.http_cache,
+                                                     parse_pool=self.parse_pool)
+        
+        # Maximum concurrent Notion requests for independent calls, on one shared pool
+        self.max_concurrency = 10
+        self._page_reader = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                               thread_name_prefix="notion-read")
+        
+        # Task execution pool settings; all workers share the Notion rate limiter
+        self.max_workers = max(1, max_workers)
+        self.task_type_limits = dict(self.DEFAULT_TASK_TYPE_LIMITS if task_type_limits is None
+                                     else task_type_limits)
+        for task_type, limit in self.task_type_limits.items():
+            if limit is not None and limit < 1:
+                raise ValueError(f"Task type limit for {task_type!r} must be at least 1, got {limit}")
         
         # Initialize execution log
         self.log = []
+        self._log_lock = threading.Lock()
+    
+    def close(self):
+        """
+        Flush buffered writes, then shut down the worker pools, local stores
+        and the Notion session.
+        """
+        try:
+            self.flush_writes()
+        finally:
+            self._page_reader.shutdown(wait=True)
+            if self.parse_pool is not None:
+                self.parse_pool.close()
+            for store in (self.http_cache, self.conference_index, self.database_sync):
+                if store is not None:
+                    store.close()
+            self.notion_api.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
     
     def test_connection(self) -> bool:
         """
@@ -68,30 +160,37 @@ class NotionAgentSystem:
         """
         Run the agent system once.
         
+        Returns:
+            List of execution results
+        """
+        # Each run gets a fresh retry budget and fresh source feeds
+        self.retry_budget.reset()
+        self.fetch_cache.clear()
+        
+        try:
+            return self._run_due_tasks()
+        finally:
+            self.flush_writes()
+    
+    def _run_due_tasks(self) -> List[Dict]:
+        """
+        Execute every due task once.
+        
         Returns:
             List of execution results
         """
         results = []
         
         try:
-            # Get all tasks from todo database
-            tasks = self.task_scheduler.get_tasks_from_database(self.todo_database_id)
-            
             # Get tasks due for execution
-            due_tasks = self.task_scheduler.get_due_tasks(tasks)
+            due_tasks = self.task_scheduler.get_due_tasks_from_database(self.todo_database_id)
             
             # Execute each due task
-            for task in due_tasks:
-                result = self.execute_task(task)
-                results.append(result)
-                
-                # Add to log
-                self.log.append({
-                    "timestamp": datetime.now().isoformat(),
-                    "task": task.get("name"),
-                    "type": task.get("type"),
-                    "result": result.get("status")
-                })
+            if self.max_workers > 1 and len(due_tasks) > 1:
+                results = self._run_tasks_concurrently(due_tasks)
+            else:
+                for task in due_tasks:
+                    results.append(self._run_task(task))
             
             return results
         
@@ -104,7 +203,7 @@ class NotionAgentSystem:
             }
             
             # Add to log
-            self.log.append({
+            self._append_log({
                 "timestamp": datetime.now().isoformat(),
                 "task": "System Execution",
                 "type": "system",
@@ -114,6 +213,151 @@ class NotionAgentSystem:
             
             return [error_result]
     
+    def run_daemon(self, refresh_interval: float = 900.0,
+                   sync_store_path: str = "notion_sync.db") -> TaskDaemon:
+        """
+        Run the agent as a long-lived process until interrupted.
+        
+        Args:
+            refresh_interval: Seconds between task list refreshes from Notion
+            sync_store_path: SQLite file for incremental sync, used if the
+                agent was created without one
+            
+        Returns:
+            The daemon that was run
+        """
+        # Refreshes only fetch pages edited since the last one instead of rescanning
+        if self.database_sync is None:
+            self.database_sync = DatabaseSync(self.notion_helper, sync_store_path)
+            self.task_scheduler.database_sync = self.database_sync
+            self.conference_tracker.database_sync = self.database_sync
+        
+        daemon = TaskDaemon(self, refresh_interval=refresh_interval)
+        
+        try:
+            daemon.run_forever()
+        except KeyboardInterrupt:
+            daemon.stop()
+        
+        return daemon
+    
+    def flush_writes(self) -> Dict[str, Dict]:
+        """
+        Send buffered task status writes and log any that failed.
+        
+        Returns:
+            Dictionary mapping page ID to its update result
+        """
+        if not self.write_behind:
+            return {}
+        
+        outcomes = self.notion_api.flush_writes()
+        
+        for page_id, outcome in outcomes.items():
+            if "error" in outcome:
+                self._append_log({
+                    "timestamp": datetime.now().isoformat(),
+                    "task": page_id,
+                    "type": "write",
+                    "result": "Error",
+                    "error": outcome.get("error")
+                })
+        
+        return outcomes
+    
+    def _run_task(self, task: Dict) -> Dict:
+        """
+        Execute a task and record it in the execution log.
+        
+        Args:
+            task: Task dictionary
+            
+        Returns:
+            Execution result
+        """
+        result = self.execute_task(task)
+        
+        # Add to log
+        self._append_log({
+            "timestamp": datetime.now().isoformat(),
+            "task": task.get("name"),
+            "type": task.get("type"),
+            "result": result.get("status")
+        })
+        
+        return result
+    
+    def _run_tasks_concurrently(self, tasks: List[Dict]) -> List[Dict]:
+        """
+        Execute tasks on a worker pool, respecting per-type limits.
+        
+        Tasks are started in order whenever a worker and a slot for their
+        type are free, so a capped type never ties up idle workers.
+        
+        Args:
+            tasks: Tasks to execute
+            
+        Returns:
+            Execution results in the same order as tasks
+        """
+        results = [None] * len(tasks)
+        pending = list(enumerate(tasks))
+        running = {}
+        active_by_type = defaultdict(int)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agent-task") as executor:
+            while pending or running:
+                # Start every pending task that has a free worker and type slot
+                for entry in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    
+                    index, task = entry
+                    task_type = task.get("type")
+                    limit = self.task_type_limits.get(task_type)
+                    if limit is not None and active_by_type[task_type] >= limit:
+                        continue
+                    
+                    pending.remove(entry)
+                    active_by_type[task_type] += 1
+                    running[executor.submit(self._run_task, task)] = (index, task)
+                
+                # Nothing running means nothing will free a slot for what is left
+                if not running:
+                    for index, task in pending:
+                        results[index] = {
+                            "status": "Error",
+                            "message": f"No execution slot for task {task.get('name')} of type {task.get('type')}",
+                            "task_id": task.get("id"),
+                            "result_page_id": None,
+                            "error": "no execution slot"
+                        }
+                    break
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    index, task = running.pop(future)
+                    active_by_type[task.get("type")] -= 1
+                    
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        results[index] = {
+                            "status": "Error",
+                            "message": f"Error executing task {task.get('name')}: {str(e)}",
+                            "task_id": task.get("id"),
+                            "result_page_id": None,
+                            "error": str(e)
+                        }
+        
+        return results
+    
+    def _append_log(self, entry: Dict):
+        """Add an entry to the execution log from any worker thread."""
+        with self._log_lock:
+            self.log.append(entry)
+    
     def execute_task(self, task: Dict) -> Dict:
         """
         Execute a specific task.
@@ -130,7 +374,7 @@ class NotionAgentSystem:
         parameters = task.get("parameters", {})
         
         # Update task status to In Progress
-        self.task_scheduler.update_task_status(task_id, "In Progress")
+        self.task_scheduler.transition_task_status(task, "In Progress", defer=self.write_behind)
         
         try:
             result_page_id = None
@@ -148,7 +392,8 @@ class NotionAgentSystem:
                 raise ValueError(f"Unknown task type: {task_type}")
             
             # Update task status to Complete
-            self.task_scheduler.update_task_status(task_id, "Complete", result_page_id)
+            self.task_scheduler.transition_task_status(task, "Complete", result_page_id,
+                                                       defer=self.write_behind)
             
             return {
                 "status": "Complete",
@@ -159,7 +404,7 @@ class NotionAgentSystem:
         
         except Exception as e:
             # Update task status to Error
-            self.task_scheduler.update_task_status(task_id, "Error")
+            self.task_scheduler.transition_task_status(task, "Error", defer=self.write_behind)
             
             return {
                 "status": "Error",
@@ -186,8 +431,8 @@ class NotionAgentSystem:
         # Search for conferences
         conferences = self.conference_tracker.search_conferences(topics, timeframe)
         
-        # Update conference database
-        updated_ids = self.conference_tracker.update_conference_database(
+        # Update conference database, skipping conferences that haven't changed
+        upsert = self.conference_tracker.update_conference_database(
             self.conference_database_id, conferences
         )
         
@@ -195,8 +440,9 @@ class NotionAgentSystem:
         result_page_id = self._create_result_page(
             task.get("name"),
             "Conference Tracking Results",
-            f"Found and updated {len(conferences)} conferences on topics: {', '.join(topics)}",
-            updated_ids
+            f"Found {len(conferences)} conferences on topics: {', '.join(topics)} "
+            f"({upsert['created']} new, {upsert['updated']} updated, {upsert['unchanged']} unchanged)",
+            upsert["page_ids"]
         )
         
         return result_page_id
@@ -338,9 +584,10 @@ class NotionAgentSystem:
         if related_pages:
             blocks.append(self.notion_helper.create_heading_block("Related Pages", level=2))
             
-            for page_id in related_pages:
-                # Get page details
-                page = self.notion_api.read_page(page_id)
+            # Get page details concurrently
+            pages = self._read_pages(related_pages)
+            
+            for page in pages:
                 page_title = self._get_page_title(page)
                 
                 if page_title:
@@ -356,6 +603,18 @@ class NotionAgentSystem:
         
         return result.get("id")
     
+    def _read_pages(self, page_ids: List[str]) -> List[Dict]:
+        """
+        Read several Notion pages concurrently.
+        
+        Args:
+            page_ids: List of page IDs
+            
+        Returns:
+            Page data in the same order as page_ids
+        """
+        return list(self._page_reader.map(self.notion_api.read_page, page_ids))
+    
     def _get_page_title(self, page: Dict) -> Optional[str]:
         """
         Get the title of a Notion page.
@@ -386,34 +645,49 @@ class NotionAgentSystem:
         Returns:
             List of log entries
         """
-        return self.log
+        with self._log_lock:
+            return list(self.log)
 
 
 # Example usage for testing
 if __name__ == "__main__":
+    import argparse
+    
+    arg_parser = argparse.ArgumentParser(description="Run the Notion Agent System")
+    arg_parser.add_argument("--daemon", action="store_true",
+                            help="Keep running and execute tasks as they become due")
+    arg_parser.add_argument("--refresh-interval", type=float, default=900.0,
+                            help="Seconds between task refreshes in daemon mode")
+    arg_parser.add_argument("--sync-store", default="notion_sync.db",
+                            help="SQLite file for incremental task refreshes in daemon mode")
+    args = arg_parser.parse_args()
+    
     # This would be loaded from environment variables or config in production
     API_KEY = "your_notion_api_key"
     TODO_DATABASE_ID = "your_todo_database_id"
     CONFERENCE_DATABASE_ID = "your_conference_database_id"
     RESEARCH_DATABASE_ID = "your_research_database_id"
     
-    # Initialize the agent system
-    agent = NotionAgentSystem(
+    # Initialize the agent system; closing it shuts down its pools and session
+    with NotionAgentSystem(
         API_KEY,
         TODO_DATABASE_ID,
         CONFERENCE_DATABASE_ID,
         RESEARCH_DATABASE_ID
-    )
-    
-    # Test connection
-    if agent.test_connection():
-        print("Successfully connected to Notion API")
-    else:
-        print("Failed to connect to Notion API")
-        exit(1)
-    
-    # Run the agent
-    results = agent.run()
+    ) as agent:
+        # Test connection
+        if agent.test_connection():
+            print("Successfully connected to Notion API")
+        else:
+            print("Failed to connect to Notion API")
+            exit(1)
+        
+        if args.daemon:
+            agent.run_daemon(args.refresh_interval, args.sync_store)
+            exit(0)
+        
+        # Run the agent
+        results = agent.run()
     
     # Print results
     for result in results:
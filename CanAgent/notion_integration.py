@@ -8,9 +8,18 @@ reading from databases/pages, and writing results back to Notion.
 import os
 import json
 import time
+import asyncio
+import functools
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Iterator, AsyncIterator
+
+from rate_limiter import TokenBucketRateLimiter, get_shared_limiter
+from retry_policy import RetryPolicy
+from ttl_cache import TTLCache
+from write_buffer import WriteBehindBuffer
 
 class NotionAPI:
     """
@@ -19,76 +28,197 @@ class NotionAPI:
     
     BASE_URL = "https://api.notion.com/v1"
     
-    def __init__(self, api_key: str):
+    # Notion allows an average of three requests per second with some bursting
+    RATE_LIMIT_PER_SECOND = 3.0
+    RATE_LIMIT_BURST = 10
+    
+    def __init__(self, api_key: str, pool_connections: int = 4, pool_maxsize: int = 10,
+                 pool_block: bool = False, timeout: Optional[float] = 30.0,
+                 base_url: Optional[str] = None,
+                 rate_limiter: Optional[TokenBucketRateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 cache: Optional[TTLCache] = None):
         """
         Initialize the Notion API client.
         
         Args:
             api_key: Notion API integration token
+            pool_connections: Number of host connection pools to cache
+            pool_maxsize: Maximum number of keep-alive connections per host
+            pool_block: Block when the pool is exhausted instead of opening
+                throwaway connections
+            timeout: Request timeout in seconds (None to wait forever)
+            base_url: Override for the API base URL (e.g. a local fake server)
+            rate_limiter: Token bucket to pace requests with. Defaults to a
+                limiter shared by every client using the same api_key
+            retry_policy: Rules for retrying failed requests
+            cache: Optional read-through cache for read_page and read_database
         """
         self.api_key = api_key
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.timeout = timeout
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Notion-Version": "2022-06-28",  # Update to latest version as needed
             "Content-Type": "application/json"
         }
-        self.rate_limit_remaining = 1000  # Default rate limit
-        self.rate_limit_reset = time.time() + 60  # Default reset time
+        
+        # Rate limits apply per integration token, so share the bucket across instances
+        if rate_limiter is None:
+            rate_limiter = get_shared_limiter(
+                f"notion:{api_key}", self.RATE_LIMIT_PER_SECOND, self.RATE_LIMIT_BURST
+            )
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.cache = cache
+        self.write_buffer = None
+        
+        # Shared keep-alive session so consecutive calls reuse TCP/TLS connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+    
+    def close(self):
+        """Flush buffered writes, then close the session and release pooled connections."""
+        if self.write_buffer is not None:
+            self.write_buffer.close()
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
     
     def _handle_rate_limits(self):
-        """Handle API rate limits by waiting if necessary."""
-        current_time = time.time()
-        if self.rate_limit_remaining <= 1 and current_time < self.rate_limit_reset:
-            sleep_time = self.rate_limit_reset - current_time + 1
-            print(f"Rate limit reached. Waiting for {sleep_time:.2f} seconds...")
-            time.sleep(sleep_time)
+        """Wait for a token from the shared rate limiter."""
+        self.rate_limiter.acquire()
     
     def _update_rate_limits(self, response):
-        """Update rate limit information from response headers."""
-        if "x-ratelimit-remaining" in response.headers:
-            self.rate_limit_remaining = int(response.headers["x-ratelimit-remaining"])
-        if "x-ratelimit-reset-time" in response.headers:
-            self.rate_limit_reset = int(response.headers["x-ratelimit-reset-time"])
+        """Back off the shared rate limiter when Notion reports a 429."""
+        if response.status_code == 429:
+            retry_after = self.retry_policy.parse_retry_after(response.headers)
+            if retry_after is None:
+                retry_after = 1.0
+            print(f"Rate limit reached. Pausing requests for {retry_after:.2f} seconds...")
+            self.rate_limiter.pause(retry_after)
+    
+    def _send(self, method: str, url: str, data: Optional[Dict] = None) -> requests.Response:
+        """Send a single HTTP request over the pooled session."""
+        if method in ("GET", "DELETE"):
+            return self.session.request(method, url, timeout=self.timeout)
+        elif method in ("POST", "PATCH"):
+            return self.session.request(method, url, json=data, timeout=self.timeout)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
     
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
+    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                      idempotent: Optional[bool] = None) -> Dict:
         """
-        Make a request to the Notion API with rate limit handling.
+        Make a request to the Notion API with rate limit handling and retries.
         
         Args:
             method: HTTP method (GET, POST, PATCH, etc.)
             endpoint: API endpoint (without base URL)
             data: Request payload
+            idempotent: Whether the request is safe to repeat. Defaults to a
+                classification by HTTP method
             
         Returns:
             Response data as dictionary
         """
-        self._handle_rate_limits()
+        url = f"{self.base_url}{endpoint}"
+        attempt = 0
         
-        url = f"{self.BASE_URL}{endpoint}"
-        
-        try:
-            if method == "GET":
-                response = requests.get(url, headers=self.headers)
-            elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=data)
-            elif method == "PATCH":
-                response = requests.patch(url, headers=self.headers, json=data)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=self.headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+        while True:
+            self._handle_rate_limits()
+            attempt += 1
+            
+            try:
+                response = self._send(method, url, data)
+            except requests.exceptions.RequestException as e:
+                delay = self.retry_policy.get_retry_delay(method, attempt, error=e, idempotent=idempotent)
+                if delay is None:
+                    print(f"Request error: {str(e)}")
+                    return {"error": str(e)}
+                print(f"Request error: {str(e)}. Retrying in {delay:.2f} seconds...")
+                time.sleep(delay)
+                continue
+            except Exception as e:
+                print(f"Request error: {str(e)}")
+                return {"error": str(e)}
             
             self._update_rate_limits(response)
             
             if response.status_code >= 400:
+                delay = self.retry_policy.get_retry_delay(
+                    method, attempt, status_code=response.status_code,
+                    headers=response.headers, idempotent=idempotent
+                )
+                if delay is not None:
+                    print(f"Error: {response.status_code}. Retrying in {delay:.2f} seconds...")
+                    time.sleep(delay)
+                    continue
+                
                 print(f"Error: {response.status_code} - {response.text}")
                 return {"error": response.text, "status_code": response.status_code}
             
-            return response.json()
+            try:
+                return response.json()
+            except ValueError as e:
+                print(f"Request error: {str(e)}")
+                return {"error": str(e)}
+    
+    def _cache_key(self, kind: str, object_id: str) -> tuple:
+        """Build a cache key that ignores dashes and case in Notion IDs."""
+        return (kind, object_id.replace("-", "").lower())
+    
+    def _cache_store(self, key: tuple, result: Dict):
+        """Store a response as JSON so cached copies can't be mutated by callers."""
+        text = json.dumps(result)
+        self.cache.set(key, text, size=len(text))
+    
+    def _cached_get(self, kind: str, object_id: str, endpoint: str) -> Dict:
+        """
+        GET an object through the read cache, if one is configured.
+        
+        Args:
+            kind: Object kind used in the cache key (page, database)
+            object_id: Notion object ID
+            endpoint: API endpoint (without base URL)
+            
+        Returns:
+            Response data as dictionary
+        """
+        if self.cache is None:
+            return self._make_request("GET", endpoint)
+        
+        key = self._cache_key(kind, object_id)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return json.loads(cached)
         
-        except Exception as e:
-            print(f"Request error: {str(e)}")
-            return {"error": str(e)}
+        result = self._make_request("GET", endpoint)
+        if "error" not in result:
+            self._cache_store(key, result)
+        return result
+    
+    def _invalidate_cache(self, kind: str, object_id: str):
+        """Drop a cached object after it has been modified."""
+        if self.cache is not None:
+            self.cache.invalidate(self._cache_key(kind, object_id))
+    
+    @property
+    def cache_stats(self) -> Optional[Dict[str, int]]:
+        """Read cache counters, or None if caching is disabled."""
+        return self.cache.stats() if self.cache is not None else None
     
     def test_connection(self) -> bool:
         """
@@ -110,11 +240,11 @@ class NotionAPI:
         Returns:
             Database metadata
         """
-        return self._make_request("GET", f"/databases/{database_id}")
+        return self._cached_get("database", database_id, f"/databases/{database_id}")
     
     def query_database(self, database_id: str, filter_params: Optional[Dict] = None, 
                       sorts: Optional[List] = None, start_cursor: Optional[str] = None,
-                      page_size: int = 100) -> Dict:
+                      page_size: int = 100, filter_properties: Optional[List[str]] = None) -> Dict:
         """
         Query a database with optional filters and sorting.
         
@@ -124,6 +254,8 @@ class NotionAPI:
             sorts: Sort criteria
             start_cursor: Pagination cursor
             page_size: Number of results per page
+            filter_properties: Property IDs to return (as given in the database
+                schema); all properties are returned if None
             
         Returns:
             Query results
@@ -141,7 +273,13 @@ class NotionAPI:
         if start_cursor:
             data["start_cursor"] = start_cursor
         
-        return self._make_request("POST", f"/databases/{database_id}/query", data)
+        endpoint = f"/databases/{database_id}/query"
+        if filter_properties:
+            # Property IDs from the schema are already URL-encoded
+            endpoint += "?" + "&".join(f"filter_properties={prop_id}" for prop_id in filter_properties)
+        
+        # Queries only read data, so they are safe to retry despite using POST
+        return self._make_request("POST", endpoint, data, idempotent=True)
     
     def read_page(self, page_id: str) -> Dict:
         """
@@ -153,7 +291,11 @@ class NotionAPI:
         Returns:
             Page content
         """
-        return self._make_request("GET", f"/pages/{page_id}")
+        # Make sure buffered writes to this page are visible to the read
+        if self.write_buffer is not None and self.write_buffer.has_pending(page_id):
+            self.write_buffer.flush([page_id])
+        
+        return self._cached_get("page", page_id, f"/pages/{page_id}")
     
     def get_block_children(self, block_id: str, start_cursor: Optional[str] = None) -> Dict:
         """
@@ -211,7 +353,63 @@ class NotionAPI:
         Returns:
             Updated page data
         """
-        return self._make_request("PATCH", f"/pages/{page_id}", {"properties": properties})
+        result = self._make_request("PATCH", f"/pages/{page_id}", {"properties": properties}, idempotent=True)
+        
+        # Notion returns the full updated page, so refresh the cache rather than just dropping it
+        if self.cache is not None:
+            if "error" in result or result.get("object") != "page":
+                self._invalidate_cache("page", page_id)
+            else:
+                self._cache_store(self._cache_key("page", page_id), result)
+        
+        return result
+    
+    def enable_write_behind(self, max_pending: int = 50, max_delay: float = 5.0) -> WriteBehindBuffer:
+        """
+        Buffer property updates made through queue_page_update.
+        
+        Args:
+            max_pending: Flush once this many pages have pending writes
+            max_delay: Flush at most this many seconds after the first pending write
+            
+        Returns:
+            The write buffer
+        """
+        if self.write_buffer is None:
+            self.write_buffer = WriteBehindBuffer(self, max_pending=max_pending, max_delay=max_delay)
+        return self.write_buffer
+    
+    def queue_page_update(self, page_id: str, properties: Dict) -> Future:
+        """
+        Update page properties through the write-behind buffer, if enabled.
+        
+        Pending patches to the same page are merged into one update_page call.
+        
+        Args:
+            page_id: Notion page ID
+            properties: Updated properties
+            
+        Returns:
+            Future resolved with the update result (already resolved when
+            write-behind is disabled)
+        """
+        if self.write_buffer is None:
+            future = Future()
+            future.set_result(self.update_page(page_id, properties))
+            return future
+        
+        return self.write_buffer.update_page(page_id, properties)
+    
+    def flush_writes(self) -> Dict[str, Dict]:
+        """
+        Send all buffered property updates now.
+        
+        Returns:
+            Dictionary mapping page ID to its update result
+        """
+        if self.write_buffer is None:
+            return {}
+        return self.write_buffer.flush()
     
     def append_blocks(self, block_id: str, children: List[Dict]) -> Dict:
         """
@@ -224,7 +422,11 @@ class NotionAPI:
         Returns:
             Result of append operation
         """
-        return self._make_request("PATCH", f"/blocks/{block_id}/children", {"children": children})
+        # Appending twice would duplicate content, so never replay it blindly
+        result = self._make_request("PATCH", f"/blocks/{block_id}/children", {"children": children},
+                                    idempotent=False)
+        self._invalidate_cache("page", block_id)
+        return result
     
     def update_block(self, block_id: str, block_data: Dict) -> Dict:
         """
@@ -237,7 +439,9 @@ class NotionAPI:
         Returns:
             Updated block data
         """
-        return self._make_request("PATCH", f"/blocks/{block_id}", block_data)
+        result = self._make_request("PATCH", f"/blocks/{block_id}", block_data, idempotent=True)
+        self._invalidate_cache("page", block_id)
+        return result
     
     def delete_block(self, block_id: str) -> Dict:
         """
@@ -249,7 +453,10 @@ class NotionAPI:
         Returns:
             Result of delete operation
         """
-        return self._make_request("DELETE", f"/blocks/{block_id}")
+        result = self._make_request("DELETE", f"/blocks/{block_id}")
+        # Deleting a page's block archives the page itself
+        self._invalidate_cache("page", block_id)
+        return result
 
 
 class NotionHelper:
@@ -257,52 +464,138 @@ class NotionHelper:
     Helper class with utility functions for common Notion operations.
     """
     
-    def __init__(self, api: NotionAPI):
+    def __init__(self, api: NotionAPI, prefetch: bool = True):
         """
         Initialize the helper with a NotionAPI instance.
         
         Args:
             api: NotionAPI instance
+            prefetch: Fetch the next page of paginated results in the
+                background while the current page is being consumed
         """
         self.api = api
+        self.prefetch = prefetch
     
-    def get_all_database_items(self, database_id: str, filter_params: Optional[Dict] = None, 
-                              sorts: Optional[List] = None) -> List[Dict]:
+    def _iter_paginated(self, fetch, error_label: str) -> Iterator[Dict]:
         """
-        Get all items from a database, handling pagination.
+        Yield results from a paginated endpoint, prefetching the next page.
+        
+        Args:
+            fetch: Callable taking a start cursor and returning a response page
+            error_label: Description used in error messages
+            
+        Yields:
+            Result items
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notion-prefetch") \
+            if self.prefetch else None
+        next_page = None
+        
+        try:
+            response = fetch(None)
+            
+            while True:
+                if "error" in response:
+                    print(f"Error fetching {error_label}: {response['error']}")
+                    return
+                
+                start_cursor = response.get("next_cursor")
+                has_more = response.get("has_more", False) and start_cursor
+                
+                # Start fetching the next page before handing out this one
+                if has_more and executor:
+                    next_page = executor.submit(fetch, start_cursor)
+                
+                for item in response.get("results", []):
+                    yield item
+                
+                if not has_more:
+                    return
+                
+                response = next_page.result() if next_page else fetch(start_cursor)
+                next_page = None
+        
+        finally:
+            if next_page:
+                next_page.cancel()
+            if executor:
+                executor.shutdown(wait=False)
+    
+    def iter_database_items(self, database_id: str, filter_params: Optional[Dict] = None,
+                            sorts: Optional[List] = None,
+                            filter_properties: Optional[List[str]] = None) -> Iterator[Dict]:
+        """
+        Yield database items page by page.
         
         Args:
             database_id: Notion database ID
             filter_params: Filter criteria
             sorts: Sort criteria
+            filter_properties: Property IDs to return (all if None)
             
-        Returns:
-            List of all database items
+        Yields:
+            Database items
         """
-        all_items = []
-        has_more = True
-        start_cursor = None
-        
-        while has_more:
-            response = self.api.query_database(
-                database_id, 
+        def fetch(start_cursor):
+            return self.api.query_database(
+                database_id,
                 filter_params=filter_params,
                 sorts=sorts,
-                start_cursor=start_cursor
+                start_cursor=start_cursor,
+                filter_properties=filter_properties
             )
+        
+        return self._iter_paginated(fetch, "database items")
+    
+    def iter_block_children(self, block_id: str) -> Iterator[Dict]:
+        """
+        Yield child blocks page by page.
+        
+        Args:
+            block_id: Notion block ID (can be a page ID)
             
-            if "error" in response:
-                print(f"Error fetching database items: {response['error']}")
-                break
+        Yields:
+            Child blocks
+        """
+        return self._iter_paginated(
+            lambda start_cursor: self.api.get_block_children(block_id, start_cursor),
+            "block children"
+        )
+    
+    def get_all_database_items(self, database_id: str, filter_params: Optional[Dict] = None, 
+                              sorts: Optional[List] = None,
+                              filter_properties: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Get all items from a database, handling pagination.
+        
+        Args:
+            database_id: Notion database ID
+            filter_params: Filter criteria
+            sorts: Sort criteria
+            filter_properties: Property IDs to return (all if None)
             
-            all_items.extend(response.get("results", []))
-            has_more = response.get("has_more", False)
-            start_cursor = response.get("next_cursor")
+        Returns:
+            List of all database items
+        """
+        return list(self.iter_database_items(database_id, filter_params, sorts, filter_properties))
+    
+    def get_property_ids(self, database_id: str, property_names: List[str]) -> Optional[List[str]]:
+        """
+        Look up property IDs by name from a database schema.
+        
+        Args:
+            database_id: Notion database ID
+            property_names: Property names to resolve
             
-            if not has_more or not start_cursor:
-                break
+        Returns:
+            IDs of the properties that exist, or None if the schema can't be read
+        """
+        database = self.api.read_database(database_id)
+        schema = database.get("properties") if "error" not in database else None
+        if not schema:
+            return None
         
-        return all_items
+        return [schema[name]["id"] for name in property_names if name in schema and "id" in schema[name]]
     
     def get_all_block_children(self, block_id: str) -> List[Dict]:
         """
@@ -314,25 +607,7 @@ class NotionHelper:
         Returns:
             List of all child blocks
         """
-        all_blocks = []
-        has_more = True
-        start_cursor = None
-        
-        while has_more:
-            response = self.api.get_block_children(block_id, start_cursor)
-            
-            if "error" in response:
-                print(f"Error fetching block children: {response['error']}")
-                break
-            
-            all_blocks.extend(response.get("results", []))
-            has_more = response.get("has_more", False)
-            start_cursor = response.get("next_cursor")
-            
-            if not has_more or not start_cursor:
-                break
-        
-        return all_blocks
+        return list(self.iter_block_children(block_id))
     
     def create_text_block(self, content: str, block_type: str = "paragraph") -> Dict:
         """
@@ -533,4 +808,270 @@ class NotionHelper:
         Format a date for Notion properties.
         
         Args:
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+            date_value: Date as an ISO string or datetime object
+            include_time: Whether to include the time component
+            
+        Returns:
+            Date property data
+        """
+        if isinstance(date_value, datetime):
+            if include_time:
+                date_str = date_value.isoformat()
+            else:
+                date_str = date_value.strftime("%Y-%m-%d")
+        else:
+            date_str = date_value
+        
+        return {
+            "date": {
+                "start": date_str
+            }
+        }
+
+
+class AsyncNotionAPI:
+    """
+    Asyncio interface to the Notion API.
+    
+    This is not an asyncio-native client: each call runs a blocking NotionAPI
+    method on a bounded thread pool, so calls share its keep-alive session,
+    rate limiter and retry handling while independent round-trips overlap.
+    The pool size is the limit on requests in flight.
+    """
+    
+    def __init__(self, api_key: Optional[str] = None, max_concurrency: int = 10,
+                 api: Optional[NotionAPI] = None, **api_kwargs):
+        """
+        Initialize the async Notion API client.
+        
+        Args:
+            api_key: Notion API integration token (ignored if api is given)
+            max_concurrency: Maximum number of requests in flight at once
+            api: Existing NotionAPI instance to wrap
+            **api_kwargs: Extra arguments for NotionAPI when creating one
+        """
+        if api is None:
+            if api_key is None:
+                raise ValueError("Either api_key or api must be provided")
+            api_kwargs.setdefault("pool_maxsize", max_concurrency)
+            api = NotionAPI(api_key, **api_kwargs)
+            self._owns_api = True
+        else:
+            self._owns_api = False
+        
+        self.api = api
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix="notion")
+    
+    async def _call(self, func, *args, **kwargs) -> Any:
+        """Run a blocking NotionAPI method on the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+    
+    async def close(self):
+        """Shut down the executor and close the wrapped client if we created it."""
+        self._executor.shutdown(wait=True)
+        if self._owns_api:
+            self.api.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+        return False
+    
+    async def test_connection(self) -> bool:
+        """Test the API connection and authentication."""
+        return await self._call(self.api.test_connection)
+    
+    async def read_database(self, database_id: str) -> Dict:
+        """Retrieve database metadata."""
+        return await self._call(self.api.read_database, database_id)
+    
+    async def query_database(self, database_id: str, filter_params: Optional[Dict] = None,
+                             sorts: Optional[List] = None, start_cursor: Optional[str] = None,
+                             page_size: int = 100, filter_properties: Optional[List[str]] = None) -> Dict:
+        """Query a database with optional filters and sorting."""
+        return await self._call(self.api.query_database, database_id, filter_params=filter_params,
+                                sorts=sorts, start_cursor=start_cursor, page_size=page_size,
+                                filter_properties=filter_properties)
+    
+    async def read_page(self, page_id: str) -> Dict:
+        """Retrieve a page's content."""
+        return await self._call(self.api.read_page, page_id)
+    
+    async def get_block_children(self, block_id: str, start_cursor: Optional[str] = None) -> Dict:
+        """Retrieve a block's children blocks."""
+        return await self._call(self.api.get_block_children, block_id, start_cursor)
+    
+    async def create_page(self, parent_id: str, is_database: bool, properties: Dict,
+                          children: Optional[List] = None) -> Dict:
+        """Create a new page."""
+        return await self._call(self.api.create_page, parent_id, is_database, properties, children)
+    
+    async def update_page(self, page_id: str, properties: Dict) -> Dict:
+        """Update page properties."""
+        return await self._call(self.api.update_page, page_id, properties)
+    
+    async def append_blocks(self, block_id: str, children: List[Dict]) -> Dict:
+        """Append blocks to a page or block."""
+        return await self._call(self.api.append_blocks, block_id, children)
+    
+    async def update_block(self, block_id: str, block_data: Dict) -> Dict:
+        """Update a block's content."""
+        return await self._call(self.api.update_block, block_id, block_data)
+    
+    async def delete_block(self, block_id: str) -> Dict:
+        """Delete a block."""
+        return await self._call(self.api.delete_block, block_id)
+
+
+class AsyncNotionHelper(NotionHelper):
+    """
+    Async counterpart of NotionHelper.
+    
+    Block and property builders are inherited unchanged; every helper that
+    calls the API is overridden as a coroutine or async generator.
+    """
+    
+    def __init__(self, api: AsyncNotionAPI):
+        """
+        Initialize the helper with an AsyncNotionAPI instance.
+        
+        Args:
+            api: AsyncNotionAPI instance
+        """
+        # Pages are fetched one after another; AsyncNotionAPI overlaps independent calls instead
+        super().__init__(api, prefetch=False)
+    
+    async def _iter_paginated(self, fetch, error_label: str) -> AsyncIterator[Dict]:
+        """
+        Yield results from a paginated endpoint.
+        
+        Args:
+            fetch: Coroutine function taking a start cursor and returning a response page
+            error_label: Description used in error messages
+            
+        Yields:
+            Result items
+        """
+        start_cursor = None
+        
+        while True:
+            response = await fetch(start_cursor)
+            
+            if "error" in response:
+                print(f"Error fetching {error_label}: {response['error']}")
+                return
+            
+            for item in response.get("results", []):
+                yield item
+            
+            start_cursor = response.get("next_cursor")
+            if not response.get("has_more", False) or not start_cursor:
+                return
+    
+    async def iter_database_items(self, database_id: str, filter_params: Optional[Dict] = None,
+                                  sorts: Optional[List] = None,
+                                  filter_properties: Optional[List[str]] = None) -> AsyncIterator[Dict]:
+        """
+        Yield database items page by page.
+        
+        Args:
+            database_id: Notion database ID
+            filter_params: Filter criteria
+            sorts: Sort criteria
+            filter_properties: Property IDs to return (all if None)
+            
+        Yields:
+            Database items
+        """
+        async def fetch(start_cursor):
+            return await self.api.query_database(
+                database_id,
+                filter_params=filter_params,
+                sorts=sorts,
+                start_cursor=start_cursor,
+                filter_properties=filter_properties
+            )
+        
+        async for item in self._iter_paginated(fetch, "database items"):
+            yield item
+    
+    async def iter_block_children(self, block_id: str) -> AsyncIterator[Dict]:
+        """
+        Yield child blocks page by page.
+        
+        Args:
+            block_id: Notion block ID (can be a page ID)
+            
+        Yields:
+            Child blocks
+        """
+        async for block in self._iter_paginated(
+            lambda start_cursor: self.api.get_block_children(block_id, start_cursor),
+            "block children"
+        ):
+            yield block
+    
+    async def get_all_database_items(self, database_id: str, filter_params: Optional[Dict] = None,
+                                     sorts: Optional[List] = None,
+                                     filter_properties: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Get all items from a database, handling pagination.
+        
+        Args:
+            database_id: Notion database ID
+            filter_params: Filter criteria
+            sorts: Sort criteria
+            filter_properties: Property IDs to return (all if None)
+            
+        Returns:
+            List of all database items
+        """
+        return [item async for item in self.iter_database_items(database_id, filter_params, sorts,
+                                                                filter_properties)]
+    
+    async def get_property_ids(self, database_id: str, property_names: List[str]) -> Optional[List[str]]:
+        """
+        Look up property IDs by name from a database schema.
+        
+        Args:
+            database_id: Notion database ID
+            property_names: Property names to resolve
+            
+        Returns:
+            IDs of the properties that exist, or None if the schema can't be read
+        """
+        database = await self.api.read_database(database_id)
+        schema = database.get("properties") if "error" not in database else None
+        if not schema:
+            return None
+        
+        return [schema[name]["id"] for name in property_names if name in schema and "id" in schema[name]]
+    
+    async def get_all_block_children(self, block_id: str) -> List[Dict]:
+        """
+        Get all children blocks, handling pagination.
+        
+        Args:
+            block_id: Notion block ID (can be a page ID)
+            
+        Returns:
+            List of all child blocks
+        """
+        return [block async for block in self.iter_block_children(block_id)]
+    
+    async def read_pages(self, page_ids: List[str]) -> List[Dict]:
+        """
+        Read several pages concurrently.
+        
+        Args:
+            page_ids: Notion page IDs
+            
+        Returns:
+            Page data in the same order as page_ids
+        """
+        return await asyncio.gather(*(self.api.read_page(page_id) for page_id in page_ids))
@@ -0,0 +1,108 @@
+"""
+Parse Pool
+
+This module runs CPU-bound page parsing in worker processes so that
+concurrent scrapes are not serialised on the GIL. Parse functions must be
+module-level and take and return plain data. If worker processes are not
+available, or the pool breaks, parsing falls back to the calling thread.
+"""
+
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+
+class ParsePool:
+    """
+    Process pool for parsing raw response bodies, with in-process fallback.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the parse pool. Worker processes are started on first use.
+
+        Args:
+            max_workers: Number of worker processes (CPU count if None)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = None
+        self._disabled = False
+        self._lock = threading.Lock()
+        self.offloaded = 0
+        self.fallbacks = 0
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Get the process pool, starting it if needed; None if unavailable."""
+        with self._lock:
+            if self._disabled:
+                return None
+
+            if self._executor is None:
+                try:
+                    # Spawned workers don't inherit locks held by this process's threads
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                except (OSError, NotImplementedError, ValueError) as e:
+                    print(f"Parse pool unavailable, parsing in process: {str(e)}")
+                    self._disabled = True
+                    return None
+
+            return self._executor
+
+    def _disable(self, reason: Exception):
+        """Stop using worker processes after the pool broke."""
+        with self._lock:
+            if not self._disabled:
+                print(f"Parse pool failed, parsing in process: {str(reason)}")
+            self._disabled = True
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, func: Callable, *args) -> Any:
+        """
+        Call a parse function in a worker process, or in this thread as a fallback.
+
+        Args:
+            func: Module-level parse function
+            args: Picklable arguments for the function
+
+        Returns:
+            The function's result
+
+        Raises:
+            Whatever the parse function raised
+        """
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                result = executor.submit(func, *args).result()
+                with self._lock:
+                    self.offloaded += 1
+                return result
+            except BrokenProcessPool as e:
+                self._disable(e)
+            except Exception as e:
+                # Fall back only for values that can't cross the process
+                # boundary; anything else was raised by the parse function
+                if not isinstance(e, pickle.PicklingError) and "pickle" not in str(e):
+                    raise
+
+        with self._lock:
+            self.fallbacks += 1
+        return func(*args)
+
+    def close(self):
+        """Shut down the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,214 @@
+"""
+Rate Limiter
+
+This module provides a thread-safe token-bucket rate limiter used to pace
+requests to external APIs. Limiters can be shared by key so that several
+clients using the same credentials draw from one bucket, and combined per
+host with a concurrency cap to keep scrapers polite.
+"""
+
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucketRateLimiter:
+    """
+    Thread-safe token bucket with burst allowance.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Callers
+    reserve a token under the lock and sleep outside it, so waiters are
+    served in arrival order without busy-waiting.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Average number of tokens added per second
+            burst: Maximum number of tokens that can accumulate
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._waiting = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add tokens accrued since the last refill."""
+        if now > self._last:
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+
+    def _wait_for(self, now: float) -> float:
+        """Seconds until the token balance is non-negative."""
+        wait = max(0.0, -self._tokens / self.rate)
+        if self._last > now:
+            # A pause is in effect; refilling starts when it ends
+            wait += self._last - now
+        return wait
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Take tokens from the bucket, blocking until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = self._wait_for(now)
+            if wait > 0:
+                self._waiting += 1
+
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+
+        return wait
+
+    def pause(self, seconds: float):
+        """
+        Stop handing out tokens for a period, e.g. after a 429 response.
+
+        Args:
+            seconds: How long to pause from now
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._last = max(self._last, now + seconds)
+
+    @property
+    def wait_time(self) -> float:
+        """Seconds a new caller would currently wait for one token."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = self._wait_for(now)
+            self._tokens += 1
+            return wait
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers currently waiting for tokens."""
+        with self._lock:
+            return self._waiting
+
+    @property
+    def available_tokens(self) -> float:
+        """Tokens currently available (negative when callers are queued)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+_shared_limiters: Dict[str, TokenBucketRateLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def get_shared_limiter(key: str, rate: float, burst: int = 1) -> TokenBucketRateLimiter:
+    """
+    Get the process-wide limiter for a key, creating it on first use.
+
+    Keys are hashed so credentials used as keys are not kept in memory.
+
+    Args:
+        key: Identifier of the shared budget (e.g. an API token or host name)
+        rate: Tokens per second if the limiter has to be created
+        burst: Bucket size if the limiter has to be created
+
+    Returns:
+        Shared TokenBucketRateLimiter instance
+    """
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(digest)
+        if limiter is None:
+            limiter = TokenBucketRateLimiter(rate, burst)
+            _shared_limiters[digest] = limiter
+        return limiter
+
+
+class HostRateLimiter:
+    """
+    Per-host politeness scheduler: a shared token bucket and a concurrency cap per host.
+
+    Requests to different hosts never wait on each other, so callers can
+    overlap them freely while each host sees at most its configured rate
+    and number of simultaneous requests.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Dict]] = None, default_rate: float = 1.0,
+                 default_burst: int = 1, default_concurrency: int = 1):
+        """
+        Initialize the host limiter.
+
+        Args:
+            limits: Per-host settings, e.g. {"export.arxiv.org": {"rate": 1/3, "burst": 1, "concurrency": 1}}
+            default_rate: Requests per second for hosts without settings
+            default_burst: Burst size for hosts without settings
+            default_concurrency: Concurrent requests for hosts without settings
+        """
+        self.limits = dict(limits or {})
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.default_concurrency = default_concurrency
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host_state(self, host: str):
+        """Get the (limiter, semaphore) pair for a host, creating it on first use."""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                settings = self.limits.get(host, {})
+                # Buckets are process-wide so every client of a host shares its budget
+                limiter = get_shared_limiter(
+                    f"host:{host}",
+                    settings.get("rate", self.default_rate),
+                    settings.get("burst", self.default_burst)
+                )
+                slots = threading.BoundedSemaphore(settings.get("concurrency", self.default_concurrency))
+                state = (limiter, slots)
+                self._hosts[host] = state
+            return state
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[float]:
+        """
+        Hold a request slot for the URL's host for the duration of a request.
+
+        Args:
+            url: Request URL (or a bare host name)
+
+        Yields:
+            Seconds spent waiting for the rate limit
+        """
+        host = urlparse(url).hostname or url
+        limiter, slots = self._host_state(host)
+
+        with slots:
+            yield limiter.acquire()
+
@@ -0,0 +1,212 @@
+"""
+Relevance Scoring
+
+This module scores candidate research articles against search topics with
+BM25 over their titles and abstracts. All candidates and topics are scored
+in one batch, as NumPy arrays when NumPy is installed and with plain Python
+otherwise, so a topic only keeps articles that actually discuss it.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+# NumPy scores large batches as array operations; plain Python is used without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TOKEN = re.compile(r"[a-z0-9]+")
+
+
+class RelevanceScorer:
+    """
+    Batch BM25 scorer that assigns articles to the topics they are relevant to.
+    """
+
+    # Words too common to say what a topic is about
+    STOP_WORDS = {"a", "an", "and", "as", "at", "by", "for", "from", "in", "into", "of",
+                  "on", "or", "the", "to", "via", "with"}
+
+    def __init__(self, threshold: float = 0.25, top_k: Optional[int] = None,
+                 k1: float = 1.5, b: float = 0.75, title_weight: int = 2):
+        """
+        Initialize the relevance scorer.
+
+        Args:
+            threshold: Minimum normalised score (0 to 1) for an article to be
+                relevant to a topic. Every topic word once in an
+                average-length abstract scores 0.4, a single-word topic in
+                the title about 0.57; an article without the topic's rarest
+                word stays below 0.25 unless the others fill its title
+            top_k: Most articles kept per topic, best first (no limit if None)
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalisation
+            title_weight: Times title words are counted relative to abstract words
+        """
+        self.threshold = threshold
+        self.top_k = top_k
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Split text into lowercase word tokens, folding simple plurals.
+
+        Whole tokens are compared, so "ai" does not match inside "detail".
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of tokens without stop words
+        """
+        tokens = []
+        for token in TOKEN.findall((text or "").lower()):
+            if token in self.STOP_WORDS:
+                continue
+            if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+                token = token[:-1]
+            tokens.append(token)
+        return tokens
+
+    def _document(self, article: Dict) -> List[str]:
+        """Tokens of an article's title, weighted, and abstract."""
+        return (self.tokenize(article.get("title")) * self.title_weight
+                + self.tokenize(article.get("summary")))
+
+    def score(self, documents: List[List[str]], queries: List[List[str]]) -> List[List[float]]:
+        """
+        Score tokenised documents against tokenised queries with BM25.
+
+        Each score is divided by the largest score the whole query could
+        reach, so scores fall between 0 and 1 whatever the corpus. A topic
+        word no candidate contains still counts, with the highest IDF, so
+        a document with only the other words scores low.
+
+        Args:
+            documents: Token lists of the candidate documents
+            queries: Token lists of the queries
+
+        Returns:
+            One row of document scores per query
+        """
+        # Only query terms contribute to a score, so they are the whole vocabulary
+        vocabulary = {}
+        for tokens in queries:
+            for token in tokens:
+                vocabulary.setdefault(token, len(vocabulary))
+
+        if not documents or not vocabulary:
+            return [[0.0] * len(documents) for _ in queries]
+
+        lengths = [len(tokens) for tokens in documents]
+        average_length = sum(lengths) / len(lengths) or 1.0
+
+        if np is not None:
+            return self._score_arrays(documents, queries, vocabulary, lengths, average_length)
+        return self._score_python(documents, queries, vocabulary, lengths, average_length)
+
+    def _idf(self, document_frequency: float, document_count: int) -> float:
+        """BM25 inverse document frequency, kept positive for very common terms."""
+        return math.log1p((document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def _score_arrays(self, documents, queries, vocabulary, lengths, average_length) -> List[List[float]]:
+        """Score every document against every query as NumPy matrix products."""
+        rows = []
+        columns = []
+        for row, tokens in enumerate(documents):
+            for token in tokens:
+                column = vocabulary.get(token)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+
+        frequencies = np.zeros((len(documents), len(vocabulary)))
+        np.add.at(frequencies, (np.array(rows, dtype=int), np.array(columns, dtype=int)), 1)
+
+        document_frequency = (frequencies > 0).sum(axis=0)
+        idf = np.log1p((len(documents) - document_frequency + 0.5) / (document_frequency + 0.5))
+
+        length_norm = self.k1 * (1 - self.b + self.b * np.array(lengths) / average_length)
+        weights = frequencies * (self.k1 + 1) / (frequencies + length_norm[:, None]) * idf
+
+        query_terms = np.zeros((len(queries), len(vocabulary)))
+        for row, tokens in enumerate(queries):
+            query_terms[row, [vocabulary[token] for token in set(tokens)]] = 1
+
+        scores = query_terms @ weights.T
+        best = query_terms @ (idf * (self.k1 + 1))
+        scores = np.divide(scores, best[:, None], out=np.zeros_like(scores), where=best[:, None] > 0)
+        return scores.tolist()
+
+    def _score_python(self, documents, queries, vocabulary, lengths, average_length) -> List[List[float]]:
+        """Score every document against every query in plain Python."""
+        frequencies = [Counter(token for token in tokens if token in vocabulary) for tokens in documents]
+
+        document_frequency = Counter(token for counts in frequencies for token in counts)
+        idf = {token: self._idf(document_frequency[token], len(documents)) for token in vocabulary}
+
+        weights = []
+        for counts, length in zip(frequencies, lengths):
+            length_norm = self.k1 * (1 - self.b + self.b * length / average_length)
+            weights.append({token: count * (self.k1 + 1) / (count + length_norm) * idf[token]
+                            for token, count in counts.items()})
+
+        results = []
+        for tokens in queries:
+            terms = set(tokens)
+            best = sum(idf[token] * (self.k1 + 1) for token in terms)
+            if best <= 0:
+                results.append([0.0] * len(documents))
+                continue
+            results.append([sum(document.get(token, 0.0) for token in terms) / best for document in weights])
+        return results
+
+    def rank(self, articles: List[Dict], topics: List[str]) -> Dict[str, List[int]]:
+        """
+        Rank articles for each topic.
+
+        Args:
+            articles: Candidate article dictionaries with title and summary
+            topics: Topics to rank against
+
+        Returns:
+            Dictionary mapping each topic to the indexes of its relevant
+            articles, best first, at most top_k of them
+        """
+        scores = self.score([self._document(article) for article in articles],
+                            [self.tokenize(topic) for topic in topics])
+
+        ranking = {}
+        for topic, row in zip(topics, scores):
+            relevant = [index for index, score in enumerate(row) if score >= self.threshold]
+            relevant.sort(key=lambda index: row[index], reverse=True)
+            ranking[topic] = relevant[:self.top_k] if self.top_k is not None else relevant
+        return ranking
+
+    def filter_articles(self, articles: List[Dict], topics: List[str]) -> List[Dict]:
+        """
+        Keep articles relevant to at least one topic, tagged with those topics.
+
+        Args:
+            articles: Candidate article dictionaries
+            topics: Topics that were searched for
+
+        Returns:
+            Relevant articles in their original order, each with "topics" set
+            to the topics it ranked for
+        """
+        matched = {}
+        for topic, indexes in self.rank(articles, topics).items():
+            for index in indexes:
+                matched.setdefault(index, []).append(topic)
+
+        relevant = []
+        for index, article in enumerate(articles):
+            if index in matched:
+                relevant.append(dict(article, topics=[topic for topic in topics if topic in matched[index]]))
+        return relevant
@@ -6,26 +6,83 @@ It updates the Notion database with article information.
 """
 
 import requests
-from bs4 import BeautifulSoup
+import io
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
-from typing import List, Dict, Any, Optional
-import time
+import threading
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Set, Tuple, BinaryIO, Iterator
+from xml.etree import ElementTree
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import quote, urlencode
+
+from article_dedup import ArticleDeduplicator
+from rate_limiter import HostRateLimiter
+from relevance import RelevanceScorer
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+OPENSEARCH_NS = "{http://a9.com/-/spec/opensearch/1.1/}"
+ARXIV_NS = "{http://arxiv.org/schemas/atom}"
 
 class ResearchArticleParser:
     """
     Searches for and parses research articles on games and AI.
     """
     
-    def __init__(self, notion_helper):
+    # Published API limits: arXiv asks for one request every three seconds on a
+    # single connection; Semantic Scholar allows about one unauthenticated request per second
+    HOST_LIMITS = {
+        "export.arxiv.org": {"rate": 1 / 3, "burst": 1, "concurrency": 1},
+        "api.semanticscholar.org": {"rate": 1.0, "burst": 1, "concurrency": 1}
+    }
+    
+    ARXIV_API_URL = "http://export.arxiv.org/api/query"
+    ARXIV_MAX_URL_LENGTH = 2000
+    ARXIV_PAGE_SIZE = 100
+    
+    # arXiv results wanted per topic in a query; "all" pages through every result
+    ARXIV_TOPIC_RESULTS = {"recent": 20, "this_month": 50, "this_year": 100}
+    
+    # Words that already narrow a topic to game or AI papers
+    ARXIV_DOMAIN_WORDS = ("game", "games", "gaming", "ai")
+    
+    def __init__(self, notion_helper, http_cache=None, request_timeout: float = 30.0,
+                 parse_pool=None, host_limiter: Optional[HostRateLimiter] = None,
+                 max_workers: int = 8, arxiv_max_results: Optional[int] = 10000,
+                 relevance_threshold: float = 0.25, max_articles_per_topic: Optional[int] = None):
         """
         Initialize the research article parser.
         
         Args:
             notion_helper: NotionHelper instance for Notion interactions
+            http_cache: Optional HTTPCache used to revalidate source responses
+                instead of downloading them again
+            request_timeout: Timeout in seconds for each HTTP request
+            parse_pool: Optional ParsePool that parses responses in worker processes
+            host_limiter: Per-host rate and concurrency limits for source requests
+                (HOST_LIMITS if None)
+            max_workers: Maximum number of source searches run at once
+            arxiv_max_results: Most arXiv results paged through for one query. It
+                bounds timeframe "all", which otherwise pages until arXiv's
+                reported total (None for no bound)
+            relevance_threshold: Minimum normalised BM25 score (0 to 1) for an
+                article to be kept for a topic
+            max_articles_per_topic: Most articles kept per topic, best first
+                (no limit if None)
         """
         self.notion_helper = notion_helper
+        self.http_cache = http_cache
+        self.request_timeout = request_timeout
+        self.parse_pool = parse_pool
+        self.host_limiter = host_limiter or HostRateLimiter(self.HOST_LIMITS)
+        self.max_workers = max_workers
+        self.arxiv_max_results = arxiv_max_results
+        self.deduplicator = ArticleDeduplicator()
+        self.relevance = RelevanceScorer(threshold=relevance_threshold, top_k=max_articles_per_topic)
+        self._database_locks = defaultdict(threading.Lock)
+        self._database_locks_lock = threading.Lock()
         self.sources = [
             "https://arxiv.org/",
             "https://scholar.google.com/",
@@ -48,22 +105,66 @@ class ResearchArticleParser:
         """
         all_articles = []
         
-        for topic in topics:
-            # Search arXiv
-            arxiv_articles = self._search_arxiv(topic, timeframe)
-            all_articles.extend(arxiv_articles)
-            
-            # Search Semantic Scholar
-            semantic_articles = self._search_semantic_scholar(topic, timeframe)
-            all_articles.extend(semantic_articles)
-            
-            # Add delay to avoid rate limiting
-            time.sleep(1)
+        # Run the batched arXiv queries and per-topic Semantic Scholar searches at
+        # once; the host limiter spaces requests to each host instead of sleeping
+        searches = [(self._search_arxiv_group, group) for group in self._plan_arxiv_queries(topics)]
+        searches += [(self._search_semantic_scholar, topic) for topic in topics]
+        
+        if searches:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(searches)))) as executor:
+                for articles in executor.map(lambda job: job[0](job[1], timeframe), searches):
+                    all_articles.extend(articles)
         
-        # Remove duplicates based on title and URL
+        # Merge the same paper found by several sources, topics or versions
         unique_articles = self._remove_duplicates(all_articles)
         
-        return unique_articles
+        # Score every candidate against every topic at once; each article
+        # keeps the topics it is relevant to and irrelevant ones are dropped
+        return self.relevance.filter_articles(unique_articles, topics)
+    
+    def _http_get(self, url: str, headers: Optional[Dict] = None) -> requests.Response:
+        """
+        GET a source URL, through the HTTP cache if there is one.
+        
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+            
+        Returns:
+            Response
+        """
+        with self.host_limiter.slot(url):
+            if self.http_cache:
+                return self.http_cache.get(url, headers=headers, timeout=self.request_timeout)
+            return requests.get(url, headers=headers, timeout=self.request_timeout)
+    
+    @contextmanager
+    def _http_stream(self, url: str, stream: bool = True) -> Iterator[requests.Response]:
+        """
+        GET a source URL whose body is read inside the with block.
+        
+        The host slot is held until the block exits and the response is
+        closed, so a streamed body counts against the host's connection limit
+        for as long as it is being read.
+        
+        Args:
+            url: URL to fetch
+            stream: Leave the body unread so it can be parsed as it arrives
+                (ignored by the HTTP cache, which reads whole bodies)
+            
+        Yields:
+            Response
+        """
+        with self.host_limiter.slot(url):
+            if self.http_cache:
+                response = self.http_cache.get(url, timeout=self.request_timeout)
+            else:
+                response = requests.get(url, timeout=self.request_timeout, stream=stream)
+            
+            try:
+                yield response
+            finally:
+                response.close()
     
     def _search_arxiv(self, topic: str, timeframe: str) -> List[Dict]:
         """
@@ -76,86 +177,250 @@ class ResearchArticleParser:
         Returns:
             List of article information dictionaries
         """
-        articles = []
+        return self._search_arxiv_group([topic], timeframe)
+    
+    def _arxiv_clause(self, topic: str) -> Optional[str]:
+        """
+        Build the arXiv query clause for one topic.
         
-        try:
-            # Format the search URL
-            search_query = f"{topic.replace(' ', '+')}"
-            if "game" not in search_query.lower() and "ai" not in search_query.lower():
-                search_query += "+AND+(game+OR+AI)"
-            
-            # Set sorting based on timeframe
-            sort_by = "submittedDate"
-            if timeframe == "recent":
-                max_results = 20
-            elif timeframe == "this_month":
-                max_results = 50
-            else:
-                max_results = 100
+        Every topic word must match; topics that mention neither games nor AI
+        are narrowed to game or AI papers.
+        
+        Args:
+            topic: Topic to search for
             
-            search_url = f"http://export.arxiv.org/api/query?search_query=all:{search_query}&start=0&max_results={max_results}&sortBy={sort_by}&sortOrder=descending"
+        Returns:
+            Parenthesised clause, or None if the topic has no searchable words
+        """
+        words = [word for word in re.findall(r"[\w\-]+", topic)]
+        if not words:
+            return None
+        
+        clause = " AND ".join(f"all:{word}" for word in words)
+        if not any(word.lower() in self.ARXIV_DOMAIN_WORDS for word in words):
+            clause += " AND (all:game OR all:AI)"
+        
+        return f"({clause})"
+    
+    def _arxiv_url(self, topics: List[str], start: int, max_results: int) -> str:
+        """Build an arXiv API query URL that ORs the clauses of several topics."""
+        query = " OR ".join(self._arxiv_clause(topic) for topic in topics)
+        return f"{self.ARXIV_API_URL}?" + urlencode({
+            "search_query": query,
+            "start": start,
+            "max_results": max_results,
+            "sortBy": "submittedDate",
+            "sortOrder": "descending"
+        }, quote_via=quote)
+    
+    def _plan_arxiv_queries(self, topics: List[str]) -> List[List[str]]:
+        """
+        Group topics into as few arXiv queries as the URL length limit allows.
+        
+        Args:
+            topics: Topics to search for
             
-            # Send request
-            response = requests.get(search_url)
-            if response.status_code != 200:
-                print(f"Error searching arXiv: {response.status_code}")
-                return articles
+        Returns:
+            Topic groups, one per query
+        """
+        groups = []
+        current = []
+        
+        for topic in dict.fromkeys(topics):
+            if not self._arxiv_clause(topic):
+                continue
             
-            # Parse XML
-            soup = BeautifulSoup(response.text, 'xml')
+            if current and len(self._arxiv_url(current + [topic], 0, self.ARXIV_PAGE_SIZE)) > self.ARXIV_MAX_URL_LENGTH:
+                groups.append(current)
+                current = []
+            current.append(topic)
+        
+        if current:
+            groups.append(current)
+        
+        return groups
+    
+    def _timeframe_start(self, timeframe: str) -> Optional[str]:
+        """Earliest publication date a timeframe keeps, or None for no bound."""
+        now = datetime.now()
+        if timeframe == "recent":
+            return (now - timedelta(days=30)).strftime("%Y-%m-%d")
+        if timeframe == "this_month":
+            return now.strftime("%Y-%m-01")
+        if timeframe == "this_year":
+            return now.strftime("%Y-01-01")
+        return None
+    
+    def _matches_arxiv_clause(self, topic: str, words: Set[str]) -> bool:
+        """
+        Check whether an entry matches a topic's arXiv query clause.
+        
+        arXiv doesn't say which clause of an OR query an entry matched, so
+        the clause is applied again to the entry's title and abstract words.
+        
+        Args:
+            topic: Topic whose clause to apply
+            words: Tokens of the entry's title and abstract
             
-            # Find entries
-            entries = soup.find_all('entry')
+        Returns:
+            True if every topic word, and game or AI if the clause adds it, occurs
+        """
+        terms = set(self.relevance.tokenize(topic))
+        if not terms or not terms <= words:
+            return False
+        
+        domain = set(self.relevance.tokenize(" ".join(self.ARXIV_DOMAIN_WORDS)))
+        return bool(terms & domain or words & domain)
+    
+    def _search_arxiv_group(self, topics: List[str], timeframe: str) -> List[Dict]:
+        """
+        Search arXiv for several topics with one paged OR query.
+        
+        Each entry is counted towards the topics whose clause it matches, so
+        a topic with many results can't fill the query's share of a rarer
+        one. Results are newest first, and paging stops once every topic has
+        its quota (ARXIV_TOPIC_RESULTS), at the first entry older than the
+        timeframe, when arXiv runs out of results, or at arxiv_max_results.
+        Each page is parsed while it is read, but the articles are returned
+        as one list: duplicates and relevance are settled later, over every
+        source's results, so they are all held by then anyway.
+        
+        Args:
+            topics: Topics to search for
+            timeframe: Time range to search
             
-            for entry in entries:
-                # Extract article details
-                title_elem = entry.find('title')
-                title = title_elem.text.strip() if title_elem else ""
-                
-                # Skip if title doesn't contain relevant keywords
-                if not self._is_relevant(title, topic):
-                    continue
-                
-                # Extract other details
-                url_elem = entry.find('id')
-                url = url_elem.text.strip() if url_elem else ""
-                
-                published_elem = entry.find('published')
-                published = published_elem.text.strip() if published_elem else ""
-                
-                summary_elem = entry.find('summary')
-                summary = summary_elem.text.strip() if summary_elem else ""
-                
-                # Extract authors
-                author_elems = entry.find_all('author')
-                authors = [author.find('name').text.strip() for author in author_elems if author.find('name')]
-                
-                # Parse date
-                pub_date = self._parse_date(published)
-                
-                # Filter by timeframe if needed
-                if timeframe != "all" and not self._is_in_timeframe(pub_date, timeframe):
-                    continue
-                
-                # Create article entry
-                article = {
-                    "title": title,
-                    "url": url,
-                    "authors": authors,
-                    "publication_date": pub_date,
-                    "summary": summary,
-                    "source": "arXiv",
-                    "topics": [topic],
-                    "publication": "arXiv"
-                }
+        Returns:
+            List of article information dictionaries
+        """
+        articles = []
+        
+        quota = self.ARXIV_TOPIC_RESULTS.get(timeframe)
+        received = dict.fromkeys(topics, 0)
+        max_results = self.arxiv_max_results
+        earliest = self._timeframe_start(timeframe)
+        
+        start = 0
+        try:
+            while max_results is None or start < max_results:
+                page_size = self.ARXIV_PAGE_SIZE if max_results is None \
+                    else min(self.ARXIV_PAGE_SIZE, max_results - start)
+                url = self._arxiv_url(topics, start, page_size)
+                with self._http_stream(url, stream=not self.parse_pool) as response:
+                    if response.status_code != 200:
+                        print(f"Error searching arXiv: {response.status_code}")
+                        break
+                    
+                    feed = {}
+                    if self.parse_pool:
+                        # Parse in a worker process; the whole page crosses back at once
+                        entries, feed["total_results"] = self.parse_pool.run(_parse_arxiv_in_worker, response.content)
+                    else:
+                        # Articles are built while the rest of the page is still being read
+                        entries = self._iter_arxiv_feed(self._response_stream(response), feed)
+                    
+                    count = 0
+                    last_date = None
+                    for entry in entries:
+                        count += 1
+                        last_date = entry.get("publication_date") or last_date
+                        article = self._make_arxiv_article(entry, topics, timeframe)
+                        if not article:
+                            continue
+                        
+                        # Keep entries for topics still short of their quota
+                        words = set(self.relevance.tokenize(f"{article['title']} {article['summary']}"))
+                        wanted = [topic for topic in topics if (quota is None or received[topic] < quota)
+                                  and self._matches_arxiv_clause(topic, words)]
+                        for topic in wanted:
+                            received[topic] += 1
+                        if wanted:
+                            articles.append(article)
                 
-                articles.append(article)
-            
-            return articles
+                start += count
+                if count < page_size or start >= feed.get("total_results", start + 1):
+                    break
+                if earliest and last_date and last_date < earliest:
+                    break
+                if quota is not None and all(received[topic] >= quota for topic in topics):
+                    break
         
         except Exception as e:
             print(f"Error searching arXiv: {str(e)}")
-            return articles
+        
+        return articles
+    
+    def _response_stream(self, response: requests.Response) -> BinaryIO:
+        """Get a response body as a binary stream, without reading it if it is still unread."""
+        if response.raw is not None and not response._content_consumed:
+            response.raw.decode_content = True
+            return response.raw
+        return io.BytesIO(response.content)
+    
+    def _make_arxiv_article(self, entry: Dict, topics: List[str], timeframe: str) -> Optional[Dict]:
+        """
+        Turn a parsed arXiv entry into a candidate article.
+        
+        Topics are reassigned by relevance scoring once every source has
+        been searched.
+        
+        Args:
+            entry: Entry fields from _iter_arxiv_feed
+            topics: Topics of the query the entry came from
+            timeframe: Time range to keep
+            
+        Returns:
+            Article dictionary, or None if it is out of the timeframe
+        """
+        if timeframe != "all" and not self._is_in_timeframe(entry.get("publication_date"), timeframe):
+            return None
+        
+        return {
+            "title": entry.get("title", ""),
+            "url": entry.get("url", ""),
+            "authors": entry.get("authors", []),
+            "publication_date": entry.get("publication_date"),
+            "summary": entry.get("summary", ""),
+            "doi": entry.get("doi"),
+            "source": "arXiv",
+            "topics": list(topics),
+            "publication": "arXiv"
+        }
+    
+    def _iter_arxiv_feed(self, source: BinaryIO, feed: Dict) -> Iterator[Dict]:
+        """
+        Stream entries out of an arXiv API Atom response.
+        
+        Each <entry> is yielded as soon as it is complete and then dropped
+        from the tree, so memory stays flat however large the page is.
+        
+        Args:
+            source: Binary stream of the response body
+            feed: Dictionary that receives "total_results" for the query
+                once the feed header has been read
+            
+        Yields:
+            Entry dictionaries with title, url, publication_date, summary, doi and authors
+        """
+        for _, elem in ElementTree.iterparse(source):
+            if elem.tag == OPENSEARCH_NS + "totalResults":
+                text = (elem.text or "").strip()
+                feed["total_results"] = int(text) if text.isdigit() else 0
+            
+            elif elem.tag == ATOM_NS + "entry":
+                authors = [name.text.strip() for name in elem.iterfind(f"{ATOM_NS}author/{ATOM_NS}name")
+                           if name.text]
+                
+                yield {
+                    "title": (elem.findtext(ATOM_NS + "title") or "").strip(),
+                    "url": (elem.findtext(ATOM_NS + "id") or "").strip(),
+                    "publication_date": self._parse_date((elem.findtext(ATOM_NS + "published") or "").strip()),
+                    "summary": (elem.findtext(ATOM_NS + "summary") or "").strip(),
+                    "doi": (elem.findtext(ARXIV_NS + "doi") or "").strip() or None,
+                    "authors": authors
+                }
+                
+                # Empty finished entries so the tree never holds the whole page
+                elem.clear()
     
     def _search_semantic_scholar(self, topic: str, timeframe: str) -> List[Dict]:
         """
@@ -182,13 +447,13 @@ class ResearchArticleParser:
             if timeframe == "this_year":
                 year_filter = f"&year={current_year}"
             
-            search_url = f"https://api.semanticscholar.org/graph/v1/paper/search?query={search_query}&limit=20&fields=title,url,abstract,authors,year,venue{year_filter}"
+            search_url = f"https://api.semanticscholar.org/graph/v1/paper/search?query={search_query}&limit=20&fields=title,url,abstract,authors,year,venue,externalIds{year_filter}"
             
             # Send request
             headers = {
                 "Accept": "application/json"
             }
-            response = requests.get(search_url, headers=headers)
+            response = self._http_get(search_url, headers=headers)
             if response.status_code != 200:
                 print(f"Error searching Semantic Scholar: {response.status_code}")
                 return articles
@@ -200,15 +465,12 @@ class ResearchArticleParser:
                 # Extract article details
                 title = paper.get("title", "")
                 
-                # Skip if title doesn't contain relevant keywords
-                if not self._is_relevant(title, topic):
-                    continue
-                
                 # Extract other details
                 url = paper.get("url", "")
                 abstract = paper.get("abstract", "")
                 year = paper.get("year")
                 venue = paper.get("venue", "")
+                external_ids = paper.get("externalIds") or {}
                 
                 # Extract authors
                 authors = [author.get("name", "") for author in paper.get("authors", [])]
@@ -227,6 +489,8 @@ class ResearchArticleParser:
                     "authors": authors,
                     "publication_date": pub_date,
                     "summary": abstract,
+                    "doi": external_ids.get("DOI"),
+                    "arxiv_id": external_ids.get("ArXiv"),
                     "source": "Semantic Scholar",
                     "topics": [topic],
                     "publication": venue
@@ -240,47 +504,6 @@ class ResearchArticleParser:
             print(f"Error searching Semantic Scholar: {str(e)}")
             return articles
     
-    def _is_relevant(self, title: str, topic: str) -> bool:
-        """
-        Check if an article title is relevant to the search topic.
-        
-        Args:
-            title: Article title
-            topic: Search topic
-            
-        Returns:
-            True if relevant, False otherwise
-        """
-        # Convert to lowercase for case-insensitive matching
-        title_lower = title.lower()
-        topic_lower = topic.lower()
-        
-        # Check if topic keywords are in the title
-        topic_keywords = topic_lower.split()
-        
-        # Check if any topic keyword is in the title
-        for keyword in topic_keywords:
-            if keyword in title_lower:
-                return True
-        
-        # Check if title contains "game" or "AI" related terms
-        game_terms = ["game", "gaming", "gameplay", "player", "ludology"]
-        ai_terms = ["ai", "artificial intelligence", "machine learning", "neural", "deep learning"]
-        
-        has_game_term = any(term in title_lower for term in game_terms)
-        has_ai_term = any(term in title_lower for term in ai_terms)
-        
-        # If topic is about games, require game term
-        if any(term in topic_lower for term in game_terms):
-            return has_game_term
-        
-        # If topic is about AI, require AI term
-        if any(term in topic_lower for term in ai_terms):
-            return has_ai_term
-        
-        # Otherwise, require either game or AI term
-        return has_game_term or has_ai_term
-    
     def _parse_date(self, date_str: str) -> Optional[str]:
         """
         Parse a date string into ISO format.
@@ -349,7 +572,10 @@ class ResearchArticleParser:
     
     def _remove_duplicates(self, articles: List[Dict]) -> List[Dict]:
         """
-        Remove duplicate articles based on title and URL.
+        Merge articles that describe the same paper.
+        
+        Entries sharing an arXiv id (any version), DOI or normalised title
+        are merged; see ArticleDeduplicator.
         
         Args:
             articles: List of article dictionaries
@@ -357,52 +583,7 @@ class ResearchArticleParser:
         Returns:
             Deduplicated list of articles
         """
-        unique_articles = {}
-        
-        for article in articles:
-            # Create a key based on title
-            title = article.get("title", "").lower()
-            if not title:
-                continue
-            
-            key = title
-            
-            # If this is a new article or has more complete information, keep it
-            if key not in unique_articles or self._is_more_complete(article, unique_articles[key]):
-                unique_articles[key] = article
-            else:
-                # Merge topics if this is a duplicate with different topics
-                existing_topics = set(unique_articles[key].get("topics", []))
-                new_topics = set(article.get("topics", []))
-                unique_articles[key]["topics"] = list(existing_topics.union(new_topics))
-        
-        return list(unique_articles.values())
-    
-    def _is_more_complete(self, article1: Dict, article2: Dict) -> bool:
-        """
-        Check if article1 has more complete information than article2.
-        
-        Args:
-            article1: First article dictionary
-            article2: Second article dictionary
-            
-        Returns:
-            True if article1 is more complete, False otherwise
-        """
-        # Count non-None values in each article
-        count1 = sum(1 for v in article1.values() if v is not None and v != "")
-        count2 = sum(1 for v in article2.values() if v is not None and v != "")
-        
-        # Check if article1 has a summary and article2 doesn't
-        has_summary1 = article1.get("summary") is not None and article1.get("summary") != ""
-        has_summary2 = article2.get("summary") is not None and article2.get("summary") != ""
-        
-        if has_summary1 and not has_summary2:
-            return True
-        elif not has_summary1 and has_summary2:
-            return False
-        
-        return count1 > count2
+        return self.deduplicator.deduplicate(articles)
     
     def generate_summary(self, article_data: Dict) -> str:
         """
@@ -448,5 +629,166 @@ class ResearchArticleParser:
         
         topics = article_data.get("topics", [])
         if topics:
-          
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+            summary += ", ".join(topics)
+        else:
+            summary += "games and AI research"
+        
+        summary += "."
+        
+        return summary
+    
+    def _database_lock(self, database_id: str) -> threading.Lock:
+        """Get the lock serialising reads and writes of one Notion database."""
+        with self._database_locks_lock:
+            return self._database_locks[database_id]
+    
+    def update_article_database(self, database_id: str, articles: List[Dict]) -> List[str]:
+        """
+        Update Notion database with article information.
+        
+        Updates of the same database run one at a time, so overlapping tasks
+        don't both create a page for a new article.
+        
+        Args:
+            database_id: Notion database ID
+            articles: List of article dictionaries
+            
+        Returns:
+            List of updated/created page IDs
+        """
+        updated_ids = []
+        
+        with self._database_lock(database_id):
+            try:
+                # Get existing articles from database
+                existing_articles = self.notion_helper.get_all_database_items(database_id)
+                existing_map = {}
+                
+                # Create a map of existing articles by title
+                for article in existing_articles:
+                    title = self._get_property_value(article, "Title", "title")
+                    if title:
+                        existing_map[title] = article
+                
+                # Update or create articles
+                for article in articles:
+                    article_title = article.get("title")
+                    if not article_title:
+                        continue
+                    
+                    try:
+                        if article_title in existing_map:
+                            # Update existing article
+                            page_id = existing_map[article_title].get("id")
+                            result = self.notion_helper.api.update_page(
+                                page_id, self._create_article_properties(article, include_title=False)
+                            )
+                            if "error" not in result:
+                                updated_ids.append(page_id)
+                        else:
+                            # Create new article
+                            result = self.notion_helper.api.create_page(
+                                database_id, True, self._create_article_properties(article)
+                            )
+                            if "error" not in result and result.get("id"):
+                                updated_ids.append(result.get("id"))
+                                existing_map[article_title] = result
+                    
+                    except Exception as e:
+                        print(f"Error updating article {article_title}: {str(e)}")
+            
+            except Exception as e:
+                print(f"Error updating article database: {str(e)}")
+        
+        return updated_ids
+    
+    def _create_article_properties(self, article: Dict, include_title: bool = True) -> Dict:
+        """
+        Create Notion properties for an article.
+        
+        Args:
+            article: Article dictionary
+            include_title: Whether to set the Title property
+            
+        Returns:
+            Notion page properties
+        """
+        properties = {}
+        
+        if include_title:
+            properties["Title"] = {
+                "title": [
+                    {
+                        "text": {
+                            "content": article.get("title") or "Untitled Article"
+                        }
+                    }
+                ]
+            }
+        
+        if article.get("authors"):
+            authors = article["authors"]
+            if isinstance(authors, list):
+                authors = ", ".join(authors)
+            properties["Authors"] = {
+                "rich_text": [
+                    {
+                        "text": {
+                            "content": authors[:2000]
+                        }
+                    }
+                ]
+            }
+        
+        if article.get("url"):
+            properties["URL"] = {
+                "url": article["url"]
+            }
+        
+        if article.get("summary"):
+            properties["Abstract"] = {
+                "rich_text": [
+                    {
+                        "text": {
+                            "content": article["summary"][:2000]  # Notion field limit
+                        }
+                    }
+                ]
+            }
+        
+        return properties
+    
+    def _get_property_value(self, page: Dict, property_name: str, property_type: str) -> Any:
+        """
+        Extract property value from a Notion page.
+        
+        Args:
+            page: Notion page dictionary
+            property_name: Name of the property
+            property_type: Type of the property (title, rich_text, etc.)
+            
+        Returns:
+            Property value or None if not found
+        """
+        try:
+            properties = page.get("properties", {})
+            property_data = properties.get(property_name, {})
+            
+            if property_type == "title" or property_type == "rich_text":
+                text_items = property_data.get(property_type, [])
+                if text_items:
+                    return text_items[0].get("text", {}).get("content")
+            elif property_type == "url":
+                return property_data.get("url")
+            
+            return None
+        
+        except Exception:
+            return None
+
+
+def _parse_arxiv_in_worker(xml: bytes) -> Tuple[List[Dict], int]:
+    """Parse an arXiv response in a ParsePool worker process."""
+    feed = {}
+    entries = list(ResearchArticleParser(None)._iter_arxiv_feed(io.BytesIO(xml), feed))
+    return entries, feed.get("total_results", 0)
@@ -0,0 +1,187 @@
+"""
+Retry Policy
+
+This module decides whether and when a failed HTTP request should be retried.
+It implements exponential backoff with full jitter, honours Retry-After, only
+replays non-idempotent requests when the server cannot have acted on them, and
+caps the total number of retries per run with a shared budget.
+"""
+
+import random
+import threading
+from typing import Dict, Optional
+
+import requests
+
+
+class RetryBudget:
+    """
+    Thread-safe cap on the number of retries spent during one run.
+    """
+
+    def __init__(self, max_retries: int = 50):
+        """
+        Initialize the retry budget.
+
+        Args:
+            max_retries: Retries allowed before reset() is called again
+        """
+        self.max_retries = max_retries
+        self._spent = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self) -> bool:
+        """
+        Take one retry from the budget.
+
+        Returns:
+            True if a retry was available, False if the budget is exhausted
+        """
+        with self._lock:
+            if self._spent >= self.max_retries:
+                return False
+            self._spent += 1
+            return True
+
+    def reset(self):
+        """Restore the full budget, e.g. at the start of a run."""
+        with self._lock:
+            self._spent = 0
+
+    @property
+    def remaining(self) -> int:
+        """Retries left in the budget."""
+        with self._lock:
+            return self.max_retries - self._spent
+
+
+class RetryPolicy:
+    """
+    Retry rules for HTTP requests.
+    """
+
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.5, max_delay: float = 30.0,
+                 budget: Optional[RetryBudget] = None):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts: Maximum number of attempts per request, including the first
+            base_delay: Backoff delay before the first retry in seconds
+            max_delay: Upper bound for any single delay in seconds
+            budget: Retry budget shared across requests (a new one by default)
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def is_idempotent(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        """
+        Decide whether a request may safely be sent more than once.
+
+        Args:
+            method: HTTP method
+            idempotent: Explicit override from the caller
+
+        Returns:
+            True if the request is idempotent
+        """
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.IDEMPOTENT_METHODS
+
+    def is_retryable(self, method: str, status_code: Optional[int] = None,
+                     error: Optional[Exception] = None, idempotent: Optional[bool] = None) -> bool:
+        """
+        Decide whether a failure is worth retrying.
+
+        Args:
+            method: HTTP method
+            status_code: Response status code, if a response was received
+            error: Exception raised while sending, if any
+            idempotent: Explicit idempotency override from the caller
+
+        Returns:
+            True if the request should be retried
+        """
+        safe = self.is_idempotent(method, idempotent)
+
+        if error is not None:
+            # A connect failure means the server never saw the request
+            if isinstance(error, (requests.exceptions.ConnectTimeout, requests.exceptions.SSLError)):
+                return True
+            if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                return safe
+            return False
+
+        if status_code == 429:
+            # Rate-limited requests were rejected before being processed
+            return True
+        return safe and status_code in self.RETRY_STATUSES
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter.
+
+        Args:
+            attempt: Number of attempts already made (1 for the first retry)
+
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def parse_retry_after(self, headers: Optional[Dict]) -> Optional[float]:
+        """
+        Read a Retry-After header given in seconds.
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            Delay in seconds, or None if absent or malformed
+        """
+        if not headers:
+            return None
+        value = headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return None
+
+    def get_retry_delay(self, method: str, attempt: int, status_code: Optional[int] = None,
+                        headers: Optional[Dict] = None, error: Optional[Exception] = None,
+                        idempotent: Optional[bool] = None) -> Optional[float]:
+        """
+        Get the delay before the next attempt, spending from the budget.
+
+        Args:
+            method: HTTP method
+            attempt: Number of attempts already made
+            status_code: Response status code, if a response was received
+            headers: Response headers, if a response was received
+            error: Exception raised while sending, if any
+            idempotent: Explicit idempotency override from the caller
+
+        Returns:
+            Seconds to wait before retrying, or None if the request should not be retried
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if not self.is_retryable(method, status_code, error, idempotent):
+            return None
+        if not self.budget.try_spend():
+            print("Retry budget exhausted; not retrying")
+            return None
+
+        retry_after = self.parse_retry_after(headers)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return self.backoff(attempt)
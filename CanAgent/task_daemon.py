@@ -0,0 +1,205 @@
+"""
+Task Daemon
+
+This module runs the agent as a long-lived process. Tasks are kept in a
+min-heap keyed by their next run time; the daemon sleeps until the earliest
+task is due, executes it, and re-enqueues recurring tasks, refreshing the
+task list from Notion on a fixed interval.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class TaskDaemon:
+    """
+    Long-running scheduler driven by a due-time priority queue.
+    """
+
+    def __init__(self, agent, refresh_interval: float = 900.0):
+        """
+        Initialize the daemon.
+
+        Args:
+            agent: NotionAgentSystem used to load and execute tasks
+            refresh_interval: Seconds between task list refreshes from Notion.
+                Refreshes are incremental when the agent has a sync store,
+                which NotionAgentSystem.run_daemon always provides
+        """
+        self.agent = agent
+        self.task_scheduler = agent.task_scheduler
+        self.refresh_interval = refresh_interval
+        self._heap = []  # (due timestamp, sequence, task id, version)
+        self._tasks = {}
+        self._versions = {}
+        self._running = set()
+        self._sequence = itertools.count()
+        self._stop_event = threading.Event()
+
+    def _due_timestamp(self, task: Dict) -> Optional[float]:
+        """
+        Get when a task should next run.
+
+        Args:
+            task: Parsed task dictionary
+
+        Returns:
+            Unix timestamp, or None if the task should not be scheduled
+        """
+        # One-off tasks are done once complete; recurring ones come back at Next Run
+        if task.get("status") == "Complete" and task.get("frequency", "Once") == "Once":
+            return None
+
+        next_run = task.get("next_run")
+        if not next_run:
+            return time.time()
+
+        try:
+            return datetime.strptime(next_run, "%Y-%m-%d").timestamp()
+        except (ValueError, TypeError):
+            # Same fallback as get_due_tasks: unparseable dates are due now
+            return time.time()
+
+    def schedule(self, task: Dict):
+        """
+        Add or replace a task in the queue.
+
+        Args:
+            task: Parsed task dictionary
+        """
+        task_id = task.get("id")
+        if not task_id or task_id in self._running:
+            return
+
+        # Bumping the version turns any older heap entry for this task into a no-op
+        version = self._versions.get(task_id, 0) + 1
+        self._versions[task_id] = version
+
+        due = self._due_timestamp(task)
+        if due is None:
+            self._tasks.pop(task_id, None)
+            return
+
+        self._tasks[task_id] = task
+        heapq.heappush(self._heap, (due, next(self._sequence), task_id, version))
+
+        # Drop stale entries once they dominate the heap
+        if len(self._heap) > 2 * len(self._tasks) + 16:
+            self._heap = [entry for entry in self._heap if self._versions.get(entry[2]) == entry[3]
+                          and entry[2] in self._tasks]
+            heapq.heapify(self._heap)
+
+    def refresh(self):
+        """Reload tasks from the todo database and requeue them."""
+        tasks = self.task_scheduler.get_tasks_from_database(self.agent.todo_database_id)
+        for task in tasks:
+            self.schedule(task)
+
+    def _pop_due(self, now: float) -> List[Dict]:
+        """Remove and return every task due at or before now."""
+        due_tasks = []
+
+        while self._heap and self._heap[0][0] <= now:
+            _, _, task_id, version = heapq.heappop(self._heap)
+            if self._versions.get(task_id) != version or task_id not in self._tasks:
+                continue
+            due_tasks.append(self._tasks.pop(task_id))
+
+        return due_tasks
+
+    def _requeue(self, task: Dict, result: Dict):
+        """
+        Schedule the next occurrence of a task after it ran.
+
+        Args:
+            task: Task that was executed
+            result: Execution result
+        """
+        next_run = self.task_scheduler.compute_next_run(task.get("frequency", "Once"))
+        if next_run is None:
+            # One-off tasks that failed are picked up again by the next refresh
+            return
+
+        # Mirror what transition_task_status wrote to Notion (date precision)
+        task = dict(task)
+        task["status"] = result.get("status")
+        task["next_run"] = next_run.strftime("%Y-%m-%d")
+        self.schedule(task)
+
+    def seconds_until_next(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds until the earliest queued task is due.
+
+        Returns:
+            Delay in seconds, or None if the queue is empty
+        """
+        now = now or time.time()
+        while self._heap:
+            due, _, task_id, version = self._heap[0]
+            if self._versions.get(task_id) == version and task_id in self._tasks:
+                return max(0.0, due - now)
+            heapq.heappop(self._heap)
+        return None
+
+    def run_once(self) -> List[Dict]:
+        """
+        Execute every task that is currently due.
+
+        Returns:
+            Execution results
+        """
+        due_tasks = self._pop_due(time.time())
+        if not due_tasks:
+            return []
+
+        self._running.update(task["id"] for task in due_tasks)
+        try:
+            if self.agent.max_workers > 1 and len(due_tasks) > 1:
+                results = self.agent._run_tasks_concurrently(due_tasks)
+            else:
+                results = [self.agent._run_task(task) for task in due_tasks]
+        finally:
+            self._running.difference_update(task["id"] for task in due_tasks)
+
+        for task, result in zip(due_tasks, results):
+            self._requeue(task, result)
+
+        return results
+
+    def run_forever(self):
+        """Run until stop() is called."""
+        print("Task daemon started")
+        next_refresh = 0.0
+
+        while not self._stop_event.is_set():
+            now = time.time()
+
+            if now >= next_refresh:
+                try:
+                    self.refresh()
+                except Exception as e:
+                    print(f"Error refreshing tasks: {str(e)}")
+                next_refresh = now + self.refresh_interval
+
+            self.agent.retry_budget.reset()
+            self.agent.fetch_cache.clear()
+            for result in self.run_once():
+                print(f"Task {result.get('task_id')}: {result.get('status')} - {result.get('message')}")
+            self.agent.flush_writes()
+
+            # Sleep until the next task is due or the next refresh, whichever comes first
+            wait = next_refresh - time.time()
+            until_next = self.seconds_until_next()
+            if until_next is not None:
+                wait = min(wait, until_next)
+            self._stop_event.wait(max(0.0, wait))
+
+        print("Task daemon stopped")
+
+    def stop(self):
+        """Ask run_forever to return after the current iteration."""
+        self._stop_event.set()
@@ -13,6 +13,10 @@ class TaskParser:
     Parses todo items from Notion and identifies task types and parameters.
     """
     
+    # Todo database properties read by parse_todo_item
+    PROPERTY_NAMES = ["Name", "Type", "Parameters", "Status", "Last Run",
+                      "Next Run", "Frequency", "Result Page"]
+    
     def __init__(self, notion_helper):
         """
         Initialize the task parser.
@@ -221,16 +225,19 @@ class TaskScheduler:
     Schedules tasks based on priority and due dates.
     """
     
-    def __init__(self, notion_helper, task_parser):
+    def __init__(self, notion_helper, task_parser, database_sync=None):
         """
         Initialize the task scheduler.
         
         Args:
             notion_helper: NotionHelper instance for Notion interactions
             task_parser: TaskParser instance for parsing tasks
+            database_sync: Optional DatabaseSync used to fetch only changed items
         """
         self.notion_helper = notion_helper
         self.task_parser = task_parser
+        self.database_sync = database_sync
+        self._property_ids = {}
     
     def get_tasks_from_database(self, database_id: str) -> List[Dict]:
         """
@@ -242,8 +249,13 @@ class TaskScheduler:
         Returns:
             List of parsed tasks
         """
-        # Get all items from database
-        items = self.notion_helper.get_all_database_items(database_id)
+        # Get all items from database, fetching only changes when syncing incrementally
+        if self.database_sync:
+            self.database_sync.sync(database_id)
+            items = self.database_sync.get_items(database_id)
+        else:
+            # Stream items so parsing overlaps with fetching the next page
+            items = self.notion_helper.iter_database_items(database_id)
         
         # Parse each item
         tasks = []
@@ -253,6 +265,62 @@ class TaskScheduler:
         
         return tasks
     
+    def build_due_filter(self, today: Optional[datetime] = None) -> Dict:
+        """
+        Build a Notion query filter matching the conditions in get_due_tasks.
+        
+        Args:
+            today: Reference date (defaults to now)
+            
+        Returns:
+            Notion filter object
+        """
+        today = today or datetime.now()
+        
+        return {
+            "and": [
+                {"property": "Status", "select": {"does_not_equal": "Complete"}},
+                {
+                    "or": [
+                        {"property": "Next Run", "date": {"is_empty": True}},
+                        {"property": "Next Run", "date": {"on_or_before": today.strftime("%Y-%m-%d")}}
+                    ]
+                }
+            ]
+        }
+    
+    def get_due_tasks_from_database(self, database_id: str) -> List[Dict]:
+        """
+        Get tasks that are due for execution, filtering on the Notion side.
+        
+        Only candidate pages and the properties parse_todo_item reads are
+        fetched. The local get_due_tasks check still runs on the results
+        as a fallback for dates Notion and Python interpret differently.
+        
+        Args:
+            database_id: Notion database ID
+            
+        Returns:
+            List of due tasks
+        """
+        # The local mirror is already complete, so filter it in memory
+        if self.database_sync:
+            return self.get_due_tasks(self.get_tasks_from_database(database_id))
+        
+        if database_id not in self._property_ids:
+            self._property_ids[database_id] = self.notion_helper.get_property_ids(
+                database_id, self.task_parser.PROPERTY_NAMES
+            )
+        
+        items = self.notion_helper.iter_database_items(
+            database_id,
+            filter_params=self.build_due_filter(),
+            filter_properties=self._property_ids[database_id]
+        )
+        
+        tasks = [self.task_parser.parse_todo_item(item) for item in items]
+        return self.get_due_tasks(tasks)
+    
     def get_due_tasks(self, tasks: List[Dict]) -> List[Dict]:
         """
         Get tasks that are due for execution.
@@ -289,38 +357,51 @@ class TaskScheduler:
         
         return due_tasks
     
-    def update_task_status(self, task_id: str, status: str, result_page_id: Optional[str] = None) -> Dict:
+    def compute_next_run(self, frequency: Optional[str], now: Optional[datetime] = None) -> Optional[datetime]:
         """
-        Update task status and schedule next run.
+        Calculate the next run time for a recurring task.
         
         Args:
-            task_id: Notion page ID of the task
+            frequency: Task frequency (Daily, Weekly, Monthly, Quarterly, Yearly, Once)
+            now: Reference time (defaults to now)
+            
+        Returns:
+            Next run time, or None if the task does not recur
+        """
+        now = now or datetime.now()
+        
+        if frequency == "Daily":
+            return now + timedelta(days=1)
+        elif frequency == "Weekly":
+            return now + timedelta(weeks=1)
+        elif frequency == "Monthly":
+            return now + timedelta(days=30)
+        elif frequency == "Quarterly":
+            return now + timedelta(days=90)
+        elif frequency == "Yearly":
+            return now + timedelta(days=365)
+        
+        return None
+    
+    def build_status_properties(self, task: Dict, status: str,
+                                result_page_id: Optional[str] = None) -> Dict:
+        """
+        Build the properties for a status update and schedule the next run.
+        
+        Args:
+            task: Parsed task dictionary (only its frequency is used)
             status: New status (In Progress, Complete, Error)
             result_page_id: ID of the result page
             
         Returns:
-            Result of update operation
+            Notion page properties
         """
-        # Calculate next run date based on frequency
-        task_page = self.notion_helper.api.read_page(task_id)
-        task = self.task_parser.parse_todo_item(task_page)
-        
         now = datetime.now()
         next_run = None
         
+        # Calculate next run date based on frequency
         if status != "Complete" or task.get("frequency") != "Once":
-            frequency = task.get("frequency", "Once")
-            
-            if frequency == "Daily":
-                next_run = now + timedelta(days=1)
-            elif frequency == "Weekly":
-                next_run = now + timedelta(weeks=1)
-            elif frequency == "Monthly":
-                next_run = now + timedelta(days=30)
-            elif frequency == "Quarterly":
-                next_run = now + timedelta(days=90)
-            elif frequency == "Yearly":
-                next_run = now + timedelta(days=365)
+            next_run = self.compute_next_run(task.get("frequency", "Once"), now)
         
         # Create properties to update
         properties = {
@@ -352,5 +433,62 @@ class TaskScheduler:
                 ]
             }
         
+        return properties
+    
+    def transition_task_status(self, task: Dict, status: str,
+                               result_page_id: Optional[str] = None, defer: bool = False) -> Any:
+        """
+        Move an already-parsed task to a new status without re-reading it.
+        
+        "In Progress" only touches Status, since Last Run and Next Run are
+        written by the final Complete/Error transition anyway. Executing a
+        task therefore costs two PATCHes and no reads.
+        
+        Args:
+            task: Parsed task dictionary
+            status: New status (In Progress, Complete, Error)
+            result_page_id: ID of the result page
+            defer: Queue the update in the API's write-behind buffer so it
+                can be merged with later transitions of the same task
+            
+        Returns:
+            Result of update operation, or a Future for it when deferred
+        """
+        if status == "In Progress":
+            properties = {
+                "Status": {
+                    "select": {
+                        "name": status
+                    }
+                }
+            }
+        else:
+            properties = self.build_status_properties(task, status, result_page_id)
+        
+        if defer:
+            return self.notion_helper.api.queue_page_update(task.get("id"), properties)
+        
+        return self.notion_helper.api.update_page(task.get("id"), properties)
+    
+    def update_task_status(self, task_id: str, status: str, result_page_id: Optional[str] = None) -> Dict:
+        """
+        Update task status and schedule next run.
+        
+        Reads the task from Notion first; use transition_task_status when
+        the parsed task is already at hand.
+        
+        Args:
+            task_id: Notion page ID of the task
+            status: New status (In Progress, Complete, Error)
+            result_page_id: ID of the result page
+            
+        Returns:
+            Result of update operation
+        """
+        task_page = self.notion_helper.api.read_page(task_id)
+        task = self.task_parser.parse_todo_item(task_page)
+        
+        properties = self.build_status_properties(task, status, result_page_id)
+        
         # Update the task
         return self.notion_helper.api.update_page(task_id, properties)
@@ -0,0 +1,94 @@
+"""
+Test Script for research article deduplication
+
+This script checks which article entries ArticleDeduplicator treats as the
+same paper and how it merges them.
+"""
+
+from article_dedup import ArticleDeduplicator
+
+
+def titles(articles):
+    return [article["title"] for article in articles]
+
+
+def test_arxiv_versions_are_one_paper():
+    merged = ArticleDeduplicator().deduplicate([
+        {"title": "Agents for Roguelike Games", "url": "http://arxiv.org/abs/2601.01234v1"},
+        {"title": "Learning Agents for Roguelike Games", "url": "https://arxiv.org/pdf/2601.01234v2"},
+    ])
+
+    assert len(merged) == 1
+
+
+def test_arxiv_id_is_read_from_every_form():
+    dedup = ArticleDeduplicator()
+
+    assert dedup.arxiv_id({"arxiv_id": "2601.01234v3"}) == "2601.01234"
+    assert dedup.arxiv_id({"arxiv_id": "arXiv:cs/0112017"}) == "cs/0112017"
+    assert dedup.arxiv_id({"url": "https://arxiv.org/abs/2601.01234v2"}) == "2601.01234"
+    assert dedup.arxiv_id({"doi": "10.48550/arXiv.2601.01234"}) == "2601.01234"
+    assert dedup.arxiv_id({"url": "https://doi.org/10.48550/arXiv.2601.01234"}) == "2601.01234"
+    assert dedup.arxiv_id({"doi": "10.1109/CoG.2026.001"}) is None
+
+
+def test_arxiv_doi_matches_the_preprint():
+    merged = ArticleDeduplicator().deduplicate([
+        {"title": "Agents for Roguelike Games", "url": "http://arxiv.org/abs/2601.01234v1", "summary": "Abstract."},
+        {"title": "Roguelike Agents", "doi": "10.48550/arXiv.2601.01234", "source": "Semantic Scholar"},
+    ])
+
+    assert len(merged) == 1
+    assert merged[0]["source"] == "Semantic Scholar"
+
+
+def test_titles_differing_in_punctuation_case_and_accents_match():
+    dedup = ArticleDeduplicator()
+    merged = dedup.deduplicate([
+        {"title": "Pokémon Battles: A Benchmark for Game-Playing Agents"},
+        {"title": "POKEMON BATTLES — a benchmark for game playing agents."},
+        {"title": "Pokemon  Battles a Benchmark for Game Playing Agents"},
+    ])
+
+    assert len(merged) == 1
+    assert dedup.normalize_title("Ｐｏｋéｍｏｎ") == "pokemon"
+
+
+def test_shared_doi_joins_entries_transitively():
+    # The first and last entries share no key, but each shares one with the middle entry
+    merged = ArticleDeduplicator().deduplicate([
+        {"title": "Player Modeling in Strategy Games", "url": "http://arxiv.org/abs/2602.04321v1"},
+        {"title": "Modeling Players of Strategy Games", "arxiv_id": "2602.04321", "doi": "10.1145/3600000.1"},
+        {"title": "Strategy Game Player Models", "url": "https://doi.org/10.1145/3600000.1"},
+        {"title": "Level Generation for Platformer Games"},
+    ])
+
+    assert len(merged) == 2
+    assert merged[0]["doi"] == "10.1145/3600000.1"
+    assert merged[1]["title"] == "Level Generation for Platformer Games"
+
+
+def test_different_papers_stay_apart():
+    articles = [
+        {"title": "Level Generation for Platformer Games", "url": "http://arxiv.org/abs/2601.01234v1"},
+        {"title": "Level Generation for Puzzle Games", "url": "http://arxiv.org/abs/2601.04321v1"},
+        {"title": "Level Generation for Platformer Games (Extended)", "doi": "10.1109/CoG.2026.001"},
+    ]
+
+    assert titles(ArticleDeduplicator().deduplicate(articles)) == titles(articles)
+
+
+def test_merge_keeps_the_most_complete_fields():
+    merged = ArticleDeduplicator().deduplicate([
+        {"title": "Imitation Learning for Roguelikes", "url": "http://arxiv.org/abs/2603.00001v1",
+         "authors": ["A. Author"], "topics": ["imitation learning"]},
+        {"title": "Imitation Learning for Roguelikes", "summary": "We learn from demonstrations.",
+         "authors": ["A. Author", "B. Author"], "publication": "CoG", "topics": ["roguelike games"]},
+        {"title": ""},
+    ])
+
+    assert len(merged) == 1
+    assert merged[0]["summary"] == "We learn from demonstrations."
+    assert merged[0]["url"] == "http://arxiv.org/abs/2603.00001v1"
+    assert merged[0]["authors"] == ["A. Author", "B. Author"]
+    assert merged[0]["topics"] == ["imitation learning", "roguelike games"]
@@ -0,0 +1,122 @@
+"""
+Test Script for paged arXiv searches
+
+This script serves generated arXiv Atom pages to ResearchArticleParser in
+place of the arXiv API and checks how grouped topic queries are paged.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+import pytest
+
+from research_article_parser import ResearchArticleParser
+
+
+class FakeResponse:
+    status_code = 200
+    raw = None
+
+    def __init__(self, content):
+        self.content = content
+
+
+def feed(entries, total):
+    """Build an arXiv Atom response holding entries."""
+    body = "".join(
+        "<entry>"
+        f"<id>http://arxiv.org/abs/2610.{index:05d}v1</id>"
+        f"<published>{published}T12:00:00Z</published>"
+        f"<title>{escape(title)}</title>"
+        f"<summary>{escape(summary)}</summary>"
+        "<author><name>A. Author</name></author>"
+        "</entry>"
+        for index, (title, summary, published) in entries
+    )
+    return (
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+        f"<opensearch:totalResults>{total}</opensearch:totalResults>{body}</feed>"
+    ).encode()
+
+
+@pytest.fixture
+def arxiv(monkeypatch):
+    """Parser whose arXiv queries page through the entries the test puts in arxiv.results."""
+    parser = ResearchArticleParser(None)
+    parser.ARXIV_PAGE_SIZE = 5
+    parser.ARXIV_TOPIC_RESULTS = {"recent": 3}
+    parser.results = []
+    parser.requests = 0
+
+    @contextmanager
+    def http_stream(url, stream=True):
+        query = parse_qs(urlparse(url).query)
+        start, size = int(query["start"][0]), int(query["max_results"][0])
+        parser.requests += 1
+        page = list(enumerate(parser.results))[start:start + size]
+        yield FakeResponse(feed(page, len(parser.results)))
+
+    monkeypatch.setattr(parser, "_http_stream", http_stream)
+    return parser
+
+
+def days_ago(days):
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def game_ai(days=1):
+    return ("Game AI Agents", "Agents for games.", days_ago(days))
+
+
+def poker(days=1):
+    return ("Poker Solvers", "Solving poker as a game.", days_ago(days))
+
+
+def test_pages_until_a_rare_topic_gets_its_quota(arxiv):
+    arxiv.results = [game_ai()] * 12 + [poker()] * 2 + [game_ai()] * 8 + [poker()] + [game_ai()] * 7
+
+    articles = arxiv._search_arxiv_group(["game AI", "poker"], "recent")
+
+    titles = [article["title"] for article in articles]
+    assert titles.count("Game AI Agents") == 3
+    assert titles.count("Poker Solvers") == 3
+    # The third poker entry is the 23rd result, on the fifth page
+    assert arxiv.requests == 5
+
+
+def test_stops_once_every_topic_has_its_quota(arxiv):
+    arxiv.results = [game_ai(), poker()] * 20
+
+    articles = arxiv._search_arxiv_group(["game AI", "poker"], "recent")
+
+    assert len(articles) == 6
+    assert arxiv.requests == 2
+
+
+def test_stops_at_the_timeframe_boundary(arxiv):
+    arxiv.results = [game_ai()] * 5 + [game_ai(days=60)] * 20
+
+    articles = arxiv._search_arxiv_group(["game AI", "poker"], "recent")
+
+    assert len(articles) == 3
+    assert arxiv.requests == 2
+
+
+def test_all_pages_through_every_result(arxiv):
+    arxiv.results = [game_ai(days=400)] * 12
+
+    assert len(arxiv._search_arxiv_group(["game AI"], "all")) == 12
+    assert arxiv.requests == 3
+
+
+def test_topic_clause_is_matched_on_whole_words():
+    parser = ResearchArticleParser(None)
+    words = set(parser.relevance.tokenize("Solving Poker with Search"))
+
+    assert parser._matches_arxiv_clause("poker", words | {"game"})
+    # Clauses for topics without game or AI words also need one of them
+    assert not parser._matches_arxiv_clause("poker", words)
+    assert parser._matches_arxiv_clause("poker games", words | {"game"})
+    assert not parser._matches_arxiv_clause("poker bots", words | {"game"})
@@ -0,0 +1,86 @@
+"""
+Test Script for the async Notion client
+
+This script runs AsyncNotionAPI and AsyncNotionHelper against the local fake
+Notion server and checks that the agent system shuts down its pools.
+"""
+
+import asyncio
+
+import pytest
+
+from fake_notion_server import FakeNotionServer
+from main import NotionAgentSystem
+from notion_integration import AsyncNotionAPI, AsyncNotionHelper, NotionAPI
+from rate_limiter import TokenBucketRateLimiter
+
+
+def make_async_api(server, max_concurrency=4):
+    """Create an AsyncNotionAPI pointed at the fake server."""
+    limiter = TokenBucketRateLimiter(rate=1000, burst=100)
+    return AsyncNotionAPI("test-token", max_concurrency=max_concurrency,
+                          base_url=server.base_url, rate_limiter=limiter)
+
+
+def test_async_helper_paginates_database_items():
+    async def main():
+        async with make_async_api(server) as api:
+            return await AsyncNotionHelper(api).get_all_database_items("db")
+
+    with FakeNotionServer(total_items=250) as server:
+        items = asyncio.run(main())
+
+    assert len(items) == 250
+    assert items[0]["id"] == "db-0"
+    assert items[-1]["id"] == "db-249"
+
+
+def test_async_helper_reads_pages_in_order():
+    page_ids = [f"page-{i}" for i in range(8)]
+
+    async def main():
+        async with make_async_api(server) as api:
+            return await AsyncNotionHelper(api).read_pages(page_ids)
+
+    with FakeNotionServer() as server:
+        pages = asyncio.run(main())
+
+    assert [page["id"] for page in pages] == page_ids
+
+
+def test_async_helper_api_methods_are_coroutines():
+    async def main():
+        async with make_async_api(server) as api:
+            helper = AsyncNotionHelper(api)
+            await api.append_blocks("page", [helper.create_text_block("Hello")])
+            blocks = await helper.get_all_block_children("page")
+            property_ids = await helper.get_property_ids("db", ["Name"])
+            return blocks, property_ids
+
+    with FakeNotionServer() as server:
+        blocks, property_ids = asyncio.run(main())
+
+    assert len(blocks) == 1
+    # The fake database has no schema to resolve names from
+    assert property_ids is None
+
+
+def test_async_api_leaves_a_wrapped_client_open():
+    with FakeNotionServer() as server:
+        with NotionAPI("test-token", base_url=server.base_url) as api:
+            async def main():
+                async with AsyncNotionAPI(api=api) as async_api:
+                    await async_api.read_page("page")
+
+            asyncio.run(main())
+            page = api.read_page("page")
+
+    assert page["id"] == "page"
+
+
+def test_agent_close_shuts_down_page_reader():
+    with NotionAgentSystem("test-token", "todo", "conference", "research") as agent:
+        pass
+
+    with pytest.raises(RuntimeError):
+        agent._page_reader.submit(print)
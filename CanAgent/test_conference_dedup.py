@@ -0,0 +1,100 @@
+"""
+Test Script for conference deduplication
+
+This script checks ConferenceDeduplicator's acronym extraction and which
+scraped conference entries it merges.
+"""
+
+from conference_dedup import ConferenceDeduplicator
+
+
+def conference(name, start_date="2026-07-12", **fields):
+    return dict({"name": name, "start_date": start_date}, **fields)
+
+
+def names(conferences):
+    return [conf["name"] for conf in conferences]
+
+
+def test_explicit_acronyms_drop_years_and_organisations():
+    dedup = ConferenceDeduplicator()
+
+    assert dedup.explicit_acronyms("ICML 2026") == {"ICML"}
+    assert dedup.explicit_acronyms("AAAI-26") == {"AAAI"}
+    assert dedup.explicit_acronyms("NeurIPS 2026") == {"NEURIPS"}
+    assert dedup.explicit_acronyms("IEEE CoG 2026") == {"COG"}
+
+
+def test_capitalised_names_are_not_acronyms():
+    dedup = ConferenceDeduplicator()
+
+    assert dedup.explicit_acronyms("INTERNATIONAL CONFERENCE ON ROBOTICS AND AUTOMATION") == set()
+    assert dedup.explicit_acronyms("THE WEB CONFERENCE 2026 (WWW)") == {"WWW"}
+    # Generic words are never acronyms, even in an otherwise mixed-case name
+    assert dedup.explicit_acronyms("ANNUAL Meeting on Games") == set()
+
+
+def test_derived_acronym_skips_short_words():
+    dedup = ConferenceDeduplicator()
+
+    assert dedup.derived_acronym("International Conference on Machine Learning") == "ICML"
+    assert dedup.derived_acronym("Game Jam") is None
+
+
+def test_acronym_matches_full_name():
+    merged = ConferenceDeduplicator().deduplicate([
+        conference("ICML 2026", url="https://icml.cc"),
+        conference("International Conference on Machine Learning", location="Seoul"),
+    ])
+
+    assert len(merged) == 1
+    assert merged[0]["url"] == "https://icml.cc"
+    assert merged[0]["location"] == "Seoul"
+
+
+def test_capitalised_names_of_different_events_stay_separate():
+    conferences = [
+        conference("INTERNATIONAL CONFERENCE ON ROBOTICS AND AUTOMATION"),
+        conference("INTERNATIONAL CONFERENCE ON NURSING EDUCATION"),
+    ]
+
+    assert names(ConferenceDeduplicator().deduplicate(conferences)) == names(conferences)
+
+
+def test_capitalised_full_name_still_matches_its_acronym():
+    merged = ConferenceDeduplicator().deduplicate([
+        conference("ICRA 2026"),
+        conference("INTERNATIONAL CONFERENCE ON ROBOTICS AND AUTOMATION"),
+    ])
+
+    assert names(merged) == ["ICRA 2026"]
+
+
+def test_co_located_workshop_is_kept_apart_from_its_host():
+    conferences = [conference("ICML 2026"), conference("ICML 2026 Workshop on Game AI")]
+
+    assert names(ConferenceDeduplicator().deduplicate(conferences)) == names(conferences)
+
+
+def test_same_series_in_different_years_is_kept_apart():
+    conferences = [conference("ICML 2025", "2025-07-13"), conference("ICML 2026", "2026-07-12")]
+
+    assert names(ConferenceDeduplicator().deduplicate(conferences)) == names(conferences)
+
+
+def test_dates_a_few_days_apart_across_months_still_match():
+    merged = ConferenceDeduplicator().deduplicate([
+        conference("Foundations of Digital Games 2026", "2026-06-30"),
+        conference("Foundations of Digital Games", "2026-07-01"),
+    ])
+
+    assert len(merged) == 1
+
+
+def test_merge_keeps_topics_from_every_entry():
+    merged = ConferenceDeduplicator().deduplicate([
+        conference("CoG 2026", topics=["game AI"]),
+        conference("IEEE CoG 2026", topics=["procedural generation", "game AI"]),
+    ])
+
+    assert merged[0]["topics"] == ["game AI", "procedural generation"]
@@ -0,0 +1,74 @@
+"""
+Test Script for the local conference index
+
+This script stores scraped conferences in a ConferenceIndex and checks which
+stored results searches return and when they go stale.
+"""
+
+import time
+
+import pytest
+
+from conference_index import ConferenceIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ConferenceIndex(str(tmp_path / "conferences.db"), max_staleness=60)
+    yield index
+    index.close()
+
+
+def names(conferences):
+    return [conf["name"] for conf in conferences]
+
+
+def test_search_returns_only_the_stored_query(index):
+    index.store("WikiCFP", "game AI", [{"name": "CoG 2026", "topics": ["game AI"]}])
+    index.store("WikiCFP", "AI", [{"name": "AAAI 2026", "topics": ["AI"]}])
+    index.store("Conference Alerts", "game AI", [{"name": "FDG 2026", "topics": ["game AI"]}])
+
+    # "AI" is a word of "game AI", but that search's results are not "AI" results
+    assert names(index.search("WikiCFP", "AI")) == ["AAAI 2026"]
+    assert names(index.search("WikiCFP", "game AI")) == ["CoG 2026"]
+    assert names(index.search("Conference Alerts", "AI")) == []
+
+
+def test_search_tags_results_with_the_query(index):
+    index.store("WikiCFP", "game AI", [{"name": "CoG 2026"}])
+    index.store("AI Deadlines", "", [{"name": "NeurIPS 2026", "topics": []}])
+
+    assert index.search("WikiCFP", "game AI")[0]["topics"] == ["game AI"]
+    assert index.search("AI Deadlines")[0]["topics"] == []
+
+
+def test_store_replaces_earlier_results(index):
+    index.store("WikiCFP", "game AI", [{"name": "CoG 2025"}])
+    index.store("WikiCFP", "game AI", [{"name": "CoG 2026"}])
+
+    assert names(index.search("WikiCFP", "game AI")) == ["CoG 2026"]
+    assert names(index.search_text("CoG")) == ["CoG 2026"]
+
+
+def test_searches_go_stale_after_max_staleness(index):
+    assert not index.is_fresh("WikiCFP", "game AI")
+
+    index.store("WikiCFP", "game AI", [{"name": "CoG 2026"}])
+    assert index.is_fresh("WikiCFP", "game AI")
+    assert not index.is_fresh("WikiCFP", "AI")
+
+    index.max_staleness = 0
+    time.sleep(0.01)
+    assert not index.is_fresh("WikiCFP", "game AI")
+
+
+def test_search_text_matches_names_topics_and_locations(index):
+    index.store("WikiCFP", "game AI", [
+        {"name": "CoG 2026", "topics": ["game AI"], "location": "Lisbon"},
+        {"name": "FDG 2026", "topics": ["game AI"], "location": "Copenhagen"},
+    ])
+
+    results = index.search_text("Lisbon")
+    assert names(results) == ["CoG 2026"]
+    assert results[0]["source"] == "WikiCFP"
+    assert len(index.search_text("game")) == 2
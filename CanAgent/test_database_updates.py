@@ -0,0 +1,81 @@
+"""
+Test Script for Notion database updates
+
+This script runs conference and research database updates, including
+overlapping ones, against the local fake Notion server and checks that no
+page is created twice and no topic is lost.
+"""
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from conference_tracker import ConferenceTracker
+from fake_notion_server import FakeNotionServer
+from notion_integration import NotionHelper
+from research_article_parser import ResearchArticleParser
+from test_retry_policy import make_api
+
+
+def titles(server, database_id, property_name):
+    """Count the titles of the pages created in a fake database."""
+    return Counter(page["properties"][property_name]["title"][0]["text"]["content"]
+                   for page in server.pages.values()
+                   if page["parent"].get("database_id") == database_id)
+
+
+def run_overlapping(update, database_id, batches):
+    """Run one update per batch at the same time."""
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        return list(executor.map(lambda batch: update(database_id, batch), batches))
+
+
+def test_overlapping_conference_updates_create_each_page_once():
+    batches = [
+        [{"name": "ICML 2026", "location": "Seoul"}, {"name": "NeurIPS 2026"}],
+        [{"name": "NeurIPS 2026"}, {"name": "ICML 2026", "location": "Seoul"}, {"name": "CoG 2026"}],
+    ]
+
+    with FakeNotionServer(total_items=0, latency=0.05) as server:
+        with make_api(server) as api:
+            tracker = ConferenceTracker(NotionHelper(api))
+            results = run_overlapping(tracker.update_conference_database, "conferences", batches)
+
+    assert titles(server, "conferences", "Name") == {"ICML 2026": 1, "NeurIPS 2026": 1, "CoG 2026": 1}
+    assert sum(result["created"] for result in results) == 3
+    # Both tasks get the same page for a conference, whichever created it
+    icml, neurips = results[0]["page_ids"]
+    assert results[1]["page_ids"][:2] == [neurips, icml]
+
+
+def test_overlapping_article_updates_create_each_page_once():
+    batches = [
+        [{"title": "Level Generation for Platformer Games"}],
+        [{"title": "Level Generation for Platformer Games"}, {"title": "Player Modeling in Strategy Games"}],
+    ]
+
+    with FakeNotionServer(total_items=0, latency=0.05) as server:
+        with make_api(server) as api:
+            parser = ResearchArticleParser(NotionHelper(api))
+            run_overlapping(parser.update_article_database, "articles", batches)
+
+    assert titles(server, "articles", "Title") == {
+        "Level Generation for Platformer Games": 1,
+        "Player Modeling in Strategy Games": 1
+    }
+
+
+def test_conference_topics_from_other_tasks_are_kept():
+    with FakeNotionServer(total_items=0) as server:
+        with make_api(server) as api:
+            tracker = ConferenceTracker(NotionHelper(api))
+            tracker.update_conference_database("conferences", [{"name": "CoG 2026", "topics": ["game AI"]}])
+            added = tracker.update_conference_database("conferences",
+                                                       [{"name": "CoG 2026", "topics": ["procedural generation"]}])
+            repeated = tracker.update_conference_database("conferences", [{"name": "CoG 2026", "topics": ["game AI"]}])
+
+    (page,) = server.pages.values()
+    assert [item["name"] for item in page["properties"]["Topics"]["multi_select"]] == [
+        "game AI", "procedural generation"
+    ]
+    assert added["updated"] == 1
+    assert repeated["unchanged"] == 1
@@ -0,0 +1,91 @@
+"""
+Test Script for research article relevance scoring
+
+This script checks RelevanceScorer rankings on small hand-made candidate
+sets, including topics with a word that is rare or missing among them.
+"""
+
+import pytest
+
+import relevance
+from relevance import RelevanceScorer
+
+
+def article(title, summary=""):
+    return {"title": title, "summary": summary}
+
+
+CANDIDATES = [
+    article("Imitation Learning for Roguelike Games", "Agents learn to play games from human demonstrations."),
+    article("Level Generation for Platformer Games", "We generate playable levels with diffusion models."),
+    article("Procedural Level Generation with Grammars", "Grammars produce levels for puzzle games."),
+    article("A Detailed Study of Retail Pricing", "Prices and demand in retail markets."),
+    article("Player Modeling in Strategy Games", "We model players from match logs."),
+]
+
+
+def titles(articles, indexes):
+    return [articles[index]["title"] for index in indexes]
+
+
+def test_topic_word_missing_from_every_candidate_matches_nothing():
+    # Every candidate mentions games, but none is about poker
+    assert RelevanceScorer().rank(CANDIDATES, ["poker games"]) == {"poker games": []}
+
+
+def test_articles_need_the_rare_topic_word():
+    candidates = CANDIDATES + [article("Poker Bots for Casino Games", "Bluffing agents for poker.")]
+    ranking = RelevanceScorer().rank(candidates, ["poker games"])
+
+    assert titles(candidates, ranking["poker games"]) == ["Poker Bots for Casino Games"]
+
+
+def test_rare_topic_word_ranks_first_without_excluding_the_rest():
+    ranking = RelevanceScorer().rank(CANDIDATES, ["procedural level generation"])
+    ranked = titles(CANDIDATES, ranking["procedural level generation"])
+
+    assert ranked[0] == "Procedural Level Generation with Grammars"
+    assert "Level Generation for Platformer Games" in ranked
+    assert "Player Modeling in Strategy Games" not in ranked
+
+
+def test_words_match_whole_tokens_only():
+    # "ai" inside "detail" or "retail" is not the word AI
+    scorer = RelevanceScorer()
+    candidates = CANDIDATES + [article("AI Agents for Games")]
+    ranked = titles(candidates, scorer.rank(candidates, ["AI"])["AI"])
+
+    assert ranked == ["AI Agents for Games"]
+
+
+def test_topic_with_no_candidate_words_matches_nothing():
+    assert RelevanceScorer().rank(CANDIDATES, ["quantum chemistry"]) == {"quantum chemistry": []}
+
+
+def test_top_k_keeps_best_articles_per_topic():
+    ranking = RelevanceScorer(top_k=2).rank(CANDIDATES, ["games", "level generation"])
+
+    assert len(ranking["games"]) == 2
+    assert len(ranking["level generation"]) == 2
+
+
+def test_filter_articles_tags_every_matching_topic():
+    kept = RelevanceScorer().filter_articles(CANDIDATES, ["level generation", "games"])
+    by_title = {item["title"]: item["topics"] for item in kept}
+
+    assert by_title["Level Generation for Platformer Games"] == ["level generation", "games"]
+    assert "A Detailed Study of Retail Pricing" not in by_title
+
+
+@pytest.mark.skipif(relevance.np is None, reason="NumPy is not installed")
+def test_array_and_python_scores_agree(monkeypatch):
+    scorer = RelevanceScorer()
+    documents = [scorer._document(item) for item in CANDIDATES]
+    queries = [scorer.tokenize(topic) for topic in ("game AI", "procedural level generation")]
+
+    with_arrays = scorer.score(documents, queries)
+    monkeypatch.setattr(relevance, "np", None)
+    without_arrays = scorer.score(documents, queries)
+
+    for row_arrays, row_python in zip(with_arrays, without_arrays):
+        assert row_arrays == pytest.approx(row_python)
@@ -0,0 +1,94 @@
+"""
+Test Script for Notion request retries
+
+This script exercises NotionAPI retry handling against the local fake Notion
+server, which injects 429 and 502 responses.
+"""
+
+from fake_notion_server import FakeNotionServer
+from notion_integration import NotionAPI, NotionHelper
+from rate_limiter import TokenBucketRateLimiter
+from retry_policy import RetryBudget, RetryPolicy
+
+
+def make_api(server, max_attempts=5, max_retries=50):
+    """Create a NotionAPI pointed at the fake server with fast backoff."""
+    policy = RetryPolicy(max_attempts=max_attempts, base_delay=0.01, max_delay=0.05,
+                         budget=RetryBudget(max_retries))
+    limiter = TokenBucketRateLimiter(rate=1000, burst=100)
+    return NotionAPI("test-token", base_url=server.base_url, rate_limiter=limiter, retry_policy=policy)
+
+
+def test_retries_transient_errors_during_pagination():
+    with FakeNotionServer(total_items=250) as server:
+        with make_api(server) as api:
+            server.inject_faults([502, 429, 502], retry_after=0)
+            items = NotionHelper(api).get_all_database_items("db")
+
+    assert len(items) == 250
+    assert server.requests == 3 + 3
+
+
+def test_does_not_replay_non_idempotent_append_on_5xx():
+    with FakeNotionServer() as server:
+        with make_api(server) as api:
+            server.inject_faults([502])
+            result = api.append_blocks("page", [{"type": "paragraph"}])
+
+    assert result.get("status_code") == 502
+    assert server.requests == 1
+
+
+def test_retries_non_idempotent_create_on_429():
+    with FakeNotionServer() as server:
+        with make_api(server) as api:
+            server.inject_faults([429], retry_after=0)
+            result = api.create_page("db", True, {})
+
+    assert "error" not in result
+    assert server.requests == 2
+
+
+def test_gives_up_after_max_attempts():
+    with FakeNotionServer() as server:
+        with make_api(server, max_attempts=3) as api:
+            server.inject_faults([503] * 5)
+            result = api.read_page("page")
+
+    assert result.get("status_code") == 503
+    assert server.requests == 3
+
+
+def test_retry_budget_is_shared_and_resettable():
+    with FakeNotionServer() as server:
+        with make_api(server, max_retries=2) as api:
+            server.inject_faults([502] * 4)
+            result = api.read_page("page")
+            assert result.get("status_code") == 502
+            assert api.retry_policy.budget.remaining == 0
+
+            api.retry_policy.budget.reset()
+            server.inject_faults([502])
+            result = api.read_page("page")
+
+    assert "error" not in result
+
+
+def test_honours_retry_after():
+    policy = RetryPolicy(max_delay=10)
+    delay = policy.get_retry_delay("GET", 1, status_code=429, headers={"Retry-After": "2"})
+    assert delay == 2.0
+
+
+def test_backoff_is_bounded():
+    policy = RetryPolicy(base_delay=1, max_delay=4)
+    for attempt in range(1, 10):
+        assert 0 <= policy.backoff(attempt) <= 4
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✅ {name}")
+    print("\nTests completed!")
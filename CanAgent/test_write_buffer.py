@@ -0,0 +1,97 @@
+"""
+Test Script for write-behind page updates
+
+This script queues page property updates through NotionAPI's write-behind
+buffer against the local fake Notion server and checks how they are merged
+and flushed.
+"""
+
+import time
+
+from fake_notion_server import FakeNotionServer
+from test_retry_policy import make_api
+
+
+def status(name):
+    return {"Status": {"select": {"name": name}}}
+
+
+def test_patches_to_one_page_are_merged_into_one_write():
+    with FakeNotionServer() as server:
+        with make_api(server) as api:
+            buffer = api.enable_write_behind(max_delay=None)
+            first = api.queue_page_update("page", status("In Progress"))
+            second = api.queue_page_update("page", {"Last Run": {"date": {"start": "2026-01-01"}}})
+            third = api.queue_page_update("page", status("Completed"))
+
+            server.reset_stats()
+            outcomes = api.flush_writes()
+
+    assert server.requests == 1
+    assert buffer.patches_received == 3
+    assert buffer.writes_sent == 1
+    assert first.result() is second.result() is third.result() is outcomes["page"]
+
+    properties = server.pages["page"]["properties"]
+    assert properties["Status"] == status("Completed")["Status"]
+    assert properties["Last Run"] == {"date": {"start": "2026-01-01"}}
+
+
+def test_flushes_once_max_pending_pages_are_waiting():
+    with FakeNotionServer() as server:
+        with make_api(server) as api:
+            api.enable_write_behind(max_pending=3, max_delay=None)
+            futures = [api.queue_page_update(f"page-{i}", status("Completed")) for i in range(3)]
+
+            assert all(future.done() for future in futures)
+            assert not api.write_buffer.has_pending("page-0")
+
+            later = api.queue_page_update("page-3", status("Completed"))
+            assert not later.done()
+
+
+def test_flushes_after_max_delay():
+    with FakeNotionServer() as server:
+        with make_api(server) as api:
+            api.enable_write_behind(max_delay=0.05)
+            future = api.queue_page_update("page", status("Completed"))
+
+            assert not future.done()
+            result = future.result(timeout=5)
+
+            # Nothing is left for the timer or an explicit flush to send again
+            time.sleep(0.1)
+            assert api.write_buffer.writes_sent == 1
+
+    assert "error" not in result
+
+
+def test_reading_a_page_flushes_its_pending_write_first():
+    with FakeNotionServer() as server:
+        with make_api(server) as api:
+            api.enable_write_behind(max_delay=None)
+            page_future = api.queue_page_update("page", status("Completed"))
+            other_future = api.queue_page_update("other", status("Completed"))
+
+            page = api.read_page("page")
+
+            assert page_future.done()
+            assert not other_future.done()
+            assert page["properties"]["Status"] == status("Completed")["Status"]
+
+
+def test_flush_reports_each_page_outcome():
+    with FakeNotionServer() as server:
+        with make_api(server) as api:
+            api.enable_write_behind(max_delay=None)
+            failing = api.queue_page_update("failing", status("Completed"))
+            working = api.queue_page_update("working", status("Completed"))
+
+            # Pages are written in the order they were first queued
+            server.inject_faults([400])
+            outcomes = api.flush_writes()
+
+    assert "error" in outcomes["failing"]
+    assert "error" not in outcomes["working"]
+    assert failing.result() is outcomes["failing"]
+    assert working.result() is outcomes["working"]
@@ -0,0 +1,134 @@
+"""
+TTL Cache
+
+This module provides a thread-safe in-memory cache with per-entry expiry and
+least-recently-used eviction bounded by entry count and total size.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe TTL cache with LRU eviction.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after it is stored
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum combined size of all entries
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (expires_at, size, value)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, size, value = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, size: int = 1):
+        """
+        Store a value, evicting least recently used entries if needed.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Size of the value in bytes, used for the byte bound
+        """
+        if size > self.max_bytes:
+            # Never cache something that would flush the whole cache
+            self.invalidate(key)
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Drop an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                self.invalidations += 1
+                return True
+            return False
+
+    def clear(self):
+        """Drop all entries, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable):
+        """Remove an entry; the caller must hold the lock."""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary of hits, misses, evictions, invalidations, entries and bytes
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes
+            }
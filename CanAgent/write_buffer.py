@@ -0,0 +1,133 @@
+"""
+Write-Behind Buffer
+
+This module batches Notion page property updates. Patches for the same page
+are merged while they wait, and flushed as a single update_page call once the
+buffer is large or old enough, or when the caller flushes explicitly.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+
+class _PendingWrite:
+    """Merged properties waiting to be written to one page."""
+
+    def __init__(self):
+        self.properties = {}
+        self.future = Future()
+        self.patch_count = 0
+
+
+class WriteBehindBuffer:
+    """
+    Coalesces property updates per page and writes them in the background.
+    """
+
+    def __init__(self, api, max_pending: int = 50, max_delay: float = 5.0):
+        """
+        Initialize the write buffer.
+
+        Args:
+            api: NotionAPI instance used to perform the writes
+            max_pending: Flush once this many pages have pending writes
+            max_delay: Flush at most this many seconds after the first pending write
+        """
+        self.api = api
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer = None
+        self.patches_received = 0
+        self.writes_sent = 0
+
+    def update_page(self, page_id: str, properties: Dict) -> Future:
+        """
+        Queue a property update for a page.
+
+        Later patches to the same property replace earlier ones.
+
+        Args:
+            page_id: Notion page ID
+            properties: Properties to update
+
+        Returns:
+            Future resolved with the update_page result once the merged write is sent
+        """
+        with self._lock:
+            pending = self._pending.get(page_id)
+            if pending is None:
+                pending = _PendingWrite()
+                self._pending[page_id] = pending
+
+            pending.properties.update(properties)
+            pending.patch_count += 1
+            self.patches_received += 1
+            future = pending.future
+
+            should_flush = len(self._pending) >= self.max_pending
+            if not should_flush and self._timer is None and self.max_delay is not None:
+                self._timer = threading.Timer(self.max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if should_flush:
+            self.flush()
+
+        return future
+
+    def has_pending(self, page_id: str) -> bool:
+        """Check whether a page has writes waiting in the buffer."""
+        with self._lock:
+            return page_id in self._pending
+
+    def flush(self, page_ids: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """
+        Send pending writes.
+
+        Args:
+            page_ids: Only flush these pages (all pages if None)
+
+        Returns:
+            Dictionary mapping page ID to its update_page result
+        """
+        outcomes = {}
+
+        # Flushes are serialised from taking the batch to sending it, so a
+        # page's older batch can never be written after a newer one
+        with self._flush_lock:
+            with self._lock:
+                if page_ids is None:
+                    batch = self._pending
+                    self._pending = {}
+                else:
+                    batch = {page_id: self._pending.pop(page_id) for page_id in page_ids
+                             if page_id in self._pending}
+
+                if not self._pending and self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+
+            for page_id, pending in batch.items():
+                try:
+                    result = self.api.update_page(page_id, pending.properties)
+                except Exception as e:
+                    result = {"error": str(e)}
+
+                self.writes_sent += 1
+                outcomes[page_id] = result
+                pending.future.set_result(result)
+
+        return outcomes
+
+    def close(self) -> Dict[str, Dict]:
+        """
+        Flush everything and stop the background timer.
+
+        Returns:
+            Dictionary mapping page ID to its update_page result
+        """
+        return self.flush()